@@ -1,17 +1,28 @@
-from fastapi import APIRouter, HTTPException, Query
+from functools import partial
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, Request
 from models.briefing import BriefingListResponse, BriefingResponse
 from services.briefing_service import briefing_storage
+from services.cache_warmer import cache_warmer, WarmTask
+from services.response_cache import cached_json_response, serialized
+from services.cache_service import (
+    cache, CACHE_KEY_BRIEFING_LIST, CACHE_KEY_BRIEFING_DETAIL, CACHE_TAG_BRIEFINGS,
+    CACHE_TTL_BRIEFING_LIST, CACHE_TTL_BRIEFING_DETAIL
+)
+from config import cache_settings
 
 router = APIRouter(prefix="/api/briefings", tags=["briefings"])
 
 
 @router.get("", response_model=BriefingListResponse)
 async def get_briefings(
+    request: Request,
     page: int = Query(default=1, ge=1, description="페이지 번호 (1부터 시작)"),
     limit: int = Query(default=10, ge=1, le=50, description="페이지당 항목 수 (최대 50)")
 ):
     """
-    브리핑 히스토리 조회
+    브리핑 히스토리 조회 (캐시 적용: 10분)
 
     저장된 브리핑 목록을 페이지네이션하여 반환.
     최신순으로 정렬됨.
@@ -21,32 +32,80 @@ async def get_briefings(
     - limit: 페이지당 항목 수 (기본값 10, 최대 50)
     """
     try:
-        result = briefing_storage.get_briefings(page=page, limit=limit)
-        return result
+        return await cached_json_response(
+            cache, request,
+            CACHE_KEY_BRIEFING_LIST.format(version=briefing_storage.version(), page=page, limit=limit),
+            partial(_load_briefings, page, limit), BriefingListResponse,
+            CACHE_TTL_BRIEFING_LIST, tags=[CACHE_TAG_BRIEFINGS]
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"브리핑 조회 실패: {str(e)}")
 
 
 @router.get("/{date}", response_model=BriefingResponse)
-async def get_briefing_by_date(date: str):
+async def get_briefing_by_date(request: Request, date: str):
     """
-    특정 날짜 브리핑 조회
+    특정 날짜 브리핑 조회 (캐시 적용: 1시간, 없는 날짜의 404는 캐시하지 않음)
 
     **파라미터:**
     - date: 날짜 (YYYY-MM-DD 형식, 예: 2025-12-15)
     """
     try:
-        briefing = briefing_storage.get_briefing_by_date(date)
-
-        if briefing is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"'{date}' 날짜의 브리핑을 찾을 수 없습니다"
-            )
-
-        return BriefingResponse(briefing=briefing)
+        return await cached_json_response(
+            cache, request,
+            CACHE_KEY_BRIEFING_DETAIL.format(version=briefing_storage.version(), date=date),
+            partial(_load_briefing, date), BriefingResponse,
+            CACHE_TTL_BRIEFING_DETAIL, tags=[CACHE_TAG_BRIEFINGS],
+            negative_cache=False  # 오늘 브리핑은 배치 스크립트가 나중에 저장
+        )
 
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"브리핑 조회 실패: {str(e)}")
+
+
+async def _load_briefings(page: int, limit: int) -> BriefingListResponse:
+    return briefing_storage.get_briefings(page=page, limit=limit)
+
+
+async def _load_briefing(date: str) -> BriefingResponse:
+    briefing = briefing_storage.get_briefing_by_date(date)
+
+    if briefing is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"'{date}' 날짜의 브리핑을 찾을 수 없습니다"
+        )
+
+    return BriefingResponse(briefing=briefing)
+
+
+# ============================================================
+# 캐시 워밍 세트 (services/cache_warmer.py)
+# ============================================================
+
+@cache_warmer.warm_set("briefings")
+async def _warm_briefings() -> List[WarmTask]:
+    """브리핑 목록 첫 페이지 + 최신 브리핑 상세"""
+    version = briefing_storage.version()
+    latest = briefing_storage.get_briefings(page=1, limit=cache_settings.cache_warmer_briefings)
+
+    tasks = [WarmTask(
+        key=CACHE_KEY_BRIEFING_LIST.format(version=version, page=1, limit=10),
+        factory=serialized(partial(_load_briefings, 1, 10), CACHE_TTL_BRIEFING_LIST),
+        ttl_seconds=CACHE_TTL_BRIEFING_LIST,
+        tags=[CACHE_TAG_BRIEFINGS]
+    )]
+    tasks.extend(
+        WarmTask(
+            key=CACHE_KEY_BRIEFING_DETAIL.format(version=version, date=briefing.date),
+            factory=serialized(
+                partial(_load_briefing, briefing.date), CACHE_TTL_BRIEFING_DETAIL, negative_cache=False
+            ),
+            ttl_seconds=CACHE_TTL_BRIEFING_DETAIL,
+            tags=[CACHE_TAG_BRIEFINGS]
+        )
+        for briefing in latest.briefings
+    )
+    return tasks
@@ -13,10 +13,11 @@ from models.briefing import (
     AIBriefingRequest,
     AIBriefingResponse
 )
-from models.stock import StockDetail, ScoreBreakdown, WhyHotItem
+from models.stock import StockDetail, WhyHotItem
 from models.notification import SlackReportSummary
 from services.briefing_generator import briefing_generator
 from services.screener_service import hot_stock_screener, ScreenerServiceError
+from services.scoring import score_candidates
 from services.news_service import get_news_service, NewsServiceError
 from services.slack_service import get_slack_service
 
@@ -108,7 +109,7 @@ async def generate_briefing(request: GenerateBriefingRequest):
     try:
         # ticker가 비어있으면 스크리너에서 TOP 1 선정
         if not ticker:
-            hot_result = hot_stock_screener.get_daily_hot_stock()
+            hot_result = await hot_stock_screener.aget_daily_hot_stock()
             stock = hot_result.stock
             score = hot_result.score
             why_hot = hot_result.why_hot
@@ -139,9 +140,10 @@ async def generate_briefing(request: GenerateBriefingRequest):
                 currency=price_data.get("currency", "USD")
             )
 
-            # 점수 계산 (간단 버전)
-            score = _calculate_simple_score(stock)
-            why_hot = _generate_why_hot(stock, score)
+            # 점수 계산 (스크리너와 같은 점수 규칙)
+            scored = _score_stock(stock)
+            score = scored["score"]
+            why_hot = _generate_why_hot(scored)
 
         # 뉴스 조회
         news_items = []
@@ -179,69 +181,21 @@ async def generate_briefing(request: GenerateBriefingRequest):
         raise HTTPException(status_code=500, detail=f"브리핑 생성 실패: {str(e)}")
 
 
-def _calculate_simple_score(stock: StockDetail) -> ScoreBreakdown:
-    """간단한 점수 계산"""
-    volume_score = 0
-    price_change_score = 0
-    momentum_score = 5  # 기본값
-    market_cap_score = 0
-
-    # 거래량 점수 (0으로 나누기 방지)
-    if stock.avg_volume and stock.avg_volume > 0 and stock.volume:
-        ratio = stock.volume / stock.avg_volume
-        if ratio >= 3:
-            volume_score = 10
-        elif ratio >= 2:
-            volume_score = 7
-        elif ratio >= 1.5:
-            volume_score = 5
-        elif ratio >= 1.2:
-            volume_score = 3
-
-    # 가격 변동 점수
-    change = abs(stock.change_percent)
-    if change >= 10:
-        price_change_score = 10
-    elif change >= 5:
-        price_change_score = 7
-    elif change >= 3:
-        price_change_score = 5
-    elif change >= 1:
-        price_change_score = 3
-
-    # 시가총액 점수
-    if stock.market_cap:
-        mcap_b = stock.market_cap / 1_000_000_000
-        if 2 <= mcap_b <= 100:
-            market_cap_score = 10
-        elif mcap_b < 2:
-            market_cap_score = 5
-        else:
-            market_cap_score = 7
-
-    return ScoreBreakdown(
-        volume_score=volume_score,
-        price_change_score=price_change_score,
-        momentum_score=momentum_score,
-        market_cap_score=market_cap_score,
-        total=volume_score + price_change_score + momentum_score + market_cap_score
-    )
-
-
-def _generate_why_hot(stock: StockDetail, score: ScoreBreakdown) -> list[WhyHotItem]:
-    """WHY HOT 생성"""
-    items = []
-
-    if score.volume_score >= 7 and stock.avg_volume and stock.avg_volume > 0:
-        ratio = stock.volume / stock.avg_volume
-        items.append(WhyHotItem(icon="✅", message=f"거래량 급증 (평소 대비 {ratio:.2f}배)"))
+def _score_stock(stock: StockDetail) -> dict:
+    """화제 종목 점수 규칙으로 단일 종목 점수 계산 (모멘텀 데이터 없음 → 규칙의 missing_points)"""
+    candidate = {
+        "symbol": stock.symbol,
+        "volume": stock.volume,
+        "avg_volume": stock.avg_volume,
+        "change_percent": stock.change_percent,
+        "market_cap": stock.market_cap,
+    }
+    return score_candidates([candidate])[0]
 
-    if score.price_change_score >= 7:
-        direction = "상승" if stock.change_percent >= 0 else "하락"
-        items.append(WhyHotItem(icon="✅", message=f"당일 {abs(stock.change_percent):.1f}% {direction}"))
 
-    if score.market_cap_score >= 10:
-        items.append(WhyHotItem(icon="✅", message="적정 시가총액 구간 ($2B~$100B)"))
+def _generate_why_hot(candidate: dict) -> list[WhyHotItem]:
+    """WHY HOT 생성 (점수 규칙에서 맞은 구간의 문구)"""
+    items = [WhyHotItem(icon="✅", message=reason) for reason in candidate.get("reasons", [])]
 
     if not items:
         items.append(WhyHotItem(icon="ℹ️", message="일반적인 거래 패턴"))
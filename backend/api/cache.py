@@ -5,6 +5,7 @@
 
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from typing import Optional, List
 
 from models.cache import (
@@ -12,11 +13,14 @@ from models.cache import (
     CacheLayerStats,
     CacheClearRequest,
     CacheClearResponse,
+    CacheInvalidateTagsRequest,
+    CacheInvalidateTagsResponse,
     CacheKeysResponse,
     CacheKeyInfo,
     CacheHealthResponse
 )
 from services.cache_service import cache_manager
+from services.cache_warmer import cache_warmer
 
 router = APIRouter(prefix="/api/cache", tags=["cache"])
 
@@ -33,14 +37,38 @@ async def get_cache_stats():
 
     l1_stats = CacheLayerStats(**stats["l1_stats"])
     l2_stats = CacheLayerStats(**stats["l2_stats"]) if stats["l2_stats"] else None
+    disk_stats = CacheLayerStats(**stats["disk_stats"]) if stats["disk_stats"] else None
 
     return CacheStatsResponse(
         l1_stats=l1_stats,
         l2_stats=l2_stats,
+        disk_stats=disk_stats,
         combined_hit_rate=stats["combined_hit_rate"],
         uptime_seconds=stats["uptime_seconds"],
         last_cleared=datetime.fromisoformat(stats["last_cleared"]) if stats["last_cleared"] else None,
-        cache_backend=stats["cache_backend"]
+        cache_backend=stats["cache_backend"],
+        invalidation_bus=stats["invalidation_bus"],
+        l1_admission=stats["l1_admission"],
+        l1_compression=stats["l1_compression"],
+        latency=stats["latency"],
+        families=stats["families"],
+        negative=stats["negative"]
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_cache_metrics():
+    """
+    캐시 메트릭 (Prometheus 텍스트 포맷)
+
+    - `noname_cache_latency_seconds`: 연산별 지연 히스토그램 (op=l1_get/disk_get/l2_get/l2_set/factory)
+    - `noname_cache_family_*_total`: 키 계열별 히트/미스/저장/축출/저장 바이트
+    - `noname_cache_layer_*_total`: 레이어별 카운터
+    - `noname_cache_l2_circuit_state`: L2 서킷 브레이커 상태
+    """
+    return PlainTextResponse(
+        cache_manager.prometheus_metrics(),
+        media_type="text/plain; version=0.0.4"
     )
 
 
@@ -51,7 +79,7 @@ async def clear_cache(request: CacheClearRequest = None):
 
     - pattern 없이: 전체 캐시 삭제
     - pattern 지정: 패턴에 매칭되는 키만 삭제 (예: stock_*, news_*)
-    - layers: 삭제할 레이어 지정 (l1, l2)
+    - layers: 삭제할 레이어 지정 (l1, l2, disk) - l2 지정 시 디스크 계층도 함께 삭제
 
     **예시 패턴:**
     - `stock_*`: 모든 종목 관련 캐시
@@ -79,6 +107,34 @@ async def clear_cache(request: CacheClearRequest = None):
         raise HTTPException(status_code=500, detail=f"캐시 초기화 실패: {str(e)}")
 
 
+@router.post("/invalidate-tags", response_model=CacheInvalidateTagsResponse)
+async def invalidate_cache_tags(request: CacheInvalidateTagsRequest):
+    """
+    태그 기반 캐시 무효화
+
+    태그가 붙은 모든 키를 L1 + L2에서 삭제 (SCAN 없음).
+
+    **예시 태그:**
+    - `ticker:AAPL`: AAPL 상세/차트/뉴스 캐시
+    - `screener:day_gainers`: 상승 TOP N + 화제 종목 캐시
+    """
+    try:
+        invalidated = await cache_manager.invalidate_tags(
+            request.tags,
+            layers=request.layers
+        )
+
+        return CacheInvalidateTagsResponse(
+            success=True,
+            invalidated_count=invalidated,
+            tags=request.tags,
+            layers=request.layers,
+            timestamp=datetime.now()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"태그 무효화 실패: {str(e)}")
+
+
 @router.delete("/{key_pattern}")
 async def delete_cache_pattern(key_pattern: str):
     """
@@ -150,7 +206,7 @@ async def cache_health():
 
     **상태:**
     - `healthy`: 정상 작동
-    - `degraded`: L2 불가, L1만 작동 (성능 저하)
+    - `degraded`: L2 불가 또는 서킷 open, L1만 작동 (성능 저하)
     - `unhealthy`: 캐시 시스템 오류
     """
     try:
@@ -161,6 +217,7 @@ async def cache_health():
             l1_status=health["l1_status"],
             l2_status=health["l2_status"],
             l2_connected=health["l2_connected"],
+            l2_circuit=health["l2_circuit"],
             message=health["message"]
         )
     except Exception as e:
@@ -173,12 +230,25 @@ async def cache_health():
         )
 
 
+@router.get("/warmer")
+async def get_warmer_status():
+    """
+    캐시 워머 상태 조회
+
+    - `running`: 현재 워밍 사이클 실행 중 여부, `progress`: 실행 중인 세트의 진행 상황
+    - `warm_sets`: 세트별 마지막 실행 결과 (작업 수, 워밍/건너뜀/실패 수, 소요 시간)
+    - `next_run_at`: 다음 사이클 시각 (TTL 만료 전 재워밍 예약 기준, Unix time)
+    """
+    return cache_warmer.status()
+
+
 @router.get("/ttl")
 async def get_ttl_config():
     """
     현재 TTL 설정 조회
 
     각 데이터 타입별 캐시 유효 시간(초) 반환.
+    `ttl_config`는 정규장 기준 기본값, `session.effective`는 현재 NYSE 세션에서 실제 적용되는 TTL.
     """
     from services.cache_service import CacheTTL
 
@@ -208,5 +278,6 @@ async def get_ttl_config():
             "chart_1y": "1년 차트 (1시간)",
             "briefing_detail": "브리핑 상세 (1시간)",
             "briefing_list": "브리핑 목록 (10분)"
-        }
+        },
+        "session": CacheTTL.snapshot()
     }
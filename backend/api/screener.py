@@ -0,0 +1,27 @@
+"""
+스크리너 API 라우터
+화제 종목 점수 규칙 조회 / 다시 읽기
+"""
+
+from fastapi import APIRouter, Query
+
+from models.stock import ScoringRulesResponse
+from services.scoring import scoring_rules
+
+router = APIRouter(prefix="/api/screener", tags=["screener"])
+
+
+@router.get("/rules", response_model=ScoringRulesResponse)
+async def get_scoring_rules(
+    reload: bool = Query(False, description="파일 변경 여부와 무관하게 지금 다시 읽기")
+):
+    """
+    현재 적용 중인 화제 종목 점수 규칙 조회
+
+    스크리너 / 브리핑 생성 / WHY HOT이 공유하는 규칙 (구성 요소별 입력값, 가중치, 구간, 문구).
+    규칙 파일은 주기적으로 변경을 확인해 자동으로 다시 읽음 (`reload_interval_seconds`).
+    새 파일이 잘못됐으면 이전 규칙을 계속 쓰고 `last_error`에 사유 기록.
+    """
+    if reload:
+        scoring_rules.reload(force=True)
+    return scoring_rules.status()
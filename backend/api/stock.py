@@ -1,5 +1,8 @@
+import asyncio
 import os
-from fastapi import APIRouter, HTTPException, Query
+from functools import partial
+from typing import Dict, List
+from fastapi import APIRouter, HTTPException, Query, Request
 from dotenv import load_dotenv
 
 from datetime import datetime
@@ -12,12 +15,15 @@ from models.news import NewsItem
 from services.screener_service import hot_stock_screener, ScreenerServiceError
 from services.news_service import get_news_service, NewsServiceError
 from services.briefing_service import briefing_storage
+from services.cache_warmer import cache_warmer, WarmTask
+from services.response_cache import CachedResponse, cached_json_response, serialized
 from services.cache_service import (
-    cache, CACHE_KEY_TRENDING, CACHE_KEY_TOP_N, CACHE_KEY_NEWS,
-    CACHE_KEY_STOCK_DETAIL, CACHE_KEY_CHART,
-    CACHE_TTL_TRENDING, CACHE_TTL_TOP_N, CACHE_TTL_NEWS,
-    CACHE_TTL_STOCK_DETAIL, CACHE_TTL_CHART
+    cache, CacheTTL, NegativeResult, CACHE_KEY_TRENDING, CACHE_KEY_TOP_N, CACHE_KEY_NEWS,
+    CACHE_KEY_STOCK_DETAIL, CACHE_KEY_CHART, CACHE_KEY_COMPARE_ITEM, CACHE_KEY_SCREENER_SNAPSHOT,
+    CACHE_TAG_TICKER, CACHE_TAG_SCREENER,
+    CACHE_TAG_BRIEFINGS
 )
+from config import cache_settings
 
 # .env 파일 로드
 load_dotenv()
@@ -34,6 +40,7 @@ async def clear_cache():
 
 @router.get("/{ticker}/chart", response_model=ChartDataResponse)
 async def get_stock_chart(
+    request: Request,
     ticker: str,
     period: str = Query(default="5d", description="기간: 5d, 1mo, 3mo, 6mo, 1y")
 ):
@@ -46,58 +53,20 @@ async def get_stock_chart(
     """
     ticker = ticker.upper()
 
-    # 캐시 확인
     cache_key = CACHE_KEY_CHART.format(ticker=ticker, period=period)
-    cached = cache.get(cache_key)
-    if cached:
-        return cached
 
-    try:
-        from yahooquery import Ticker
-
-        yq_ticker = Ticker(ticker)
-
-        # 종목명 조회
-        price_data = yq_ticker.price.get(ticker, {})
-        if isinstance(price_data, str) or not price_data:
-            raise HTTPException(status_code=404, detail=f"종목 '{ticker}'를 찾을 수 없습니다")
-
-        name = price_data.get("shortName") or price_data.get("longName", ticker)
-
-        # 히스토리 데이터 조회
-        history = yq_ticker.history(period=period)
-
-        if history.empty or isinstance(history, str):
-            raise HTTPException(status_code=404, detail="차트 데이터를 가져올 수 없습니다")
-
-        # DataFrame을 리스트로 변환
-        data_points = []
-        for idx, row in history.iterrows():
-            # idx는 (symbol, date) 튜플
-            date_str = idx[1].strftime("%Y-%m-%d") if hasattr(idx[1], 'strftime') else str(idx[1])
-            data_points.append(PriceDataPoint(
-                date=date_str,
-                open=round(row.get("open", 0), 2),
-                high=round(row.get("high", 0), 2),
-                low=round(row.get("low", 0), 2),
-                close=round(row.get("close", 0), 2),
-                volume=int(row.get("volume", 0))
-            ))
+    async def fetch_chart() -> ChartDataResponse:
+        # yahooquery 블로킹 호출은 스레드에서 (이벤트 루프 / single-flight 대기자 차단 방지)
+        return await asyncio.to_thread(_load_chart, ticker, period)
 
-        response = ChartDataResponse(
-            symbol=ticker,
-            name=name,
-            period=period,
-            data=data_points
+    try:
+        # 캐시 조회 (L1 → L2), 미스 시 단일 호출로 생성 (기간별 가변 TTL)
+        return await cached_json_response(
+            cache, request, cache_key, fetch_chart, ChartDataResponse,
+            CacheTTL.get_chart_ttl(period),
+            tags=[CACHE_TAG_TICKER.format(ticker=ticker)]
         )
 
-        # 캐시 저장 (기간별 가변 TTL)
-        from services.cache_service import CacheTTL
-        chart_ttl = CacheTTL.get_chart_ttl(period)
-        cache.set(cache_key, response, chart_ttl)
-
-        return response
-
     except HTTPException:
         raise
     except Exception as e:
@@ -106,6 +75,7 @@ async def get_stock_chart(
 
 @router.get("/trending", response_model=TrendingStockResponse)
 async def get_trending_stock(
+    request: Request,
     type: ScreenerType = Query(
         default=ScreenerType.MOST_ACTIVES,
         description="스크리너 타입: most_actives(거래량), day_gainers(상승), day_losers(하락)"
@@ -123,34 +93,14 @@ async def get_trending_stock(
     - 모멘텀 일관성 (10점): 5일/10일 수익률 양수
     - 시가총액 적정성 (10점): $2B~$100B 구간
     """
-    # 캐시 확인
-    cached = cache.get(CACHE_KEY_TRENDING)
-    if cached:
-        return cached
-
-    try:
+    async def fetch_trending() -> TrendingStockResponse:
         # 1. 화제 종목 조회
-        hot_result = hot_stock_screener.get_daily_hot_stock()
+        hot_result = await hot_stock_screener.aget_daily_hot_stock()
 
         # 2. 뉴스 조회 (캐시 적용)
-        news_cache_key = CACHE_KEY_NEWS.format(ticker=hot_result.stock.symbol)
-        news_items = cache.get(news_cache_key)
-
-        if news_items is None:
-            news_items = []
-            try:
-                news_service = get_news_service()
-                news_result = news_service.search_stock_news(
-                    ticker=hot_result.stock.symbol,
-                    num_results=5,
-                    hours=24
-                )
-                news_items = news_result.news
-                cache.set(news_cache_key, news_items, CACHE_TTL_NEWS)
-            except (NewsServiceError, Exception):
-                pass
+        news_items = await _get_cached_news(hot_result.stock.symbol)
 
-        # 3. 브리핑 자동 저장
+        # 3. 브리핑 자동 저장 (캐시된 브리핑 목록/상세 무효화)
         try:
             briefing_storage.save_briefing(
                 stock=hot_result.stock,
@@ -158,20 +108,24 @@ async def get_trending_stock(
                 why_hot=hot_result.why_hot,
                 news=news_items
             )
+            await cache.invalidate_tags([CACHE_TAG_BRIEFINGS])
         except Exception:
             pass
 
-        response = TrendingStockResponse(
+        return TrendingStockResponse(
             stock=hot_result.stock,
             score=hot_result.score,
             why_hot=hot_result.why_hot,
             news=news_items
         )
 
-        # 캐시 저장
-        cache.set(CACHE_KEY_TRENDING, response, CACHE_TTL_TRENDING)
-
-        return response
+    try:
+        # 화제 종목은 모든 스크리너 결과에서 선정되므로 전체 스크리너 태그 부여
+        return await cached_json_response(
+            cache, request, CACHE_KEY_TRENDING, fetch_trending, TrendingStockResponse,
+            CacheTTL.for_data("trending"),
+            tags=[CACHE_TAG_SCREENER.format(type=t.value) for t in ScreenerType]
+        )
 
     except ScreenerServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -181,6 +135,7 @@ async def get_trending_stock(
 
 @router.get("/trending/top", response_model=TopNStocksResponse)
 async def get_top_n_stocks(
+    request: Request,
     type: ScreenerType = Query(
         default=ScreenerType.MOST_ACTIVES,
         description="스크리너 타입: most_actives(거래량), day_gainers(상승), day_losers(하락)"
@@ -204,22 +159,20 @@ async def get_top_n_stocks(
     **응답:**
     - 각 종목의 순위, 상세 정보, 점수 포함
     """
-    # 캐시 확인
     cache_key = CACHE_KEY_TOP_N.format(type=type.value, count=count)
-    cached = cache.get(cache_key)
-    if cached:
-        return cached
 
-    try:
-        result = hot_stock_screener.get_top_n_stocks(
+    async def fetch_top_n() -> TopNStocksResponse:
+        return await hot_stock_screener.aget_top_n_stocks(
             screener_type=type,
             count=count
         )
 
-        # 캐시 저장
-        cache.set(cache_key, result, CACHE_TTL_TOP_N)
-
-        return result
+    try:
+        return await cached_json_response(
+            cache, request, cache_key, fetch_top_n, TopNStocksResponse,
+            CacheTTL.for_data("top_n"),
+            tags=[CACHE_TAG_SCREENER.format(type=type.value)]
+        )
 
     except ScreenerServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -259,38 +212,41 @@ async def compare_stocks(request: CompareRequest):
             detail="최소 2개 이상의 종목이 필요합니다"
         )
 
+    cache_keys = {ticker: CACHE_KEY_COMPARE_ITEM.format(ticker=ticker) for ticker in tickers}
+
     try:
-        from yahooquery import Ticker
-
-        # 종목 정보 조회
-        yq_tickers = Ticker(tickers)
-        price_data = yq_tickers.price
-        summary_data = yq_tickers.summary_detail
-
-        stocks = []
-        for ticker in tickers:
-            p_data = price_data.get(ticker, {})
-            s_data = summary_data.get(ticker, {})
-
-            if isinstance(p_data, str) or not p_data:
-                continue
-
-            volume = p_data.get("regularMarketVolume", 0)
-            market_cap = p_data.get("marketCap")
-
-            stocks.append(CompareStockItem(
-                symbol=ticker,
-                name=p_data.get("shortName") or p_data.get("longName", ticker),
-                price=p_data.get("regularMarketPrice", 0),
-                change=p_data.get("regularMarketChange", 0),
-                change_percent=(p_data.get("regularMarketChangePercent", 0) * 100)
-                    if p_data.get("regularMarketChangePercent") else 0,
-                volume=volume,
-                volume_formatted=_format_number(volume),
-                market_cap=market_cap,
-                market_cap_formatted=_format_market_cap(market_cap),
-                pe_ratio=s_data.get("trailingPE") if isinstance(s_data, dict) else None
-            ))
+        # 캐시된 종목은 한 번에 조회 (L1 → L2 MGET), 미스 종목만 yahooquery 1회 호출
+        # 부정 캐시된 종목(없는 심볼)은 재조회하지 않고 결과에서 제외
+        cached = await cache.aget_many(list(cache_keys.values()))
+        items = {ticker: cached[key] for ticker, key in cache_keys.items() if key in cached}
+        missing = [ticker for ticker in tickers if ticker not in items]
+
+        if missing:
+            fetched = await asyncio.to_thread(_fetch_compare_items, missing)
+            items.update(fetched)
+            tags = {
+                cache_keys[ticker]: [CACHE_TAG_TICKER.format(ticker=ticker)]
+                for ticker in missing
+            }
+            if fetched:
+                await cache.aset_many(
+                    {cache_keys[ticker]: item for ticker, item in fetched.items()},
+                    CacheTTL.for_data("stock_detail"),
+                    tags=tags
+                )
+            unknown = [ticker for ticker in missing if ticker not in fetched]
+            if unknown:
+                negative = NegativeResult(reason="종목을 찾을 수 없습니다")
+                await cache.aset_many(
+                    {cache_keys[ticker]: negative for ticker in unknown},
+                    cache.negative_ttl(negative),
+                    tags=tags
+                )
+
+        stocks = [
+            items[ticker] for ticker in tickers
+            if ticker in items and not isinstance(items[ticker], NegativeResult)
+        ]
 
         if len(stocks) < 2:
             raise HTTPException(
@@ -318,6 +274,161 @@ async def compare_stocks(request: CompareRequest):
         raise HTTPException(status_code=500, detail=f"비교 실패: {str(e)}")
 
 
+def _fetch_compare_items(tickers: List[str]) -> Dict[str, CompareStockItem]:
+    """yahooquery 1회 호출로 비교 항목 생성 (조회 실패 종목은 제외)"""
+    from yahooquery import Ticker
+
+    # 종목 정보 조회
+    yq_tickers = Ticker(tickers)
+    price_data = yq_tickers.price
+    summary_data = yq_tickers.summary_detail
+
+    items = {}
+    for ticker in tickers:
+        p_data = price_data.get(ticker, {})
+        s_data = summary_data.get(ticker, {})
+
+        if isinstance(p_data, str) or not p_data:
+            continue
+
+        volume = p_data.get("regularMarketVolume", 0)
+        market_cap = p_data.get("marketCap")
+
+        items[ticker] = CompareStockItem(
+            symbol=ticker,
+            name=p_data.get("shortName") or p_data.get("longName", ticker),
+            price=p_data.get("regularMarketPrice", 0),
+            change=p_data.get("regularMarketChange", 0),
+            change_percent=(p_data.get("regularMarketChangePercent", 0) * 100)
+                if p_data.get("regularMarketChangePercent") else 0,
+            volume=volume,
+            volume_formatted=_format_number(volume),
+            market_cap=market_cap,
+            market_cap_formatted=_format_market_cap(market_cap),
+            pe_ratio=s_data.get("trailingPE") if isinstance(s_data, dict) else None
+        )
+
+    return items
+
+
+async def _get_cached_news(ticker: str) -> List[NewsItem]:
+    """
+    종목 뉴스 조회 (캐시 적용, 없거나 실패하면 빈 리스트)
+    빈 결과 / Exa API 에러는 부정 캐시 → 짧은 TTL 동안 API 재호출 없음
+    """
+    async def fetch_news():
+        try:
+            news_service = get_news_service()
+            news_result = await asyncio.to_thread(
+                news_service.search_stock_news,
+                ticker=ticker,
+                num_results=5,
+                hours=24
+            )
+        except NewsServiceError as e:
+            return NegativeResult(reason=str(e), status_code=502, upstream_error=True)
+        return news_result.news or NegativeResult(reason="뉴스 없음")
+
+    try:
+        news = await cache.get_or_set(
+            CACHE_KEY_NEWS.format(ticker=ticker), fetch_news, CacheTTL.for_data("news"),
+            tags=[CACHE_TAG_TICKER.format(ticker=ticker)]
+        )
+    except Exception:
+        return []
+    return [] if isinstance(news, NegativeResult) else news
+
+
+def _load_chart(ticker: str, period: str) -> ChartDataResponse:
+    """yahooquery로 차트 데이터 생성 (종목/데이터가 없으면 404)"""
+    from yahooquery import Ticker
+
+    yq_ticker = Ticker(ticker)
+
+    # 종목명 조회
+    price_data = yq_ticker.price.get(ticker, {})
+    if isinstance(price_data, str) or not price_data:
+        raise HTTPException(status_code=404, detail=f"종목 '{ticker}'를 찾을 수 없습니다")
+
+    name = price_data.get("shortName") or price_data.get("longName", ticker)
+
+    # 히스토리 데이터 조회
+    history = yq_ticker.history(period=period)
+
+    if history.empty or isinstance(history, str):
+        raise HTTPException(status_code=404, detail="차트 데이터를 가져올 수 없습니다")
+
+    # DataFrame을 리스트로 변환
+    data_points = []
+    for idx, row in history.iterrows():
+        # idx는 (symbol, date) 튜플
+        date_str = idx[1].strftime("%Y-%m-%d") if hasattr(idx[1], 'strftime') else str(idx[1])
+        data_points.append(PriceDataPoint(
+            date=date_str,
+            open=round(row.get("open", 0), 2),
+            high=round(row.get("high", 0), 2),
+            low=round(row.get("low", 0), 2),
+            close=round(row.get("close", 0), 2),
+            volume=int(row.get("volume", 0))
+        ))
+
+    return ChartDataResponse(
+        symbol=ticker,
+        name=name,
+        period=period,
+        data=data_points
+    )
+
+
+def _load_stock(ticker: str) -> StockDetail:
+    """yahooquery로 종목 정보 생성 (종목이 없으면 404)"""
+    from yahooquery import Ticker
+
+    yq_ticker = Ticker(ticker)
+    price_data = yq_ticker.price.get(ticker, {})
+    summary_data = yq_ticker.summary_detail.get(ticker, {})
+
+    # 에러 체크
+    if isinstance(price_data, str) or not price_data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목 '{ticker}'를 찾을 수 없습니다"
+        )
+
+    # StockDetail 생성
+    return StockDetail(
+        symbol=ticker,
+        name=price_data.get("shortName") or price_data.get("longName", ticker),
+        price=price_data.get("regularMarketPrice", 0),
+        change=price_data.get("regularMarketChange", 0),
+        change_percent=price_data.get("regularMarketChangePercent", 0) * 100
+            if price_data.get("regularMarketChangePercent") else 0,
+        volume=price_data.get("regularMarketVolume", 0),
+        avg_volume=summary_data.get("averageVolume") if isinstance(summary_data, dict) else None,
+        market_cap=price_data.get("marketCap"),
+        pe_ratio=summary_data.get("trailingPE") if isinstance(summary_data, dict) else None,
+        fifty_two_week_high=summary_data.get("fiftyTwoWeekHigh") if isinstance(summary_data, dict) else None,
+        fifty_two_week_low=summary_data.get("fiftyTwoWeekLow") if isinstance(summary_data, dict) else None,
+        currency=price_data.get("currency", "USD")
+    )
+
+
+async def _build_stock_detail(ticker: str) -> StockDetailResponse:
+    """
+    종목 상세 응답 생성 (종목 정보 + 캐시된 뉴스)
+    yahooquery 호출은 스레드에서 실행 (요청 경로 / 캐시 워머 공통, 이벤트 루프 차단 없음)
+    """
+    stock = await asyncio.to_thread(_load_stock, ticker)
+
+    # 뉴스 조회 (캐시 적용)
+    news_items = await _get_cached_news(ticker)
+
+    return StockDetailResponse(
+        stock=stock,
+        news=news_items
+    )
+
+
 def _format_number(num: int) -> str:
     """숫자를 K/M/B 형식으로 포맷"""
     if num >= 1_000_000_000:
@@ -343,7 +454,7 @@ def _format_market_cap(market_cap: float | None) -> str:
 
 
 @router.get("/{ticker}", response_model=StockDetailResponse)
-async def get_stock_detail(ticker: str):
+async def get_stock_detail(request: Request, ticker: str):
     """
     종목 상세 정보 조회 (캐시 적용: 5분)
 
@@ -354,73 +465,101 @@ async def get_stock_detail(ticker: str):
     """
     ticker = ticker.upper()
 
-    # 캐시 확인
     cache_key = CACHE_KEY_STOCK_DETAIL.format(ticker=ticker)
-    cached = cache.get(cache_key)
-    if cached:
-        return cached
-
-    try:
-        from yahooquery import Ticker
-
-        # 1. 종목 정보 조회
-        yq_ticker = Ticker(ticker)
-        price_data = yq_ticker.price.get(ticker, {})
-        summary_data = yq_ticker.summary_detail.get(ticker, {})
-
-        # 에러 체크
-        if isinstance(price_data, str) or not price_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"종목 '{ticker}'를 찾을 수 없습니다"
-            )
 
-        # StockDetail 생성
-        stock = StockDetail(
-            symbol=ticker,
-            name=price_data.get("shortName") or price_data.get("longName", ticker),
-            price=price_data.get("regularMarketPrice", 0),
-            change=price_data.get("regularMarketChange", 0),
-            change_percent=price_data.get("regularMarketChangePercent", 0) * 100
-                if price_data.get("regularMarketChangePercent") else 0,
-            volume=price_data.get("regularMarketVolume", 0),
-            avg_volume=summary_data.get("averageVolume") if isinstance(summary_data, dict) else None,
-            market_cap=price_data.get("marketCap"),
-            pe_ratio=summary_data.get("trailingPE") if isinstance(summary_data, dict) else None,
-            fifty_two_week_high=summary_data.get("fiftyTwoWeekHigh") if isinstance(summary_data, dict) else None,
-            fifty_two_week_low=summary_data.get("fiftyTwoWeekLow") if isinstance(summary_data, dict) else None,
-            currency=price_data.get("currency", "USD")
-        )
-
-        # 2. 뉴스 조회 (캐시 적용)
-        news_cache_key = CACHE_KEY_NEWS.format(ticker=ticker)
-        news_items = cache.get(news_cache_key)
-
-        if news_items is None:
-            news_items = []
-            try:
-                news_service = get_news_service()
-                news_result = news_service.search_stock_news(
-                    ticker=ticker,
-                    num_results=5,
-                    hours=24
-                )
-                news_items = news_result.news
-                cache.set(news_cache_key, news_items, CACHE_TTL_NEWS)
-            except (NewsServiceError, Exception):
-                pass
+    async def fetch_detail() -> StockDetailResponse:
+        return await _build_stock_detail(ticker)
 
-        response = StockDetailResponse(
-            stock=stock,
-            news=news_items
+    try:
+        return await cached_json_response(
+            cache, request, cache_key, fetch_detail, StockDetailResponse,
+            CacheTTL.for_data("stock_detail"),
+            tags=[CACHE_TAG_TICKER.format(ticker=ticker)]
         )
 
-        # 캐시 저장
-        cache.set(cache_key, response, CACHE_TTL_STOCK_DETAIL)
-
-        return response
-
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+# ============================================================
+# 캐시 워밍 세트 (services/cache_warmer.py, 등록 순서대로 실행)
+# ============================================================
+
+CHART_PERIODS = ("5d", "1mo", "3mo", "6mo", "1y")
+
+
+@cache_warmer.warm_set("screener")
+async def _warm_screener_snapshot() -> List[WarmTask]:
+    """trending / TOP N 공용 스크리너 스냅샷 (Yahoo 스크리너 호출은 이 작업 1회뿐)"""
+    return [WarmTask(
+        key=CACHE_KEY_SCREENER_SNAPSHOT,
+        factory=hot_stock_screener.abuild_snapshot,
+        ttl_seconds=CacheTTL.for_data("top_n"),
+        tags=hot_stock_screener.snapshot_tags()
+    )]
+
+
+@cache_warmer.warm_set("top_n")
+async def _warm_top_n() -> List[WarmTask]:
+    """스크리너 타입별 TOP N (screener 세트가 갱신한 스냅샷을 잘라서 생성)"""
+    count = cache_settings.cache_warmer_top_n_count
+    ttl = CacheTTL.for_data("top_n")
+    return [
+        WarmTask(
+            key=CACHE_KEY_TOP_N.format(type=screener_type.value, count=count),
+            factory=serialized(
+                partial(
+                    hot_stock_screener.aget_top_n_stocks,
+                    screener_type=screener_type, count=count
+                ),
+                ttl
+            ),
+            ttl_seconds=ttl,
+            tags=[CACHE_TAG_SCREENER.format(type=screener_type.value)]
+        )
+        for screener_type in ScreenerType
+    ]
+
+
+@cache_warmer.warm_set("stocks")
+async def _warm_stocks() -> List[WarmTask]:
+    """TOP N 상위 종목의 상세 + 모든 기간 차트 (top_n 세트가 캐시한 결과에서 종목 선택)"""
+    detail_ttl = CacheTTL.for_data("stock_detail")
+    tasks = []
+    for ticker in await _warm_symbols():
+        tags = [CACHE_TAG_TICKER.format(ticker=ticker)]
+        tasks.append(WarmTask(
+            key=CACHE_KEY_STOCK_DETAIL.format(ticker=ticker),
+            factory=serialized(partial(_build_stock_detail, ticker), detail_ttl),
+            ttl_seconds=detail_ttl,
+            tags=tags
+        ))
+        for period in CHART_PERIODS:
+            ttl = CacheTTL.get_chart_ttl(period)
+            tasks.append(WarmTask(
+                key=CACHE_KEY_CHART.format(ticker=ticker, period=period),
+                factory=serialized(partial(asyncio.to_thread, _load_chart, ticker, period), ttl),
+                ttl_seconds=ttl,
+                tags=tags
+            ))
+    return tasks
+
+
+async def _warm_symbols() -> List[str]:
+    """캐시된 타입별 TOP N에서 상위 종목 심볼 (중복 제거, 순서 유지)"""
+    count = cache_settings.cache_warmer_top_n_count
+    per_type = cache_settings.cache_warmer_symbols_per_type
+
+    symbols = []
+    for screener_type in ScreenerType:
+        cached = await cache.aget(CACHE_KEY_TOP_N.format(type=screener_type.value, count=count))
+        if cached is None or isinstance(cached, NegativeResult):
+            continue
+        top_n = CachedResponse.coerce(cached, TopNStocksResponse, CacheTTL.for_data("top_n"))
+        symbols.extend(
+            ranked.stock.symbol
+            for ranked in top_n.parse(TopNStocksResponse).stocks[:per_type]
+        )
+    return list(dict.fromkeys(symbols))
@@ -38,23 +38,101 @@ class RateLimitSettings(BaseSettings):
 class CacheSettings(BaseSettings):
     """캐시 설정"""
 
-    # 백엔드 선택: memory, redis, layered
+    # 백엔드 선택: memory, redis, layered, shared (워커 간 공유 메모리 L1)
     cache_backend: str = "memory"
 
+    # 공유 메모리 L1 설정 (shared 모드) - 경로 미지정 시 /dev/shm/noname-l1-cache
+    cache_shared_path: Optional[str] = None
+    cache_shared_slot_size: int = 64 * 1024  # 슬롯당 최대 바이트 (키 + 태그 + 값)
+
     # Redis 설정
     cache_redis_url: str = "redis://localhost:6379/0"
     cache_redis_max_connections: int = 10
     cache_redis_socket_timeout: float = 5.0
     cache_redis_retry_on_timeout: bool = True
 
+    # L2 서킷 브레이커 (최근 window 동안 실패율 / 느린 호출 비율이 임계치 이상이면 open)
+    cache_breaker_failure_rate: float = 0.5
+    cache_breaker_slow_call_seconds: float = 0.25
+    cache_breaker_slow_call_rate: float = 0.5
+    cache_breaker_window_seconds: float = 30.0
+    cache_breaker_min_calls: int = 10  # window 내 최소 호출 수 (이보다 적으면 판정 안 함)
+    cache_breaker_open_seconds: float = 15.0  # open 유지 시간 → half-open 시험 호출
+    cache_breaker_half_open_calls: int = 3
+
+    # 직렬화 코덱: pickle, orjson, msgpack / 압축: none, zstd
+    cache_codec: str = "pickle"
+    cache_compression: Optional[str] = None
+    cache_compression_min_bytes: int = 1024  # 이 크기 이상만 압축
+
+    # 디스크 계층 (L1과 L2 사이, 재시작 후 warm start / Redis 장애 시 폴백)
+    cache_enable_disk_tier: bool = False
+    cache_disk_path: Optional[str] = None  # 미지정 시 backend/data/cache.sqlite3
+    cache_disk_max_entries: int = 10000
+    cache_disk_preload_keys: int = 200  # 시작 시 L1에 미리 적재할 인기 키 수
+
     # L1 메모리 캐시 설정
     cache_l1_max_entries: int = 1000
     cache_l1_max_memory_mb: int = 100
 
+    # L1 입장 정책: lru (기본), tinylfu (W-TinyLFU, window 비율은 max_entries 대비)
+    cache_l1_admission: str = "lru"
+    cache_l1_window_ratio: float = 0.01
+
+    # L1 압축: 직렬화 크기가 이 값 이상인 엔트리는 zstd 압축 보관 (0이면 사용 안 함)
+    cache_l1_compress_min_bytes: int = 16384
+
+    # L1 만료 엔트리 백그라운드 정리 (주기, 1회 슬라이스 크기)
+    cache_janitor_interval_seconds: float = 5.0
+    cache_janitor_batch_size: int = 500
+
     # 기능 플래그
     cache_enable_stampede_prevention: bool = True
     cache_enable_stats: bool = True
 
+    # Stale-While-Revalidate: soft 만료 후 TTL * ratio 동안 stale 값 반환 + 백그라운드 갱신
+    cache_enable_swr: bool = False
+    cache_swr_stale_ratio: float = 1.0
+
+    # 확률적 조기 갱신 (XFetch): 만료 직전 갱신을 분산, beta가 클수록 더 일찍 갱신
+    cache_enable_early_refresh: bool = False
+    cache_early_refresh_beta: float = 1.0
+
+    # 워커 간 L1 무효화 (layered 모드): Redis pub/sub 채널, 구독 중 L1 TTL = L2 TTL * ratio
+    cache_enable_invalidation_bus: bool = False
+    cache_invalidation_channel: str = "cache:invalidate"
+    cache_bus_l1_ttl_ratio: float = 1.0
+
+    # 부정 캐시 (없는 종목 / 빈 결과를 짧게 캐시해 업스트림 호출 절약)
+    cache_negative_ttl_seconds: int = 300
+    cache_negative_error_ttl_seconds: int = 30  # 업스트림 실패 (뉴스 API 에러 등)
+
+    # 세션별 TTL (NYSE 프리마켓/정규장/애프터마켓/야간/휴장에 따라 CacheTTL.for_data 조정)
+    cache_session_aware_ttl: bool = True
+
+    # 캐시 워머 (서비스 계층 직접 호출, TTL 만료 전 재워밍)
+    cache_warmer_enabled: bool = True
+    cache_warmer_concurrency: int = 4  # 동시 워밍 작업 수
+    cache_warmer_rewarm_lead_seconds: float = 30.0  # TTL 만료 몇 초 전에 다시 계산할지
+    cache_warmer_top_n_count: int = 5  # 스크리너 타입별 TOP N 개수
+    cache_warmer_symbols_per_type: int = 3  # 타입별 상위 종목의 상세 + 전체 기간 차트
+    cache_warmer_briefings: int = 5  # 최신 브리핑 상세 수 (+ 목록 첫 페이지)
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
+
+
+class ScoringSettings(BaseSettings):
+    """화제 종목 점수 규칙 설정"""
+
+    # 점수 규칙 파일 (JSON, .yaml/.yml은 PyYAML 필요) - 미지정 시 backend/scoring_rules.json
+    scoring_rules_path: Optional[str] = None
+
+    # 핫 리로드: 이 주기(초)마다 파일 변경 확인 후 다시 컴파일 (0이면 시작 시 한 번만 로드)
+    scoring_rules_reload_seconds: float = 5.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -83,3 +161,4 @@ class AppSettings(BaseSettings):
 cache_settings = CacheSettings()
 app_settings = AppSettings()
 rate_limit_settings = RateLimitSettings()
+scoring_settings = ScoringSettings()
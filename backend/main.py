@@ -1,6 +1,4 @@
-import asyncio
 import logging
-import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
@@ -12,10 +10,14 @@ from api.briefing import router as briefing_router
 from api.briefing_generate import router as briefing_generate_router
 from api.cache import router as cache_router
 from api.notifications import router as notifications_router
-from services.cache_service import cache_manager
+from api.screener import router as screener_router
+from services.cache_service import cache_manager, CacheTTL
+from services.cache_warmer import cache_warmer
+from services.screener_service import hot_stock_screener
+from services.scoring import scoring_rules
 from services.rate_limit_service import rate_limit_service
 from middleware.rate_limit import RateLimitMiddleware
-from config import cache_settings, rate_limit_settings, app_settings
+from config import cache_settings, rate_limit_settings, app_settings, scoring_settings
 
 # Configure logging
 logging.basicConfig(
@@ -24,9 +26,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Backend server URL from environment or default
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
-
 # .env 파일 로드 (프로젝트 루트와 backend 디렉토리 모두 확인)
 project_root = Path(__file__).parent.parent
 env_paths = [
@@ -39,59 +38,60 @@ for env_path in env_paths:
         break
 
 
-async def preload_cache():
-    """서버 시작 시 캐시 미리 로드 (백그라운드)"""
-    import httpx
-    await asyncio.sleep(2)  # 서버 시작 대기
-
-    try:
-        async with httpx.AsyncClient() as client:
-            logger.info("Cache preloading started...")
-
-            # 1. TOP 3 종목 미리 로드
-            response = await client.get(
-                f"{BACKEND_URL}/api/stocks/trending/top?type=most_actives&count=3",
-                timeout=120.0
-            )
-            logger.info("TOP 3 cache loaded successfully")
-
-            # 2. TOP 3 종목의 상세 정보 + 차트 미리 로드
-            if response.status_code == 200:
-                data = response.json()
-                symbols = [stock["stock"]["symbol"] for stock in data.get("stocks", [])]
-
-                for symbol in symbols:
-                    try:
-                        # 종목 상세 프리로드
-                        await client.get(
-                            f"{BACKEND_URL}/api/stocks/{symbol}",
-                            timeout=30.0
-                        )
-                        # 차트 데이터 프리로드
-                        await client.get(
-                            f"{BACKEND_URL}/api/stocks/{symbol}/chart?period=5d",
-                            timeout=30.0
-                        )
-                        logger.info(f"{symbol} detail/chart cache loaded")
-                    except Exception:
-                        pass
-
-            logger.info("Cache preloading completed!")
-
-    except Exception as e:
-        logger.warning(f"Cache preloading failed (service still operational): {e}")
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 생명주기 관리"""
+    # 시작 시: 세션별 TTL 정책 설정
+    CacheTTL.session_aware = cache_settings.cache_session_aware_ttl
+
+    # 시작 시: 화제 종목 점수 규칙 로드 (이후 파일 변경 시 핫 리로드)
+    scoring_rules.configure(
+        path=scoring_settings.scoring_rules_path,
+        reload_interval=scoring_settings.scoring_rules_reload_seconds
+    )
+    scoring_rules.current()
+
     # 시작 시: 캐시 매니저 초기화
     logger.info(f"Initializing cache manager (backend={cache_settings.cache_backend})...")
     await cache_manager.initialize(
         backend=cache_settings.cache_backend,
         redis_url=cache_settings.cache_redis_url,
         max_entries=cache_settings.cache_l1_max_entries,
-        max_memory_mb=cache_settings.cache_l1_max_memory_mb
+        max_memory_mb=cache_settings.cache_l1_max_memory_mb,
+        l1_admission=cache_settings.cache_l1_admission,
+        l1_window_ratio=cache_settings.cache_l1_window_ratio,
+        l1_compress_min_bytes=cache_settings.cache_l1_compress_min_bytes,
+        enable_swr=cache_settings.cache_enable_swr,
+        swr_stale_ratio=cache_settings.cache_swr_stale_ratio,
+        enable_early_refresh=cache_settings.cache_enable_early_refresh,
+        early_refresh_beta=cache_settings.cache_early_refresh_beta,
+        codec=cache_settings.cache_codec,
+        compression=cache_settings.cache_compression,
+        compression_min_bytes=cache_settings.cache_compression_min_bytes,
+        enable_invalidation_bus=cache_settings.cache_enable_invalidation_bus,
+        invalidation_channel=cache_settings.cache_invalidation_channel,
+        bus_l1_ttl_ratio=cache_settings.cache_bus_l1_ttl_ratio,
+        shared_path=cache_settings.cache_shared_path,
+        shared_slot_size=cache_settings.cache_shared_slot_size,
+        enable_disk_tier=cache_settings.cache_enable_disk_tier,
+        disk_path=cache_settings.cache_disk_path,
+        disk_max_entries=cache_settings.cache_disk_max_entries,
+        disk_preload_keys=cache_settings.cache_disk_preload_keys,
+        breaker_settings={
+            "failure_rate_threshold": cache_settings.cache_breaker_failure_rate,
+            "slow_call_seconds": cache_settings.cache_breaker_slow_call_seconds,
+            "slow_call_rate_threshold": cache_settings.cache_breaker_slow_call_rate,
+            "window_seconds": cache_settings.cache_breaker_window_seconds,
+            "min_calls": cache_settings.cache_breaker_min_calls,
+            "open_seconds": cache_settings.cache_breaker_open_seconds,
+            "half_open_max_calls": cache_settings.cache_breaker_half_open_calls
+        },
+        negative_ttl=cache_settings.cache_negative_ttl_seconds,
+        negative_error_ttl=cache_settings.cache_negative_error_ttl_seconds
+    )
+    cache_manager.start_janitor(
+        interval_seconds=cache_settings.cache_janitor_interval_seconds,
+        batch_size=cache_settings.cache_janitor_batch_size
     )
 
     # Rate Limit 서비스 초기화
@@ -106,8 +106,12 @@ async def lifespan(app: FastAPI):
             f"{rate_limit_settings.rate_limit_requests}req/{rate_limit_settings.rate_limit_window_seconds}s)"
         )
 
-    # 백그라운드에서 캐시 프리로딩
-    asyncio.create_task(preload_cache())
+    # 캐시 워머: 서비스 계층 직접 호출로 프리로딩 + TTL 만료 전 재워밍 (백그라운드)
+    if cache_settings.cache_warmer_enabled:
+        cache_warmer.start(
+            concurrency=cache_settings.cache_warmer_concurrency,
+            rewarm_lead_seconds=cache_settings.cache_warmer_rewarm_lead_seconds
+        )
 
     yield
 
@@ -116,6 +120,10 @@ async def lifespan(app: FastAPI):
         logger.info("Shutting down Rate Limit service...")
         await rate_limit_service.shutdown()
 
+    # 종료 시: 캐시 워머 중지
+    await cache_warmer.stop()
+    hot_stock_screener.shutdown()
+
     # 종료 시: 캐시 매니저 정리
     logger.info("Shutting down cache manager...")
     await cache_manager.shutdown()
@@ -164,3 +172,4 @@ app.include_router(briefing_router)
 app.include_router(briefing_generate_router)
 app.include_router(cache_router)
 app.include_router(notifications_router)
+app.include_router(screener_router)
@@ -10,7 +10,7 @@ from datetime import datetime
 
 class CacheLayerStats(BaseModel):
     """캐시 레이어별 통계"""
-    backend: str = Field(..., description="캐시 백엔드 타입 (memory/redis)")
+    backend: str = Field(..., description="캐시 백엔드 타입 (memory/shared/disk/redis)")
     hits: int = Field(default=0, description="캐시 히트 수")
     misses: int = Field(default=0, description="캐시 미스 수")
     sets: int = Field(default=0, description="캐시 저장 수")
@@ -26,16 +26,38 @@ class CacheStatsResponse(BaseModel):
     """캐시 통계 응답"""
     l1_stats: CacheLayerStats = Field(..., description="L1 (메모리) 캐시 통계")
     l2_stats: Optional[CacheLayerStats] = Field(default=None, description="L2 (Redis) 캐시 통계")
+    disk_stats: Optional[CacheLayerStats] = Field(default=None, description="디스크 계층 (SQLite) 통계")
     combined_hit_rate: float = Field(..., description="전체 히트율 (%)")
     uptime_seconds: float = Field(..., description="서버 가동 시간 (초)")
     last_cleared: Optional[datetime] = Field(default=None, description="마지막 캐시 초기화 시각")
     cache_backend: str = Field(..., description="현재 캐시 백엔드 모드")
+    invalidation_bus: Optional[Dict[str, Any]] = Field(default=None, description="워커 간 L1 무효화 버스 상태")
+    l1_admission: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="L1 입장 정책 통계 (tinylfu: 순수 LRU 대비 히트율 차이)"
+    )
+    l1_compression: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="L1 압축 통계 (압축 엔트리 수, 원본/압축 크기, 압축률, 해제 횟수)"
+    )
+    latency: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description="연산별 지연 요약 (l1_get, disk_get, l2_get, l2_set, factory: count, avg/p50/p90/p99/max ms)"
+    )
+    families: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="키 계열별 통계 (chart, news, stock_detail, top_n_stocks, briefing_* 등: 히트/미스/저장/축출/평균 크기/부정 캐시)"
+    )
+    negative: Dict[str, int] = Field(
+        default_factory=dict,
+        description="부정 캐시 (없는 종목 / 빈 결과) 히트·저장 수와 TTL"
+    )
 
 
 class CacheClearRequest(BaseModel):
     """캐시 초기화 요청"""
     pattern: Optional[str] = Field(default=None, description="삭제할 키 패턴 (예: stock_*, news_*)")
-    layers: List[str] = Field(default=["l1", "l2"], description="초기화할 레이어 (l1, l2)")
+    layers: List[str] = Field(default=["l1", "l2"], description="초기화할 레이어 (l1, l2, disk) - l2 지정 시 디스크 계층 포함")
 
 
 class CacheClearResponse(BaseModel):
@@ -48,6 +70,21 @@ class CacheClearResponse(BaseModel):
     timestamp: datetime = Field(..., description="처리 시각")
 
 
+class CacheInvalidateTagsRequest(BaseModel):
+    """태그 기반 캐시 무효화 요청"""
+    tags: List[str] = Field(..., min_length=1, description="무효화할 태그 (예: ticker:AAPL, screener:day_gainers)")
+    layers: List[str] = Field(default=["l1", "l2"], description="무효화할 레이어 (l1, l2, disk) - l2 지정 시 디스크 계층 포함")
+
+
+class CacheInvalidateTagsResponse(BaseModel):
+    """태그 기반 캐시 무효화 응답"""
+    success: bool = Field(..., description="성공 여부")
+    invalidated_count: int = Field(..., description="삭제된 고유 키 수 (L1/L2 중복 제외)")
+    tags: List[str] = Field(..., description="적용된 태그")
+    layers: List[str] = Field(..., description="무효화된 레이어")
+    timestamp: datetime = Field(..., description="처리 시각")
+
+
 class CacheKeyInfo(BaseModel):
     """캐시 키 정보"""
     key: str = Field(..., description="캐시 키")
@@ -69,6 +106,10 @@ class CacheHealthResponse(BaseModel):
     l1_status: str = Field(..., description="L1 상태")
     l2_status: Optional[str] = Field(default=None, description="L2 상태")
     l2_connected: bool = Field(default=False, description="Redis 연결 상태")
+    l2_circuit: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="L2 서킷 브레이커 상태 (state: closed/open/half_open, 실패율, 느린 호출 비율)"
+    )
     message: str = Field(..., description="상태 메시지")
 
 
@@ -19,6 +19,38 @@ class ScoreBreakdown(BaseModel):
     total: int = 0                 # 총점 (40점 만점)
 
 
+class ScoringTierInfo(BaseModel):
+    """점수 규칙 구간 (min <= 입력값 <= max, 없으면 제한 없음)"""
+    min: Optional[float] = None
+    max: Optional[float] = None
+    points: int                    # 가중치 적용 후 점수
+    reason: Optional[str] = None   # WHY HOT 문구 템플릿
+
+
+class ScoringComponentInfo(BaseModel):
+    """점수 규칙 구성 요소"""
+    name: str                      # volume, price_change, momentum, market_cap
+    label: str
+    input: str                     # 규칙 입력값 (volume_ratio 등)
+    weight: float
+    missing_points: int            # 입력값이 없을 때 점수
+    max_points: int
+    tiers: List[ScoringTierInfo]
+
+
+class ScoringRulesResponse(BaseModel):
+    """현재 적용 중인 점수 규칙"""
+    version: str
+    description: str
+    digest: str                    # 규칙 해시 (바뀌면 스크리너 스냅샷 다시 생성)
+    source: Optional[str] = None   # 규칙 파일 경로
+    max_total: int
+    components: List[ScoringComponentInfo]
+    loaded_at: Optional[float] = None  # 마지막 로드 시각 (Unix time)
+    reload_interval_seconds: float
+    last_error: Optional[str] = None   # 마지막 리로드 실패 사유 (이전 규칙 유지 중)
+
+
 class WhyHotItem(BaseModel):
     """WHY HOT 항목"""
     icon: str              # ✅, ⚠️, ❌
@@ -43,6 +43,17 @@ class BriefingStorage:
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
+    def version(self) -> str:
+        """
+        저장 파일 버전 (수정 시각 ns + 크기, 파일이 없으면 "0")
+        scripts/daily_briefing.py 등 다른 프로세스의 저장도 반영되도록 캐시 키에 사용
+        """
+        try:
+            stat = os.stat(self.storage_path)
+        except OSError:
+            return "0"
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
     def _save_data(self, data: List[dict]) -> None:
         """JSON 파일에 데이터 저장"""
         with open(self.storage_path, "w", encoding="utf-8") as f:
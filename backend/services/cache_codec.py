@@ -0,0 +1,261 @@
+"""
+캐시 직렬화 코덱
+
+기능:
+- 코덱 인터페이스: L1 크기 계산과 L2 저장에 같은 바이트 재사용
+- pickle (기본), orjson, msgpack 지원
+- Pydantic 모델 / SWRValue / bytes 타입 보존 (JSON 계열 코덱)
+- 선택적 zstd 압축 (임계값 이상만 압축)
+"""
+
+import base64
+import importlib
+import logging
+import pickle
+from abc import ABC, abstractmethod
+from dataclasses import is_dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# zstd 프레임 매직 넘버 (압축 여부 판별용)
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 타입 태그 (JSON 계열 코덱에서 원래 타입 복원용)
+_MODEL_TAG = "__model__"
+_DATACLASS_TAG = "__dataclass__"
+_BYTES_TAG = "__bytes__"  # orjson은 bytes 미지원 → base64 문자열
+
+
+class CacheCodecError(Exception):
+    """코덱 에러"""
+    pass
+
+
+# ============================================================
+# 코덱 인터페이스
+# ============================================================
+
+class CacheCodec(ABC):
+    """캐시 값 ↔ 바이트 변환"""
+
+    name: str = "base"
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """값을 바이트로 직렬화"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """바이트를 값으로 역직렬화"""
+
+    def encode_sized(self, value: Any) -> Tuple[bytes, int]:
+        """직렬화 + 비압축 크기 (L1 메모리 계산용)"""
+        data = self.encode(value)
+        return data, len(data)
+
+    def decode_sized(self, data: bytes) -> Tuple[Any, int]:
+        """역직렬화 + 비압축 크기 (L1 메모리 계산용)"""
+        return self.decode(data), len(data)
+
+
+class PickleCodec(CacheCodec):
+    """pickle 코덱 (기존 동작, 모든 파이썬 객체 지원)"""
+
+    name = "pickle"
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class OrjsonCodec(CacheCodec):
+    """orjson 코덱 (Pydantic 모델은 model_dump 후 태그로 복원)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._option = orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def encode(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=_to_tagged, option=self._option)
+
+    def decode(self, data: bytes) -> Any:
+        return _revive(self._orjson.loads(data))
+
+
+class MsgpackCodec(CacheCodec):
+    """msgpack 코덱 (바이너리, JSON보다 작고 빠름)"""
+
+    name = "msgpack"
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=_to_tagged, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, object_hook=_from_tagged)
+
+
+class ZstdCodec(CacheCodec):
+    """zstd 압축 래퍼 (min_size 이상만 압축, 매직 넘버로 판별)"""
+
+    def __init__(self, inner: CacheCodec, level: int = 3, min_size: int = 1024):
+        import zstandard
+        self._inner = inner
+        self._min_size = min_size
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self.name = f"{inner.name}+zstd"
+
+    @property
+    def inner(self) -> CacheCodec:
+        """압축 전 코덱"""
+        return self._inner
+
+    def encode(self, value: Any) -> bytes:
+        return self.encode_sized(value)[0]
+
+    def decode(self, data: bytes) -> Any:
+        return self.decode_sized(data)[0]
+
+    def encode_sized(self, value: Any) -> Tuple[bytes, int]:
+        data = self._inner.encode(value)
+        if len(data) < self._min_size:
+            return data, len(data)
+        return self._compressor.compress(data), len(data)
+
+    def decode_sized(self, data: bytes) -> Tuple[Any, int]:
+        if data[:4] == ZSTD_MAGIC:
+            data = self._decompressor.decompress(data)
+        return self._inner.decode(data), len(data)
+
+
+# ============================================================
+# 타입 태그 (JSON 계열 코덱 공용)
+# ============================================================
+
+# 복원 허용 패키지 (payload에 적힌 임의 모듈 import / 호출 방지)
+_TRUSTED_PACKAGES = ("models", "services")
+
+_class_cache: Dict[str, type] = {}
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_class(path: str) -> type:
+    """
+    'module:QualName' 경로로 클래스 조회 (결과 캐시)
+    허용 패키지에 정의된 Pydantic 모델 / dataclass만 허용
+    """
+    cls = _class_cache.get(path)
+    if cls is not None:
+        return cls
+
+    module_name, _, qualname = path.partition(":")
+    if module_name.split(".")[0] not in _TRUSTED_PACKAGES or not qualname:
+        raise CacheCodecError(f"Untrusted cache type: {path}")
+
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+
+    if not (
+        isinstance(obj, type)
+        and obj.__module__ == module_name
+        and (issubclass(obj, BaseModel) or is_dataclass(obj))
+    ):
+        raise CacheCodecError(f"Untrusted cache type: {path}")
+
+    _class_cache[path] = obj
+    return obj
+
+
+def _to_tagged(obj: Any) -> Any:
+    """직렬화 불가 객체를 태그된 dict로 변환 (default 훅)"""
+    if isinstance(obj, BaseModel):
+        return {_MODEL_TAG: _class_path(type(obj)), "data": obj.model_dump(mode="json")}
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            _DATACLASS_TAG: _class_path(type(obj)),
+            "data": {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+        }
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return {_BYTES_TAG: base64.b64encode(obj).decode("ascii")}
+    raise TypeError(f"Type is not cache-serializable: {type(obj).__name__}")
+
+
+def _from_tagged(obj: Dict[str, Any]) -> Any:
+    """태그된 dict를 원래 타입으로 복원 (msgpack object_hook, 하위 dict부터 호출됨)"""
+    if _MODEL_TAG in obj:
+        return _resolve_class(obj[_MODEL_TAG]).model_validate(obj["data"])
+    if _DATACLASS_TAG in obj:
+        return _resolve_class(obj[_DATACLASS_TAG])(**obj["data"])
+    if _BYTES_TAG in obj:
+        return base64.b64decode(obj[_BYTES_TAG])
+    return obj
+
+
+def _revive(obj: Any) -> Any:
+    """orjson 결과를 재귀적으로 복원"""
+    if isinstance(obj, list):
+        return [_revive(item) for item in obj]
+    if isinstance(obj, dict):
+        return _from_tagged({key: _revive(value) for key, value in obj.items()})
+    return obj
+
+
+# ============================================================
+# 코덱 생성
+# ============================================================
+
+_CODECS = {
+    "pickle": PickleCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def get_codec(
+    name: str = "pickle",
+    compression: Optional[str] = None,
+    compression_level: int = 3,
+    compression_min_bytes: int = 1024
+) -> CacheCodec:
+    """
+    설정값으로 코덱 생성
+    패키지가 없으면 pickle / 무압축으로 폴백
+    """
+    codec_cls = _CODECS.get(name)
+    if codec_cls is None:
+        raise CacheCodecError(f"Unknown cache codec: {name}")
+
+    try:
+        codec = codec_cls()
+    except ImportError:
+        logger.warning(f"{name} package not installed, falling back to pickle codec")
+        codec = PickleCodec()
+
+    if compression in (None, "", "none"):
+        return codec
+    if compression != "zstd":
+        raise CacheCodecError(f"Unknown cache compression: {compression}")
+
+    try:
+        return ZstdCodec(codec, level=compression_level, min_size=compression_min_bytes)
+    except ImportError:
+        logger.warning("zstandard package not installed, cache compression disabled")
+        return codec
@@ -0,0 +1,261 @@
+"""
+캐시 메트릭
+
+기능:
+- 레이어별 지연 히스토그램 (L1 get, 디스크 get, L2 get/set, factory 실행)
+  HDR 방식: 2배 구간마다 16개 하위 구간 (상대 오차 ~6%), 메모리는 값 범위와 무관하게 수백 칸 이내
+- 키 계열(chart, news, stock_detail, top_n_stocks, briefing_* 등)별 히트/미스/저장/크기/축출 카운터
+- 부정 캐시(없는 종목 / 빈 결과) 히트/저장 카운터
+- /api/cache/stats 요약 + Prometheus 텍스트 포맷 출력
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 캐시 키 계열 = cache_service의 CACHE_KEY_* 템플릿에서 '{' 앞 접두사
+KEY_FAMILIES = (
+    "trending_stock",
+    "top_n_stocks",
+    "news",
+    "stock_detail",
+    "chart",
+    "compare_item",
+    "briefing_list",
+    "briefing_detail",
+    "momentum",
+    "screener_snapshot",
+)
+OTHER_FAMILY = "other"
+
+# Prometheus 히스토그램 le 경계 (초)
+PROMETHEUS_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def key_family(key: str) -> str:
+    """키가 속한 계열 (가장 긴 접두사 일치, 없으면 other)"""
+    best = OTHER_FAMILY
+    for family in KEY_FAMILIES:
+        if (key == family or key.startswith(family + "_")) and (
+            best == OTHER_FAMILY or len(family) > len(best)
+        ):
+            best = family
+    return best
+
+
+# ============================================================
+# 지연 히스토그램
+# ============================================================
+
+class LatencyHistogram:
+    """
+    HDR 스타일 로그-선형 히스토그램 (마이크로초 단위 정수로 기록)
+    - 32µs 미만: 1µs 단위
+    - 그 이상: 2배 구간마다 SUB_BUCKETS개 (유효 숫자 약 2자리)
+    """
+
+    SUB_BUCKETS = 16
+    _SUB_BITS = 4  # log2(SUB_BUCKETS)
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = max(0, int(seconds * 1_000_000))
+        index = self._index(micros)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def percentile(self, p: float) -> float:
+        """p (0~100) 백분위 지연 (초, 구간 상한 기준)"""
+        if not self.count:
+            return 0.0
+        target = max(1, int(self.count * p / 100 + 0.999999))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index) / 1_000_000, self.max_seconds)
+        return self.max_seconds
+
+    def cumulative(self, bounds: Iterable[float]) -> List[Tuple[float, int]]:
+        """le 경계별 누적 개수 (구간 상한이 경계 이하인 칸만 포함)"""
+        items = sorted(self._counts.items())
+        result = []
+        position, seen = 0, 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while position < len(items) and self._upper_bound(items[position][0]) <= limit:
+                seen += items[position][1]
+                position += 1
+            result.append((bound, seen))
+        return result
+
+    def summary(self) -> dict:
+        """요약 (밀리초)"""
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_seconds / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        linear = cls.SUB_BUCKETS * 2
+        if micros < linear:
+            return micros
+        shift = micros.bit_length() - (cls._SUB_BITS + 1)
+        top = micros >> shift  # [SUB_BUCKETS, 2 * SUB_BUCKETS)
+        return linear + (shift - 1) * cls.SUB_BUCKETS + (top - cls.SUB_BUCKETS)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """구간의 상한 (마이크로초, 미포함)"""
+        linear = cls.SUB_BUCKETS * 2
+        if index < linear:
+            return index + 1
+        offset = index - linear
+        shift = offset // cls.SUB_BUCKETS + 1
+        top = offset % cls.SUB_BUCKETS + cls.SUB_BUCKETS
+        return (top + 1) << shift
+
+
+# ============================================================
+# 키 계열별 카운터
+# ============================================================
+
+@dataclass
+class FamilyStats:
+    """키 계열별 통계"""
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    bytes_written: int = 0  # 저장된 값의 비압축 크기 합
+    negative_hits: int = 0  # hits 중 NegativeResult (업스트림 호출 절약)
+    negative_sets: int = 0  # sets 중 NegativeResult
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 2),
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "avg_size_bytes": self.bytes_written // self.sets if self.sets else 0,
+            "negative_hits": self.negative_hits,
+            "negative_sets": self.negative_sets,
+        }
+
+
+class CacheMetrics:
+    """캐시 매니저 메트릭 (이벤트 루프 스레드에서만 갱신)"""
+
+    OPERATIONS = ("l1_get", "disk_get", "l2_get", "l2_set", "factory")
+
+    def __init__(self):
+        self._latency: Dict[str, LatencyHistogram] = {
+            op: LatencyHistogram() for op in self.OPERATIONS
+        }
+        self._families: Dict[str, FamilyStats] = {}
+
+    def observe(self, operation: str, seconds: float) -> None:
+        self._latency[operation].record(seconds)
+
+    def record_lookup(self, key: str, hit: bool, negative: bool = False) -> None:
+        stats = self._family(key)
+        if hit:
+            stats.hits += 1
+            stats.negative_hits += negative
+        else:
+            stats.misses += 1
+
+    def record_set(self, key: str, size_bytes: Optional[int], negative: bool = False) -> None:
+        stats = self._family(key)
+        stats.sets += 1
+        stats.negative_sets += negative
+        stats.bytes_written += size_bytes or 0
+
+    def record_eviction(self, key: str) -> None:
+        self._family(key).evictions += 1
+
+    def latency(self, operation: str) -> LatencyHistogram:
+        return self._latency[operation]
+
+    def family(self, name: str) -> FamilyStats:
+        return self._families.get(name) or FamilyStats()
+
+    def reset(self) -> None:
+        for op in self.OPERATIONS:
+            self._latency[op] = LatencyHistogram()
+        self._families.clear()
+
+    def _family(self, key: str) -> FamilyStats:
+        name = key_family(key)
+        stats = self._families.get(name)
+        if stats is None:
+            stats = self._families[name] = FamilyStats()
+        return stats
+
+    def summary(self) -> dict:
+        """/api/cache/stats용 요약 (기록이 없는 연산은 제외)"""
+        return {
+            "latency": {
+                op: histogram.summary()
+                for op, histogram in self._latency.items() if histogram.count
+            },
+            "families": {
+                name: stats.to_dict() for name, stats in sorted(self._families.items())
+            },
+            "negative": {
+                "hits": sum(stats.negative_hits for stats in self._families.values()),
+                "sets": sum(stats.negative_sets for stats in self._families.values()),
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "noname_cache") -> str:
+        """Prometheus 텍스트 포맷 (exposition format 0.0.4)"""
+        lines = [
+            f"# HELP {prefix}_latency_seconds Cache operation latency by layer",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for op, histogram in self._latency.items():
+            for bound, count in histogram.cumulative(PROMETHEUS_BUCKETS):
+                lines.append(f'{prefix}_latency_seconds_bucket{{op="{op}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_latency_seconds_bucket{{op="{op}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{op="{op}"}} {histogram.total_seconds:.6f}')
+            lines.append(f'{prefix}_latency_seconds_count{{op="{op}"}} {histogram.count}')
+
+        counters = (
+            ("hits", "Cache hits by key family"),
+            ("misses", "Cache misses by key family"),
+            ("sets", "Cache writes by key family"),
+            ("evictions", "L1 capacity evictions by key family"),
+            ("bytes_written", "Uncompressed bytes written by key family"),
+            ("negative_hits", "Negative cache hits (known-missing results) by key family"),
+            ("negative_sets", "Negative cache writes by key family"),
+        )
+        for field_name, help_text in counters:
+            metric = f"{prefix}_family_{field_name}_total"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in sorted(self._families.items()):
+                lines.append(f'{metric}{{family="{name}"}} {getattr(stats, field_name)}')
+
+        return "\n".join(lines) + "\n"
@@ -2,25 +2,42 @@
 레이어드 캐시 서비스 (L1: Memory + L2: Redis)
 
 기능:
-- L1 인메모리 캐시: LRU 정책, 크기 제한
-- L2 Redis 캐시: 분산 환경 지원, 자동 재연결
-- 통계 추적: 히트율, 미스율, 에러율
+- L1 인메모리 캐시: LRU 정책, 크기 제한, 만료 인덱스 (min-heap) + 백그라운드 정리
+- L1 압축 (선택): 임계값 이상 엔트리는 zstd 압축 바이트로 보관, 조회 시 해제 (압축 크기로 메모리 계산)
+- L1 입장 정책 (선택): W-TinyLFU (Count-Min Sketch + window LRU), 스캔성 접근에 강함
+- L1 키 인덱스: '_' 토큰 트라이로 패턴 삭제/조회를 O(매칭 수)로 처리
+- 태그 기반 무효화: ticker:AAPL 등 태그로 관련 키를 L1 + L2에서 한 번에 삭제
+- L2 Redis 캐시: 분산 환경 지원, 자동 재연결 (무기한, backoff)
+- L2 서킷 브레이커: 에러율/지연 기반 closed → open → half-open, 장애 시 즉시 실패
+- 워커 간 L1 무효화: Redis pub/sub으로 삭제/저장/패턴 삭제 전파 (L1 TTL 연장 가능)
+- 통계 추적: 히트율, 미스율, 에러율 + 레이어별 지연 히스토그램 / 키 계열별 카운터 (Prometheus)
 - Stampede 방지: 동시 요청 시 단일 API 호출
+- Stale-While-Revalidate: soft 만료 후 이전 값 즉시 반환 + 백그라운드 갱신
+- 확률적 조기 갱신 (XFetch): 만료 직전 갱신을 분산
+- 직렬화 코덱: pickle / orjson / msgpack (+ zstd), aset당 1회 직렬화
+- 다중 키 API: aget_many / aset_many (L1 1회 순회 + Redis MGET / 파이프라인 SETEX)
 - 기존 코드 호환: 동기 인터페이스 유지
 """
 
 import asyncio
 import fnmatch
+import heapq
 import json
 import logging
-import pickle
-import sys
+import math
+import os
+import random
 import time
+import uuid
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Awaitable
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Awaitable, Set, Tuple
+
+from services.cache_codec import ZSTD_MAGIC, CacheCodec, PickleCodec, ZstdCodec, get_codec
+from services.cache_metrics import CacheMetrics
+from services.market_calendar import NY_TZ, MarketSession, market_session
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +73,10 @@ class CacheStats:
 
 
 class CacheTTL:
-    """TTL 설정 (초)"""
+    """
+    TTL 설정 (초)
+    상수는 정규장 기준 기본값, for_data()는 NYSE 세션별 TTL (session_aware=False면 상수 그대로)
+    """
     # 종목 데이터
     TRENDING = 300           # 5분
     TOP_N = 300              # 5분
@@ -74,9 +94,29 @@ class CacheTTL:
     BRIEFING_DETAIL = 3600   # 1시간 (불변)
     BRIEFING_LIST = 600      # 10분
 
+    # 세션별 TTL (프리마켓, 정규장, 애프터마켓, 야간, 휴장)
+    # 장이 닫힌 동안에는 시세가 바뀌지 않으므로 길게, 다음 세션 시작 시각은 넘지 않음
+    session_aware = True
+    MIN_SESSION_TTL = 30
+    SESSION_TTL: Dict[str, Tuple[int, int, int, int, int]] = {
+        "trending":     (600, 300, 600, 21600, 43200),
+        "top_n":        (600, 300, 600, 21600, 43200),
+        "stock_detail": (300, 60, 300, 21600, 43200),
+        "news":         (900, 900, 1800, 3600, 7200),
+        "chart_5d":     (900, 300, 900, 21600, 43200),
+        "chart_1mo":    (3600, 1800, 3600, 21600, 43200),
+        "chart_3mo":    (3600, 3600, 3600, 21600, 43200),
+        "chart_6mo":    (3600, 3600, 3600, 21600, 43200),
+        "chart_1y":     (3600, 3600, 3600, 21600, 43200),
+    }
+    _SESSION_ORDER = (
+        MarketSession.PRE_MARKET, MarketSession.REGULAR, MarketSession.AFTER_HOURS,
+        MarketSession.OVERNIGHT, MarketSession.CLOSED,
+    )
+
     @classmethod
     def get_chart_ttl(cls, period: str) -> int:
-        """차트 기간별 TTL 반환"""
+        """차트 기간별 TTL 반환 (세션 반영)"""
         ttl_map = {
             "5d": cls.CHART_5D,
             "1mo": cls.CHART_1MO,
@@ -84,7 +124,43 @@ class CacheTTL:
             "6mo": cls.CHART_6MO,
             "1y": cls.CHART_1Y,
         }
-        return ttl_map.get(period, cls.CHART_5D)
+        if period not in ttl_map:
+            period = "5d"
+        return cls.for_data(f"chart_{period}", default=ttl_map[period])
+
+    @classmethod
+    def for_data(
+        cls,
+        kind: str,
+        default: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        데이터 종류(trending, top_n, stock_detail, news, chart_<기간>)별 현재 세션의 TTL
+        세션 전환 시각까지 남은 시간으로 제한 (예: 야간 6시간 TTL도 프리마켓 시작 시 만료)
+        """
+        fallback = default if default is not None else getattr(cls, kind.upper(), cls.TRENDING)
+        ttls = cls.SESSION_TTL.get(kind)
+        if not cls.session_aware or ttls is None:
+            return fallback
+
+        now = now or datetime.now(NY_TZ)
+        info = market_session(now)
+        ttl = ttls[cls._SESSION_ORDER.index(info.session)]
+        return max(cls.MIN_SESSION_TTL, min(ttl, int(info.seconds_remaining(now))))
+
+    @classmethod
+    def snapshot(cls, now: Optional[datetime] = None) -> dict:
+        """현재 세션과 데이터 종류별 적용 TTL (/api/cache/ttl용)"""
+        now = now or datetime.now(NY_TZ)
+        info = market_session(now)
+        return {
+            "session": info.session.value,
+            "half_day": info.half_day,
+            "session_ends_at": info.ends_at.isoformat(),
+            "session_aware": cls.session_aware,
+            "effective": {kind: cls.for_data(kind, now=now) for kind in cls.SESSION_TTL},
+        }
 
 
 # ============================================================
@@ -98,6 +174,7 @@ class CacheEntry:
     expires_at: float
     size_bytes: int = 0
     created_at: float = field(default_factory=time.time)
+    tags: Tuple[str, ...] = ()
 
     @property
     def is_expired(self) -> bool:
@@ -109,32 +186,302 @@ class CacheEntry:
         return max(0, int(remaining))
 
 
+@dataclass
+class CompressedValue:
+    """L1 압축 엔트리 값 (코덱 직렬화 + zstd, 조회 시점에 해제)"""
+    data: bytes
+    raw_size: int
+
+
+@dataclass
+class SWRValue:
+    """
+    get_or_set 저장 값 (SWR / 조기 갱신 모드)
+    - soft_expires_at 이후: stale 값 반환 + 백그라운드 갱신
+    - hard 만료: 레이어 TTL (soft TTL + stale 구간)
+    - compute_seconds: 마지막 factory 실행 시간 (조기 갱신 가중치)
+    """
+    value: Any
+    soft_expires_at: float
+    compute_seconds: float = 0.0
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() > self.soft_expires_at
+
+    def should_refresh_early(self, beta: float = 1.0) -> bool:
+        """
+        XFetch 조기 갱신 판단
+        만료가 가까울수록, 재계산이 오래 걸릴수록 갱신 확률 증가
+        """
+        if self.compute_seconds <= 0:
+            return False
+        # -log(U) ~ Exp(1), U ∈ (0, 1]
+        gap = -self.compute_seconds * beta * math.log(1.0 - random.random())
+        return time.time() + gap >= self.soft_expires_at
+
+
+@dataclass
+class NegativeResult:
+    """
+    부정 캐시 값 (존재하지 않는 종목, 빈 결과, 일시적 업스트림 실패)
+    - get_or_set factory가 반환하면 실제 TTL 대신 짧은 negative TTL로 저장
+    - 호출자가 isinstance로 판별해 404 / 빈 결과로 변환
+    """
+    reason: str = ""
+    status_code: int = 404
+    upstream_error: bool = False  # True면 negative_error_ttl (더 짧게)
+
+
 # ============================================================
-# L1: 메모리 캐시 (LRU)
+# L1 키 인덱스 (패턴 조회용 트라이)
+# ============================================================
+
+class _TrieNode:
+    __slots__ = ("children", "key")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.key: Optional[str] = None
+
+
+class KeyPrefixIndex:
+    """
+    캐시 키 트라이 ('_' 구분 토큰 단위)
+    - chart_AAPL_5d → chart / AAPL / 5d
+    - 'chart_AAPL_*' 같은 접두사 패턴을 전체 키 스캔 없이 O(매칭 수)로 조회
+    - 접두사 뒤에 남은 glob은 매칭 후보에만 fnmatch 적용
+    """
+
+    SEPARATOR = "_"
+    GLOB_CHARS = "*?["
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> None:
+        node = self._root
+        for token in key.split(self.SEPARATOR):
+            node = node.children.setdefault(token, _TrieNode())
+        if node.key is None:
+            node.key = key
+            self._size += 1
+
+    def discard(self, key: str) -> None:
+        path = [self._root]
+        tokens = key.split(self.SEPARATOR)
+        for token in tokens:
+            child = path[-1].children.get(token)
+            if child is None:
+                return
+            path.append(child)
+
+        if path[-1].key is None:
+            return
+        path[-1].key = None
+        self._size -= 1
+
+        # 빈 노드 정리
+        for depth in range(len(tokens), 0, -1):
+            node = path[depth]
+            if node.key is not None or node.children:
+                break
+            del path[depth - 1].children[tokens[depth - 1]]
+
+    def clear(self) -> None:
+        self._root = _TrieNode()
+        self._size = 0
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """prefix로 시작하는 모든 키"""
+        *full_tokens, partial = prefix.split(self.SEPARATOR)
+        node = self._root
+        for token in full_tokens:
+            node = node.children.get(token)
+            if node is None:
+                return
+
+        for token, child in node.children.items():
+            if token.startswith(partial):
+                yield from self._iter_subtree(child)
+
+    def match(self, pattern: str) -> List[str]:
+        """glob 패턴에 매칭되는 키 목록"""
+        cut = min(
+            (i for i in (pattern.find(c) for c in self.GLOB_CHARS) if i >= 0),
+            default=len(pattern)
+        )
+        prefix = pattern[:cut]
+
+        if cut == len(pattern):
+            return [pattern] if self._contains(pattern) else []
+        if pattern == prefix + "*":
+            return list(self.iter_prefix(prefix))
+        return [k for k in self.iter_prefix(prefix) if fnmatch.fnmatchcase(k, pattern)]
+
+    def _contains(self, key: str) -> bool:
+        node = self._root
+        for token in key.split(self.SEPARATOR):
+            node = node.children.get(token)
+            if node is None:
+                return False
+        return node.key is not None
+
+    @staticmethod
+    def _iter_subtree(node: _TrieNode) -> Iterator[str]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.key is not None:
+                yield current.key
+            stack.extend(current.children.values())
+
+
+# ============================================================
+# 입장 정책: Count-Min Sketch (W-TinyLFU 빈도 필터)
+# ============================================================
+
+class CountMinSketch:
+    """
+    키 접근 빈도 근사 (4비트 카운터, 최대 15)
+    - depth개 행 중 최솟값을 빈도로 사용
+    - sample_size번 기록마다 모든 카운터를 절반으로 (오래된 인기 키 aging)
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, capacity: int, depth: int = 4):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._width = width
+        self._mask = width - 1
+        self._depth = depth
+        self._table = bytearray(width * depth)
+        self._sample_size = 10 * width
+        self._additions = 0
+
+    _MASK64 = 0xFFFFFFFFFFFFFFFF
+
+    def _indexes(self, key: str) -> Iterator[int]:
+        """
+        행마다 독립적인 위치 (splitmix64 섞기)
+        h1 + row * h2 방식은 하위 비트가 같은 키끼리 모든 행에서 충돌함
+        """
+        h = hash(key) & self._MASK64
+        for row in range(self._depth):
+            x = (h + (row + 1) * 0x9E3779B97F4A7C15) & self._MASK64
+            x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & self._MASK64
+            x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & self._MASK64
+            yield row * self._width + ((x ^ (x >> 31)) & self._mask)
+
+    def increment(self, key: str) -> None:
+        """접근 1회 기록"""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < self.MAX_COUNT:
+                table[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, key: str) -> int:
+        """근사 접근 빈도"""
+        return min(self._table[index] for index in self._indexes(key))
+
+    def clear(self) -> None:
+        self._table = bytearray(len(self._table))
+        self._additions = 0
+
+    def _reset(self) -> None:
+        """aging: 모든 카운터 절반"""
+        self._table = bytearray(count >> 1 for count in self._table)
+        self._additions //= 2
+
+
+# ============================================================
+# L1: 메모리 캐시 (LRU / W-TinyLFU)
 # ============================================================
 
 class MemoryCache:
     """
     L1: 인메모리 캐시
     - LRU (Least Recently Used) 정책
+    - 입장 정책 (admission="tinylfu"): 새 키는 window LRU에 먼저 들어가고,
+      window에서 밀려날 때 main의 LRU 희생 키보다 접근 빈도가 높아야 남음
     - 최대 엔트리 수 및 메모리 제한
     - 빠른 접근 (~1ms)
+    - 크기 계산은 코덱 직렬화 결과 기준 (L2와 같은 바이트 재사용 가능)
+    - 만료 인덱스 (expires_at min-heap): 만료 엔트리만 골라서 정리
+    - 키 인덱스 (트라이): 패턴 삭제/조회 시 전체 스캔 없음
+    - 태그 인덱스: 태그 → 키 집합
+    - 압축 (compress_min_bytes > 0): 직렬화 크기가 임계값 이상인 엔트리는 zstd 압축 바이트로 보관,
+      조회할 때만 해제 → 메모리 제한은 압축 크기 기준 (차트 / 브리핑 목록 등 큰 응답)
     """
 
+    # 덮어쓰기로 쌓인 무효 heap 항목이 이 배수를 넘으면 재구성
+    EXPIRY_INDEX_COMPACT_RATIO = 2
+
+    ADMISSION_POLICIES = ("lru", "tinylfu")
+
     def __init__(
         self,
         max_entries: int = 1000,
-        max_memory_mb: int = 100
+        max_memory_mb: int = 100,
+        codec: Optional[CacheCodec] = None,
+        admission: str = "lru",
+        window_ratio: float = 0.01,
+        compress_min_bytes: int = 0,
+        compression_level: int = 3
     ):
+        if admission not in self.ADMISSION_POLICIES:
+            raise ValueError(f"Unknown L1 admission policy: {admission}")
+
+        self._codec = codec or PickleCodec()
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []  # (expires_at, key), 지연 삭제
+        self._key_index = KeyPrefixIndex()
+        self._tag_index: Dict[str, Set[str]] = {}
         self._max_entries = max_entries
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
         self._current_memory = 0
         self._stats = CacheStats()
         self._lock = asyncio.Lock()
+        self.on_evict: Optional[Callable[[str], None]] = None  # 용량 초과 축출 시 호출 (메트릭)
+
+        # W-TinyLFU 상태 (admission="tinylfu"일 때만 사용)
+        self._admission = admission
+        self._sketch: Optional[CountMinSketch] = None
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._window_size = max(1, int(max_entries * window_ratio))
+        self._admitted = 0
+        self._rejected = 0
+        # 같은 크기의 순수 LRU였다면의 히트율 (키만 추적, 엔트리 수 기준 근사)
+        self._baseline: OrderedDict[str, None] = OrderedDict()
+        self._baseline_stats = CacheStats()
+        if admission == "tinylfu":
+            self._sketch = CountMinSketch(max_entries)
+
+        # 압축 상태 (compress_min_bytes > 0이고 zstandard가 있을 때만)
+        self._compress_min_bytes = compress_min_bytes
+        self._compression: Optional[ZstdCodec] = None
+        if compress_min_bytes > 0:
+            self._compression = self._open_compression(compression_level)
+        self._compressed_entries = 0
+        self._compressed_raw_bytes = 0
+        self._compressed_bytes = 0
+        self._decompressions = 0
 
     def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회 (동기)"""
+        if self._sketch is not None:
+            self._record_access(key)
+
         entry = self._cache.get(key)
         if entry is None:
             self._stats.misses += 1
@@ -145,32 +492,77 @@ class MemoryCache:
             self._stats.misses += 1
             return None
 
+        value = entry.value
+        if isinstance(value, CompressedValue):
+            try:
+                value = self._decompress(value)
+            except Exception as e:
+                logger.warning(f"Memory cache decompress error: {e}")
+                self._remove_entry(key)
+                self._stats.errors += 1
+                self._stats.misses += 1
+                return None
+
         # LRU: 최근 사용으로 이동
         self._cache.move_to_end(key)
+        if key in self._window:
+            self._window.move_to_end(key)
         self._stats.hits += 1
-        return entry.value
+        return value
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
-        """캐시에 값 저장 (동기)"""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        size_bytes: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        encoded: Optional[bytes] = None
+    ) -> bool:
+        """
+        캐시에 값 저장 (동기) - size_bytes를 주면 크기 계산 생략
+        encoded: 같은 코덱으로 이미 직렬화한 바이트 (zstd 압축돼 있으면 L1 압축에 재사용)
+        """
         try:
-            size = self._estimate_size(value)
-
-            # 기존 키가 있으면 메모리에서 제거
-            if key in self._cache:
-                self._current_memory -= self._cache[key].size_bytes
+            size = size_bytes if size_bytes is not None else self._estimate_size(value)
+            if self._compression is not None and size >= self._compress_min_bytes:
+                value, size = self._compress(value, size, encoded)
+
+            # 기존 키가 있으면 메모리/태그에서 제거
+            is_new = key not in self._cache
+            if not is_new:
+                old_entry = self._cache[key]
+                self._current_memory -= old_entry.size_bytes
+                self._untag(key, old_entry.tags)
+                self._forget_compressed(old_entry)
+            else:
+                self._key_index.add(key)
 
-            # 공간 확보 (LRU 정책)
-            self._evict_if_needed(size)
+            # 공간 확보 (LRU 정책, tinylfu는 엔트리 수 제한을 저장 후 입장 심사로 처리)
+            self._evict_if_needed(size, enforce_max_entries=self._sketch is None)
 
             entry = CacheEntry(
                 value=value,
                 expires_at=time.time() + ttl_seconds,
-                size_bytes=size
+                size_bytes=size,
+                tags=tuple(tags) if tags else ()
             )
             self._cache[key] = entry
             self._cache.move_to_end(key)
             self._current_memory += size
+            if isinstance(value, CompressedValue):
+                self._compressed_entries += 1
+                self._compressed_raw_bytes += value.raw_size
+                self._compressed_bytes += size
+            self._index_expiry(key, entry.expires_at)
+            for tag in entry.tags:
+                self._tag_index.setdefault(tag, set()).add(key)
             self._stats.sets += 1
+
+            if self._sketch is not None:
+                self._track_baseline(key)
+                if is_new:
+                    self._admit(key)
             return True
 
         except Exception as e:
@@ -190,15 +582,20 @@ class MemoryCache:
         """전체 캐시 삭제"""
         count = len(self._cache)
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._key_index.clear()
+        self._tag_index.clear()
+        self._window.clear()
+        self._baseline.clear()
         self._current_memory = 0
+        self._compressed_entries = 0
+        self._compressed_raw_bytes = 0
+        self._compressed_bytes = 0
         return count
 
     def clear_pattern(self, pattern: str) -> int:
         """패턴에 매칭되는 키 삭제"""
-        keys_to_delete = [
-            key for key in self._cache.keys()
-            if fnmatch.fnmatch(key, pattern)
-        ]
+        keys_to_delete = self._key_index.match(pattern)
         for key in keys_to_delete:
             self._remove_entry(key)
         return len(keys_to_delete)
@@ -207,17 +604,39 @@ class MemoryCache:
         """패턴에 매칭되는 키 목록"""
         if pattern == "*":
             return list(self._cache.keys())
-        return [k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)]
+        return self._key_index.match(pattern)
 
-    def cleanup_expired(self) -> int:
-        """만료된 엔트리 정리"""
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired
-        ]
-        for key in expired_keys:
+    def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그가 붙은 모든 키 삭제 (삭제된 키 목록 반환)"""
+        keys_to_delete: Set[str] = set()
+        for tag in tags:
+            keys_to_delete |= self._tag_index.get(tag, set())
+        for key in keys_to_delete:
             self._remove_entry(key)
-        return len(expired_keys)
+        return list(keys_to_delete)
+
+    def cleanup_expired(self, max_items: Optional[int] = None) -> int:
+        """
+        만료된 엔트리 정리 (만료 인덱스 기준, 전체 스캔 없음)
+        max_items: 한 번에 확인할 최대 heap 항목 수 (None이면 만료분 전부)
+        """
+        now = time.time()
+        removed = 0
+        checked = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            if max_items is not None and checked >= max_items:
+                break
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            checked += 1
+
+            # 덮어쓰기/삭제된 키의 오래된 항목은 무시
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(key)
+                removed += 1
+
+        return removed
 
     @property
     def stats(self) -> CacheStats:
@@ -227,37 +646,344 @@ class MemoryCache:
     def key_count(self) -> int:
         return len(self._cache)
 
+    @property
+    def has_expired_entries(self) -> bool:
+        """정리 대기 중인 만료 인덱스 항목 존재 여부"""
+        return bool(self._expiry_heap) and self._expiry_heap[0][0] < time.time()
+
     @property
     def memory_usage_mb(self) -> float:
         return self._current_memory / (1024 * 1024)
 
-    def _remove_entry(self, key: str) -> None:
-        """엔트리 삭제 및 메모리 반환"""
+    def admission_stats(self) -> Optional[dict]:
+        """입장 정책 통계 (tinylfu: 같은 크기 순수 LRU 대비 히트율 차이 포함)"""
+        if self._sketch is None:
+            return None
+
+        hit_rate = self._stats.hit_rate
+        baseline = self._baseline_stats.hit_rate
+        return {
+            "policy": self._admission,
+            "window_size": self._window_size,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "hit_rate": round(hit_rate, 2),
+            "lru_baseline_hit_rate": round(baseline, 2),
+            "hit_rate_delta": round(hit_rate - baseline, 2)
+        }
+
+    def compression_stats(self) -> Optional[dict]:
+        """압축 통계 (압축 엔트리 수, 원본 / 압축 바이트, 절약 비율)"""
+        if self._compression is None:
+            return None
+
+        raw, compressed = self._compressed_raw_bytes, self._compressed_bytes
+        return {
+            "min_bytes": self._compress_min_bytes,
+            "entries": self._compressed_entries,
+            "raw_mb": round(raw / (1024 * 1024), 2),
+            "compressed_mb": round(compressed / (1024 * 1024), 2),
+            "ratio": round(raw / compressed, 2) if compressed else None,
+            "decompressions": self._decompressions
+        }
+
+    def _open_compression(self, level: int) -> Optional[ZstdCodec]:
+        """L1 압축 코덱 (이미 zstd 코덱이면 내부 코덱 기준, zstandard가 없으면 압축 안 함)"""
+        inner = self._codec.inner if isinstance(self._codec, ZstdCodec) else self._codec
+        try:
+            return ZstdCodec(inner, level=level, min_size=self._compress_min_bytes)
+        except ImportError:
+            logger.warning("zstandard package not installed, L1 compression disabled")
+            return None
+
+    def _compress(
+        self, value: Any, raw_size: int, encoded: Optional[bytes]
+    ) -> Tuple[Any, int]:
+        """
+        큰 값을 CompressedValue로 변환 (압축 효과가 없으면 원래 값 그대로)
+        L2용으로 이미 zstd 압축된 바이트가 있으면 다시 압축하지 않음
+        """
+        try:
+            if encoded is None or encoded[:4] != ZSTD_MAGIC:
+                encoded = self._compression.encode(value)
+        except Exception as e:
+            logger.warning(f"Memory cache compress error: {e}")
+            return value, raw_size
+        if len(encoded) >= raw_size:
+            return value, raw_size
+        return CompressedValue(data=encoded, raw_size=raw_size), len(encoded)
+
+    def _decompress(self, value: CompressedValue) -> Any:
+        """조회 시점 압축 해제 (엔트리는 압축 상태 유지)"""
+        self._decompressions += 1
+        return self._compression.decode(value.data)
+
+    def _forget_compressed(self, entry: CacheEntry) -> None:
+        """압축 통계에서 엔트리 제외"""
+        if isinstance(entry.value, CompressedValue):
+            self._compressed_entries -= 1
+            self._compressed_raw_bytes -= entry.value.raw_size
+            self._compressed_bytes -= entry.size_bytes
+
+    def _record_access(self, key: str) -> None:
+        """tinylfu: 빈도 기록 + LRU 기준선 히트/미스 집계"""
+        self._sketch.increment(key)
+        if key in self._baseline:
+            self._baseline.move_to_end(key)
+            self._baseline_stats.hits += 1
+        else:
+            self._baseline_stats.misses += 1
+
+    def _track_baseline(self, key: str) -> None:
+        """LRU 기준선에 키 추가 (엔트리 수 초과 시 가장 오래된 키 제거)"""
+        self._baseline[key] = None
+        self._baseline.move_to_end(key)
+        while len(self._baseline) > self._max_entries:
+            self._baseline.popitem(last=False)
+
+    def _admit(self, key: str) -> None:
+        """
+        W-TinyLFU 입장 심사
+        새 키는 window에 들어가고, window에서 밀려난 후보는 main의 LRU 희생 키보다
+        빈도가 높을 때만 남음 (아니면 후보를 제거)
+        """
+        self._window[key] = None
+        if len(self._window) > self._window_size:
+            candidate, _ = self._window.popitem(last=False)
+            if len(self._cache) > self._max_entries:
+                self.cleanup_expired()
+            if len(self._cache) > self._max_entries and candidate in self._cache:
+                victim = self._main_victim(exclude=candidate)
+                if victim is not None and (
+                    self._sketch.estimate(candidate) > self._sketch.estimate(victim)
+                ):
+                    self._remove_entry(victim, evicted=True)
+                    self._admitted += 1
+                else:
+                    self._remove_entry(candidate, evicted=True)
+                    self._rejected += 1
+
+        # window 키가 삭제되어 window가 작아진 경우 등: 초과분은 LRU로 정리
+        while len(self._cache) > self._max_entries:
+            self._remove_entry(next(iter(self._cache)), evicted=True)
+
+    def _main_victim(self, exclude: str) -> Optional[str]:
+        """main 영역(window 제외)에서 가장 오래 사용되지 않은 키"""
+        for key in self._cache:
+            if key != exclude and key not in self._window:
+                return key
+        return None
+
+    def _remove_entry(self, key: str, evicted: bool = False) -> None:
+        """
+        엔트리 삭제 및 메모리 반환
+        evicted: 용량 초과로 인한 제거 (LRU 기준선에는 남겨 둠, on_evict 호출)
+        """
         if key in self._cache:
-            self._current_memory -= self._cache[key].size_bytes
-            del self._cache[key]
+            if evicted and self.on_evict is not None:
+                self.on_evict(key)
+            entry = self._cache.pop(key)
+            self._current_memory -= entry.size_bytes
+            self._forget_compressed(entry)
+            self._key_index.discard(key)
+            self._untag(key, entry.tags)
+            self._window.pop(key, None)
+            if not evicted:
+                self._baseline.pop(key, None)
+
+    def _untag(self, key: str, tags: Tuple[str, ...]) -> None:
+        """태그 인덱스에서 키 제거"""
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _index_expiry(self, key: str, expires_at: float) -> None:
+        """만료 인덱스에 추가 (무효 항목이 많으면 재구성)"""
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        if len(self._expiry_heap) > self.EXPIRY_INDEX_COMPACT_RATIO * len(self._cache) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, k) for k, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict_if_needed(self, required_size: int, enforce_max_entries: bool = True) -> None:
+        """LRU 정책으로 공간 확보 (만료 엔트리 먼저 정리)"""
+        if ((enforce_max_entries and len(self._cache) >= self._max_entries)
+                or self._current_memory + required_size > self._max_memory_bytes):
+            self.cleanup_expired()
 
-    def _evict_if_needed(self, required_size: int) -> None:
-        """LRU 정책으로 공간 확보"""
         # 엔트리 수 제한
-        while len(self._cache) >= self._max_entries:
+        while enforce_max_entries and len(self._cache) >= self._max_entries:
             oldest_key = next(iter(self._cache))
-            self._remove_entry(oldest_key)
+            self._remove_entry(oldest_key, evicted=True)
 
         # 메모리 제한
         while (self._current_memory + required_size > self._max_memory_bytes
                and self._cache):
             oldest_key = next(iter(self._cache))
-            self._remove_entry(oldest_key)
+            self._remove_entry(oldest_key, evicted=True)
 
     def _estimate_size(self, value: Any) -> int:
-        """값의 메모리 크기 추정"""
+        """값의 메모리 크기 추정 (직렬화 크기 기준)"""
         try:
-            return sys.getsizeof(pickle.dumps(value))
+            return self._codec.encode_sized(value)[1]
         except Exception:
             return 1024  # 기본값 1KB
 
 
+# ============================================================
+# L2 서킷 브레이커
+# ============================================================
+
+class CircuitBreaker:
+    """
+    L2 호출 서킷 브레이커
+    - closed: 정상 호출, 최근 window_seconds 동안의 결과(성공/실패/지연)를 기록
+    - open: 실패율 또는 느린 호출 비율이 임계치를 넘으면 open_seconds 동안 호출하지 않음 (즉시 실패)
+    - half-open: 대기 후 half_open_max_calls개만 시험 호출 → 모두 성공하면 closed, 하나라도 실패하면 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 0.25,
+        slow_call_rate_threshold: float = 0.5,
+        window_seconds: float = 30.0,
+        min_calls: int = 10,
+        open_seconds: float = 15.0,
+        half_open_max_calls: int = 3
+    ):
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._window_seconds = window_seconds
+        self._min_calls = min_calls
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._calls: deque = deque()  # (시각, 실패 여부, 느린 호출 여부)
+        self._opened_at = 0.0
+        self._half_open_since = 0.0
+        self._half_open_calls = 0  # half-open에서 허용한 시험 호출 수
+        self._half_open_successes = 0
+        self._open_count = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """
+        현재 상태 (open 대기 시간이 지나면 half-open)
+        half-open에서 결과가 오지 않은 채 open_seconds가 지나면 시험 호출을 다시 허용
+        """
+        now = time.time()
+        if (
+            (self._state == self.OPEN and now - self._opened_at >= self._open_seconds)
+            or (self._state == self.HALF_OPEN and now - self._half_open_since >= self._open_seconds)
+        ):
+            self._state = self.HALF_OPEN
+            self._half_open_since = now
+            self._half_open_calls = 0
+            self._half_open_successes = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half-open에서는 시험 호출 수 제한)"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._half_open_calls < self._half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self, elapsed: float) -> None:
+        if self._state == self.HALF_OPEN:
+            self._half_open_successes += 1
+            if self._half_open_successes >= self._half_open_max_calls:
+                self._close()
+            return
+        self._record(failed=False, slow=elapsed >= self._slow_call_seconds)
+
+    def record_failure(self, elapsed: float) -> None:
+        if self._state == self.HALF_OPEN:
+            self._open()
+            return
+        self._record(failed=True, slow=elapsed >= self._slow_call_seconds)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self._state != self.CLOSED:
+            return  # open 전에 시작된 호출의 늦은 결과는 무시
+
+        now = time.time()
+        self._calls.append((now, failed, slow))
+        while self._calls and self._calls[0][0] < now - self._window_seconds:
+            self._calls.popleft()
+
+        if len(self._calls) < self._min_calls:
+            return
+        failure_rate, slow_rate = self._rates()
+        if failure_rate >= self._failure_rate_threshold or slow_rate >= self._slow_call_rate_threshold:
+            self._open()
+
+    def _rates(self) -> Tuple[float, float]:
+        total = len(self._calls)
+        if not total:
+            return 0.0, 0.0
+        failures = sum(1 for _, failed, _ in self._calls if failed)
+        slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+        return failures / total, slow / total
+
+    def _open(self) -> None:
+        failure_rate, slow_rate = self._rates()
+        self._state = self.OPEN
+        self._opened_at = time.time()
+        self._open_count += 1
+        self._calls.clear()
+        logger.warning(
+            f"Redis circuit opened for {self._open_seconds}s "
+            f"(failure_rate={failure_rate:.2f}, slow_rate={slow_rate:.2f})"
+        )
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._calls.clear()
+        logger.info("Redis circuit closed")
+
+    def force_open(self) -> None:
+        """연결 끊김 등 확실한 장애 (재연결 성공 시 reset)"""
+        if self._state != self.OPEN:
+            self._open()
+
+    def reset(self) -> None:
+        self._close()
+
+    def stats(self) -> dict:
+        state = self.state
+        failure_rate, slow_rate = self._rates()
+        return {
+            "state": state,
+            "window_calls": len(self._calls),
+            "failure_rate": round(failure_rate, 3),
+            "slow_call_rate": round(slow_rate, 3),
+            "open_count": self._open_count,
+            "rejected_calls": self._rejected,
+            "retry_in_seconds": (
+                round(max(0.0, self._opened_at + self._open_seconds - time.time()), 1)
+                if state == self.OPEN else None
+            )
+        }
+
+
 # ============================================================
 # L2: Redis 캐시
 # ============================================================
@@ -269,14 +995,60 @@ class RedisCache:
     - 연결 풀링
     - 자동 재연결 (exponential backoff)
     - 연결 실패 시 graceful degradation
+    - 분산 락 (워커 간 Stampede 방지)
     """
 
+    LOCK_PREFIX = "lock:"
+    TAG_PREFIX = "tag:"
+    KEY_TAGS_PREFIX = "keytags:"  # 키별 태그 목록 (L1 승격 시 태그 복원용)
+    # 자신이 잡은 락만 해제 (만료 후 다른 워커가 잡은 락 보호)
+    _RELEASE_LOCK_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    # KEYS[1]: 키별 태그 목록, KEYS[2..]: 태그 집합
+    # 태그 집합에 키 추가, 집합 TTL은 가장 오래 사는 멤버 기준으로 연장
+    _TAG_KEY_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+redis.call('set', KEYS[1], ARGV[3], 'EX', ttl)
+for i = 2, #KEYS do
+    redis.call('sadd', KEYS[i], ARGV[1])
+    if redis.call('ttl', KEYS[i]) < ttl then
+        redis.call('expire', KEYS[i], ttl)
+    end
+end
+return #KEYS - 1
+"""
+    # 태그 집합의 멤버 키(+ 태그 목록)와 집합 자체를 삭제, 실제 삭제된 키 목록 반환 (중복 제외)
+    _INVALIDATE_TAGS_SCRIPT = """
+local seen = {}
+local deleted = {}
+for _, tag_key in ipairs(KEYS) do
+    for _, member in ipairs(redis.call('smembers', tag_key)) do
+        if not seen[member] then
+            seen[member] = true
+            if redis.call('del', member) == 1 then
+                table.insert(deleted, member)
+            end
+            redis.call('del', ARGV[1] .. member)
+        end
+    end
+    redis.call('del', tag_key)
+end
+return deleted
+"""
+
     def __init__(
         self,
         url: str = "redis://localhost:6379/0",
         max_connections: int = 10,
-        socket_timeout: float = 5.0
+        socket_timeout: float = 5.0,
+        codec: Optional[CacheCodec] = None,
+        breaker: Optional[CircuitBreaker] = None
     ):
+        self._codec = codec or PickleCodec()
+        self._breaker = breaker or CircuitBreaker()
         self._url = url
         self._max_connections = max_connections
         self._socket_timeout = socket_timeout
@@ -284,7 +1056,8 @@ class RedisCache:
         self._connected = False
         self._stats = CacheStats()
         self._reconnect_attempts = 0
-        self._max_reconnect_attempts = 5
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._redis_installed = True
         self._base_backoff = 1.0
         self._max_backoff = 60.0
 
@@ -301,10 +1074,12 @@ class RedisCache:
             await self._client.ping()
             self._connected = True
             self._reconnect_attempts = 0
+            self._breaker.reset()
             logger.info("Redis connected successfully")
             return True
         except ImportError:
             logger.warning("redis package not installed, L2 cache disabled")
+            self._redis_installed = False
             return False
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}")
@@ -313,6 +1088,9 @@ class RedisCache:
 
     async def disconnect(self) -> None:
         """Redis 연결 종료"""
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
         if self._client:
             await self._client.close()
             self._connected = False
@@ -320,14 +1098,27 @@ class RedisCache:
 
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회"""
-        if not self._connected:
+        data = await self.get_encoded(key)
+        if data is None:
             return None
 
         try:
-            data = await self._client.get(key)
+            return self._codec.decode(data)
+        except Exception as e:
+            logger.warning(f"Redis cache decode error for key {key}: {e}")
+            self._stats.errors += 1
+            return None
+
+    async def get_encoded(self, key: str) -> Optional[bytes]:
+        """캐시에서 직렬화된 바이트 그대로 조회"""
+        if not self._available():
+            return None
+
+        try:
+            data = await self._run(self._client.get(key))
             if data:
                 self._stats.hits += 1
-                return pickle.loads(data)
+                return data
             self._stats.misses += 1
             return None
         except Exception as e:
@@ -335,14 +1126,45 @@ class RedisCache:
             await self._handle_error(e)
             return None
 
+    async def get_encoded_with_tags(self, key: str) -> Tuple[Optional[bytes], Tuple[str, ...]]:
+        """직렬화된 바이트와 태그 목록을 한 번의 MGET으로 조회"""
+        if not self._available():
+            return None, ()
+
+        try:
+            data, raw_tags = await self._run(
+                self._client.mget(key, f"{self.KEY_TAGS_PREFIX}{key}")
+            )
+            if not data:
+                self._stats.misses += 1
+                return None, ()
+            self._stats.hits += 1
+            return data, tuple(json.loads(raw_tags)) if raw_tags else ()
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return None, ()
+
     async def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
         """캐시에 값 저장"""
         if not self._connected:
             return False
 
         try:
-            serialized = pickle.dumps(value)
-            await self._client.setex(key, ttl_seconds, serialized)
+            data = self._codec.encode(value)
+        except Exception as e:
+            logger.warning(f"Redis cache encode error for key {key}: {e}")
+            self._stats.errors += 1
+            return False
+        return await self.set_encoded(key, data, ttl_seconds)
+
+    async def set_encoded(self, key: str, data: bytes, ttl_seconds: int = 300) -> bool:
+        """이미 직렬화된 바이트 저장 (재직렬화 없음)"""
+        if not self._available():
+            return False
+
+        try:
+            await self._run(self._client.setex(key, ttl_seconds, data))
             self._stats.sets += 1
             return True
         except Exception as e:
@@ -350,13 +1172,72 @@ class RedisCache:
             await self._handle_error(e)
             return False
 
+    async def get_many_encoded_with_tags(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Tuple[bytes, Tuple[str, ...]]]:
+        """여러 키의 바이트와 태그 목록을 한 번의 MGET으로 조회 (없는 키는 제외)"""
+        if not keys or not self._available():
+            return {}
+
+        try:
+            tag_keys = [f"{self.KEY_TAGS_PREFIX}{key}" for key in keys]
+            values = await self._run(self._client.mget(*keys, *tag_keys))
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return {}
+
+        found = {}
+        for key, data, raw_tags in zip(keys, values[:len(keys)], values[len(keys):]):
+            if data:
+                found[key] = (data, tuple(json.loads(raw_tags)) if raw_tags else ())
+        self._stats.hits += len(found)
+        self._stats.misses += len(keys) - len(found)
+        return found
+
+    async def set_many_encoded(
+        self,
+        items: Dict[str, bytes],
+        ttl_seconds: int = 300,
+        tags: Optional[Dict[str, List[str]]] = None
+    ) -> bool:
+        """여러 키를 파이프라인 1회로 저장 (SETEX + 태그 등록)"""
+        if not items or not self._available():
+            return False
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, data in items.items():
+                pipe.setex(key, ttl_seconds, data)
+                key_tags = (tags or {}).get(key)
+                if key_tags:
+                    script_keys = [f"{self.KEY_TAGS_PREFIX}{key}"] + [
+                        f"{self.TAG_PREFIX}{tag}" for tag in key_tags
+                    ]
+                    pipe.eval(
+                        self._TAG_KEY_SCRIPT, len(script_keys), *script_keys,
+                        key, ttl_seconds, json.dumps(key_tags)
+                    )
+            await self._run(pipe.execute())
+            self._stats.sets += len(items)
+            return True
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return False
+
+    @property
+    def codec(self) -> CacheCodec:
+        return self._codec
+
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
-        if not self._connected:
+        if not self._available():
             return False
 
         try:
-            result = await self._client.delete(key)
+            result = await self._run(self._client.delete(key))
             if result:
                 self._stats.deletes += 1
             return result > 0
@@ -367,11 +1248,11 @@ class RedisCache:
 
     async def clear(self) -> int:
         """전체 캐시 삭제"""
-        if not self._connected:
+        if not self._available():
             return 0
 
         try:
-            await self._client.flushdb()
+            await self._run(self._client.flushdb())
             return -1  # Redis doesn't return count on flush
         except Exception as e:
             self._stats.errors += 1
@@ -380,15 +1261,13 @@ class RedisCache:
 
     async def clear_pattern(self, pattern: str) -> int:
         """패턴에 매칭되는 키 삭제"""
-        if not self._connected:
+        if not self._available():
             return 0
 
         try:
-            keys = []
-            async for key in self._client.scan_iter(match=pattern):
-                keys.append(key)
+            keys = await self._run(self._scan(pattern))
             if keys:
-                await self._client.delete(*keys)
+                await self._run(self._client.delete(*keys))
             return len(keys)
         except Exception as e:
             self._stats.errors += 1
@@ -397,51 +1276,328 @@ class RedisCache:
 
     async def keys(self, pattern: str = "*") -> List[str]:
         """패턴에 매칭되는 키 목록"""
-        if not self._connected:
+        if not self._available():
+            return []
+
+        try:
+            keys = await self._run(self._scan(pattern))
+            return [key.decode() if isinstance(key, bytes) else key for key in keys]
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return []
+
+    async def tag_key(self, key: str, tags: Iterable[str], ttl_seconds: int) -> bool:
+        """키를 태그 집합(Redis Set)에 등록하고 키별 태그 목록 저장"""
+        tags = list(tags)
+        if not tags or not self._available():
+            return False
+
+        script_keys = [f"{self.KEY_TAGS_PREFIX}{key}"] + [f"{self.TAG_PREFIX}{tag}" for tag in tags]
+        try:
+            await self._run(self._client.eval(
+                self._TAG_KEY_SCRIPT, len(script_keys), *script_keys,
+                key, ttl_seconds, json.dumps(tags)
+            ))
+            return True
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return False
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그가 붙은 모든 키 삭제 (O(k), SCAN 없음) - 삭제된 키 목록 반환"""
+        tag_keys = [f"{self.TAG_PREFIX}{tag}" for tag in tags]
+        if not tag_keys or not self._available():
             return []
 
         try:
-            keys = []
-            async for key in self._client.scan_iter(match=pattern):
-                keys.append(key.decode() if isinstance(key, bytes) else key)
-            return keys
+            deleted = await self._run(self._client.eval(
+                self._INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys, self.KEY_TAGS_PREFIX
+            ))
+            self._stats.deletes += len(deleted)
+            return [key.decode() if isinstance(key, bytes) else key for key in deleted]
         except Exception as e:
             self._stats.errors += 1
             await self._handle_error(e)
             return []
 
+    async def acquire_lock(self, key: str, ttl_seconds: float = 60.0) -> Optional[str]:
+        """분산 락 획득 (SET NX PX) - 성공 시 해제용 토큰 반환"""
+        if not self._available():
+            return None
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._run(self._client.set(
+                f"{self.LOCK_PREFIX}{key}",
+                token,
+                nx=True,
+                px=int(ttl_seconds * 1000)
+            ))
+            return token if acquired else None
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return None
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """분산 락 해제 (토큰이 일치할 때만 삭제)"""
+        if not self._available():
+            return False
+
+        try:
+            result = await self._run(self._client.eval(
+                self._RELEASE_LOCK_SCRIPT, 1, f"{self.LOCK_PREFIX}{key}", token
+            ))
+            return bool(result)
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return False
+
+    async def publish(self, channel: str, message: bytes) -> bool:
+        """채널에 메시지 발행"""
+        if not self._available():
+            return False
+
+        try:
+            await self._run(self._client.publish(channel, message))
+            return True
+        except Exception as e:
+            self._stats.errors += 1
+            await self._handle_error(e)
+            return False
+
+    def pubsub(self):
+        """구독용 PubSub 객체 (전용 연결 사용)"""
+        if not self._connected:
+            return None
+        return self._client.pubsub()
+
     @property
     def stats(self) -> CacheStats:
         return self._stats
 
     @property
-    def is_connected(self) -> bool:
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @property
+    def is_socket_connected(self) -> bool:
+        """서킷 상태와 무관한 연결 여부"""
         return self._connected
 
+    @property
+    def is_connected(self) -> bool:
+        """연결되어 있고 서킷이 열려 있지 않음 (open이면 호출 없이 즉시 실패)"""
+        return self._connected and self._breaker.state != CircuitBreaker.OPEN
+
+    def _available(self) -> bool:
+        """호출 가능 여부 (half-open 시험 호출 수 차감)"""
+        return self._connected and self._breaker.allow()
+
+    async def _run(self, awaitable: Awaitable[Any]) -> Any:
+        """Redis 호출 실행 + 서킷 브레이커에 결과/지연 기록 (타임아웃 취소도 실패로 기록)"""
+        started = time.perf_counter()
+        try:
+            result = await awaitable
+        except BaseException:
+            self._breaker.record_failure(time.perf_counter() - started)
+            raise
+        self._breaker.record_success(time.perf_counter() - started)
+        return result
+
+    async def _scan(self, pattern: str) -> List[Any]:
+        return [key async for key in self._client.scan_iter(match=pattern)]
+
     async def _handle_error(self, error: Exception) -> None:
-        """에러 처리 및 재연결 시도"""
-        logger.warning(f"Redis error: {error}")
-        if "Connection" in str(error) or "Timeout" in str(error):
+        """에러 처리 - 연결 계열 에러면 서킷을 열고 재연결 시작"""
+        logger.warning(f"Redis error: {type(error).__name__}: {error}")
+        if self._is_connection_error(error):
             self._connected = False
-            asyncio.create_task(self._reconnect_with_backoff())
+            self._breaker.force_open()
+            self.start_reconnect()
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """redis.exceptions.ConnectionError / TimeoutError, OSError, asyncio 타임아웃"""
+        if isinstance(error, (ConnectionError, TimeoutError, OSError, asyncio.TimeoutError)):
+            return True
+        return any(
+            name in cls.__name__
+            for cls in type(error).__mro__
+            for name in ("Connection", "Timeout")
+        )
+
+    def start_reconnect(self) -> None:
+        """백그라운드 재연결 시작 (이미 진행 중이면 무시)"""
+        if not self._redis_installed:
+            return
+        if self._reconnect_task and not self._reconnect_task.done():
+            return
+        try:
+            self._reconnect_task = asyncio.get_running_loop().create_task(
+                self._reconnect_with_backoff()
+            )
+        except RuntimeError:
+            pass
 
     async def _reconnect_with_backoff(self) -> None:
-        """Exponential backoff으로 재연결"""
-        if self._reconnect_attempts >= self._max_reconnect_attempts:
-            logger.error("Max Redis reconnection attempts reached")
+        """연결될 때까지 exponential backoff (+ jitter)으로 재연결 - 최대 간격 max_backoff"""
+        while not self._connected:
+            delay = min(
+                self._base_backoff * (2 ** self._reconnect_attempts),
+                self._max_backoff
+            )
+            delay *= random.uniform(0.8, 1.2)
+            self._reconnect_attempts += 1
+
+            logger.info(f"Reconnecting to Redis in {delay:.1f}s (attempt {self._reconnect_attempts})")
+            await asyncio.sleep(delay)
+
+            if await self.connect():
+                logger.info("Redis reconnected successfully")
+
+
+# ============================================================
+# 워커 간 L1 무효화 버스 (Redis pub/sub)
+# ============================================================
+
+class CacheInvalidationBus:
+    """
+    워커 간 L1 무효화 전파
+    - 삭제/저장/패턴 삭제/태그 무효화를 채널로 발행 (발신 워커 ID 포함)
+    - 다른 워커의 메시지만 적용 (자신의 메시지는 무시)
+    - 구독이 끊겼다 복구되면 놓친 메시지가 있을 수 있으므로 L1 전체 삭제
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(
+        self,
+        l2_cache: RedisCache,
+        on_message: Callable[[dict], None],
+        on_resync: Callable[[], None],
+        channel: str = "cache:invalidate"
+    ):
+        self._l2 = l2_cache
+        self._on_message = on_message
+        self._on_resync = on_resync
+        self._channel = channel
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._listen_task: Optional[asyncio.Task] = None
+        self._listening = False
+        self.published = 0
+        self.received = 0
+
+    @property
+    def is_listening(self) -> bool:
+        return self._listening
+
+    def start(self) -> None:
+        """구독 시작"""
+        if self._listen_task and not self._listen_task.done():
             return
+        self._listen_task = asyncio.create_task(self._listen())
 
-        delay = min(
-            self._base_backoff * (2 ** self._reconnect_attempts),
-            self._max_backoff
-        )
-        self._reconnect_attempts += 1
+    async def stop(self) -> None:
+        """구독 중지"""
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+        self._listening = False
+
+    async def publish(
+        self,
+        op: str,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """
+        무효화 메시지 발행
+        op: delete (keys), clear (pattern, None이면 전체), tags (tags)
+        """
+        message = {"origin": self.worker_id, "op": op}
+        if keys is not None:
+            message["keys"] = keys
+        if pattern is not None:
+            message["pattern"] = pattern
+        if tags is not None:
+            message["tags"] = tags
+
+        ok = await self._l2.publish(self._channel, json.dumps(message).encode())
+        if ok:
+            self.published += 1
+        return ok
+
+    def handle(self, raw: bytes) -> bool:
+        """수신 메시지 처리 - 다른 워커의 메시지면 적용 후 True"""
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning("Invalid cache invalidation message ignored")
+            return False
 
-        logger.info(f"Reconnecting to Redis in {delay}s (attempt {self._reconnect_attempts})")
-        await asyncio.sleep(delay)
+        if message.get("origin") == self.worker_id:
+            return False
 
-        if await self.connect():
-            logger.info("Redis reconnected successfully")
+        self.received += 1
+        self._on_message(message)
+        return True
+
+    async def _listen(self) -> None:
+        """구독 루프 (연결 끊김 시 재구독)"""
+        resubscribe = False
+        while True:
+            pubsub = self._l2.pubsub()
+            if pubsub is None:
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            try:
+                await pubsub.subscribe(self._channel)
+                self._listening = True
+                if resubscribe:
+                    # 끊긴 동안 놓친 무효화가 있을 수 있음
+                    self._on_resync()
+                    logger.info("Cache invalidation bus resubscribed, L1 cleared")
+                else:
+                    logger.info(f"Cache invalidation bus subscribed ({self._channel})")
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=1.0
+                    )
+                    if message and message.get("type") == "message":
+                        self.handle(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation bus error: {e}")
+            finally:
+                self._listening = False
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+            resubscribe = True
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    def stats(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "listening": self._listening,
+            "published": self.published,
+            "received": self.received
+        }
 
 
 # ============================================================
@@ -453,29 +1609,52 @@ class CacheManager:
     통합 캐시 매니저
     - L1 (메모리) + L2 (Redis) 레이어드 캐싱
     - Stampede 방지
+    - Stale-While-Revalidate (선택)
+    - 워커 간 L1 무효화 버스 (선택)
     - 통계 추적
     - 기존 코드 호환 (동기 인터페이스)
     """
 
-    # 락 정리 설정
-    LOCK_CLEANUP_INTERVAL = 300  # 5분마다 정리
-    LOCK_MAX_AGE = 60  # 60초 이상 된 락 제거
-    MAX_LOCKS = 1000  # 최대 락 개수
+    # 분산 락 설정 (워커 간 Stampede 방지)
+    DISTRIBUTED_LOCK_TTL = 60  # 리더 워커가 죽어도 60초 후 락 해제
+    DISTRIBUTED_LOCK_WAIT = 30.0  # 다른 워커의 결과를 기다리는 최대 시간
+    DISTRIBUTED_LOCK_POLL_INTERVAL = 0.1
+
+    # L1 TTL (무효화 버스가 없을 때): L2 TTL의 1/5, 최소 60초
+    L1_TTL_RATIO = 0.2
+    L1_MIN_TTL = 60
 
     def __init__(
         self,
         l1_cache: Optional[MemoryCache] = None,
         l2_cache: Optional[RedisCache] = None,
-        enable_stampede_prevention: bool = True
+        enable_stampede_prevention: bool = True,
+        enable_swr: bool = False,
+        swr_stale_ratio: float = 1.0,
+        enable_early_refresh: bool = False,
+        early_refresh_beta: float = 1.0,
+        codec: Optional[CacheCodec] = None
     ):
-        self._l1 = l1_cache or MemoryCache()
+        self._codec = codec or PickleCodec()
+        self._metrics = CacheMetrics()
+        self._l1 = l1_cache or MemoryCache(codec=self._codec)
+        self._l1.on_evict = self._metrics.record_eviction
         self._l2 = l2_cache
+        self._disk: Optional[Any] = None  # DiskCache (L1과 L2 사이 영속 계층)
         self._enable_stampede_prevention = enable_stampede_prevention
-        self._locks: Dict[str, asyncio.Lock] = {}
-        self._lock_timestamps: Dict[str, float] = {}  # 락 생성 시간 추적
+        self._enable_swr = enable_swr
+        self._swr_stale_ratio = swr_stale_ratio  # stale 구간 = TTL * ratio
+        self._enable_early_refresh = enable_early_refresh
+        self._early_refresh_beta = early_refresh_beta  # 클수록 더 일찍 갱신
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}  # 키별 백그라운드 갱신 작업
+        self._janitor_task: Optional[asyncio.Task] = None
+        self._bus: Optional[CacheInvalidationBus] = None
+        self._bus_l1_ttl_ratio = 1.0  # 버스 구독 중일 때 L1 TTL = L2 TTL * ratio
+        self._negative_ttl = 300  # 없는 종목 / 빈 결과
+        self._negative_error_ttl = 30  # 업스트림 실패
+        self._inflight: Dict[str, asyncio.Future] = {}  # 키별 진행 중인 factory 결과 (완료 시 제거)
         self._start_time = time.time()
         self._last_cleared: Optional[datetime] = None
-        self._last_lock_cleanup: float = time.time()
         self._backend_mode = "memory"
 
     async def initialize(
@@ -483,22 +1662,200 @@ class CacheManager:
         backend: str = "memory",
         redis_url: str = "redis://localhost:6379/0",
         max_entries: int = 1000,
-        max_memory_mb: int = 100
+        max_memory_mb: int = 100,
+        l1_admission: str = "lru",
+        l1_window_ratio: float = 0.01,
+        l1_compress_min_bytes: int = 0,
+        enable_swr: bool = False,
+        swr_stale_ratio: float = 1.0,
+        enable_early_refresh: bool = False,
+        early_refresh_beta: float = 1.0,
+        codec: str = "pickle",
+        compression: Optional[str] = None,
+        compression_min_bytes: int = 1024,
+        enable_invalidation_bus: bool = False,
+        invalidation_channel: str = "cache:invalidate",
+        bus_l1_ttl_ratio: float = 1.0,
+        shared_path: Optional[str] = None,
+        shared_slot_size: int = 64 * 1024,
+        enable_disk_tier: bool = False,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 10000,
+        disk_preload_keys: int = 200,
+        breaker_settings: Optional[Dict[str, Any]] = None,
+        negative_ttl: int = 300,
+        negative_error_ttl: int = 30
     ) -> None:
         """캐시 매니저 초기화"""
         self._backend_mode = backend
-        self._l1 = MemoryCache(max_entries=max_entries, max_memory_mb=max_memory_mb)
+        self._negative_ttl = negative_ttl
+        self._negative_error_ttl = negative_error_ttl
+        self._codec = get_codec(
+            codec,
+            compression=compression,
+            compression_min_bytes=compression_min_bytes
+        )
+        self._enable_swr = enable_swr
+        self._swr_stale_ratio = swr_stale_ratio
+        self._enable_early_refresh = enable_early_refresh
+        self._early_refresh_beta = early_refresh_beta
+        self._l1 = None
+        if backend == "shared":
+            self._l1 = self._open_shared_l1(
+                max_entries, max_memory_mb, shared_path, shared_slot_size
+            )
+        if self._l1 is None:
+            self._l1 = MemoryCache(
+                max_entries=max_entries,
+                max_memory_mb=max_memory_mb,
+                codec=self._codec,
+                admission=l1_admission,
+                window_ratio=l1_window_ratio,
+                compress_min_bytes=l1_compress_min_bytes
+            )
+        self._l1.on_evict = self._metrics.record_eviction
+
+        if enable_disk_tier:
+            self._disk = self._open_disk_tier(disk_path, disk_max_entries)
+            if self._disk and disk_preload_keys > 0:
+                self.preload_from_disk(disk_preload_keys)
 
         if backend in ("redis", "layered"):
-            self._l2 = RedisCache(url=redis_url)
-            await self._l2.connect()
+            self._l2 = RedisCache(
+                url=redis_url,
+                codec=self._codec,
+                breaker=CircuitBreaker(**(breaker_settings or {}))
+            )
+            if not await self._l2.connect():
+                # 시작 시 Redis가 없어도 L1로 동작하면서 계속 재연결 시도
+                self._l2.start_reconnect()
+
+        # 워커별 L1이 있는 layered 모드에서만 의미 있음
+        if enable_invalidation_bus and backend == "layered":
+            self.start_invalidation_bus(invalidation_channel, bus_l1_ttl_ratio)
+
+        logger.info(
+            f"Cache manager initialized (backend={backend}, codec={self._codec.name}, "
+            f"l1_admission={l1_admission}, disk_tier={self._disk is not None}, "
+            f"swr={enable_swr}, early_refresh={enable_early_refresh}, "
+            f"invalidation_bus={self._bus is not None})"
+        )
 
-        logger.info(f"Cache manager initialized (backend={backend})")
+    def _open_shared_l1(
+        self,
+        max_entries: int,
+        max_memory_mb: int,
+        path: Optional[str],
+        slot_size: int
+    ) -> Optional[Any]:
+        """공유 메모리 L1 생성 (fcntl/mmap 미지원 환경이면 None → 워커별 MemoryCache)"""
+        try:
+            from services.shared_memory_cache import SharedMemoryCache
+            return SharedMemoryCache(
+                max_entries=max_entries,
+                max_memory_mb=max_memory_mb,
+                codec=self._codec,
+                path=path,
+                slot_size=slot_size
+            )
+        except (ImportError, OSError) as e:
+            logger.warning(f"Shared memory cache unavailable, falling back to memory: {e}")
+            return None
+
+    @staticmethod
+    def _open_disk_tier(path: Optional[str], max_entries: int) -> Optional[Any]:
+        """디스크 계층 생성 (실패 시 None → 디스크 계층 없이 동작)"""
+        try:
+            from services.disk_cache import DiskCache
+            return DiskCache(path=path, max_entries=max_entries)
+        except Exception as e:
+            logger.warning(f"Disk cache tier unavailable: {e}")
+            return None
+
+    def preload_from_disk(self, limit: int) -> int:
+        """디스크 계층에서 조회 수가 많은 키 limit개를 L1에 적재 (warm restart)"""
+        if not self._disk:
+            return 0
+        loaded = 0
+        for key, data, tags, remaining in self._disk.hottest(limit):
+            try:
+                self._promote(key, data, tags, max_ttl=remaining)
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Disk cache decode error for key {key}: {e}")
+        logger.info(f"Preloaded {loaded} keys from disk cache tier")
+        return loaded
+
+    def start_invalidation_bus(
+        self,
+        channel: str = "cache:invalidate",
+        l1_ttl_ratio: float = 1.0
+    ) -> None:
+        """워커 간 L1 무효화 버스 구독 시작 (L2 필요)"""
+        if self._bus or not self._l2:
+            return
+        self._bus_l1_ttl_ratio = l1_ttl_ratio
+        self._bus = CacheInvalidationBus(
+            self._l2,
+            on_message=self._apply_invalidation,
+            on_resync=self._l1.clear,
+            channel=channel
+        )
+        self._bus.start()
+
+    def start_janitor(self, interval_seconds: float = 5.0, batch_size: int = 500) -> None:
+        """L1 만료 엔트리 백그라운드 정리 시작"""
+        if self._janitor_task and not self._janitor_task.done():
+            return
+        self._janitor_task = asyncio.create_task(
+            self._run_janitor(interval_seconds, batch_size)
+        )
+        logger.info(f"Cache janitor started (interval={interval_seconds}s, batch={batch_size})")
+
+    async def stop_janitor(self) -> None:
+        """L1 만료 엔트리 백그라운드 정리 중지"""
+        if self._janitor_task:
+            self._janitor_task.cancel()
+            try:
+                await self._janitor_task
+            except asyncio.CancelledError:
+                pass
+            self._janitor_task = None
+
+    async def _run_janitor(self, interval_seconds: float, batch_size: int) -> None:
+        """batch_size 단위로 나눠 정리 (슬라이스 사이에 이벤트 루프 양보)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                total = 0
+                while True:
+                    total += self._l1.cleanup_expired(max_items=batch_size)
+                    if not self._l1.has_expired_entries:
+                        break
+                    await asyncio.sleep(0)
+                if self._disk:
+                    total += self._disk.cleanup_expired()
+                if total:
+                    logger.debug(f"Cache janitor removed {total} expired entries")
+            except Exception as e:
+                logger.warning(f"Cache janitor error: {e}")
 
     async def shutdown(self) -> None:
         """캐시 매니저 종료"""
+        await self.stop_janitor()
+        if self._bus:
+            await self._bus.stop()
+            self._bus = None
+
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+
         if self._l2:
             await self._l2.disconnect()
+        if self._disk:
+            self._disk.close()
+            self._disk = None
         logger.info("Cache manager shutdown")
 
     # ---- 동기 인터페이스 (기존 코드 호환) ----
@@ -506,18 +1863,25 @@ class CacheManager:
     def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회 (동기)"""
         # L1에서만 조회 (동기)
-        return self._l1.get(key)
+        value = self._timed_l1_get(key)
+        self._metrics.record_lookup(key, value is not None)
+        return self._unwrap(value)
 
     def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
         """캐시에 값 저장 (동기)"""
-        self._l1.set(key, value, ttl_seconds)
+        data, raw_size = self._encode(value)
+        self._l1.set(key, value, ttl_seconds, size_bytes=raw_size, encoded=data)
+        self._metrics.record_set(key, raw_size)
+        if data is not None and self._disk:
+            self._disk.set_encoded(key, data, ttl_seconds)
 
         # L2에 비동기 저장 (백그라운드)
-        if self._l2 and self._l2.is_connected:
+        if data is not None and self._l2 and self._l2.is_connected:
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
-                    asyncio.create_task(self._l2.set(key, value, ttl_seconds))
+                    asyncio.create_task(self._l2.set_encoded(key, data, ttl_seconds))
+                    self._broadcast_background("delete", keys=[key])
             except RuntimeError:
                 pass
 
@@ -530,6 +1894,7 @@ class CacheManager:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
                     asyncio.create_task(self._l2.delete(key))
+                    self._broadcast_background("delete", keys=[key])
             except RuntimeError:
                 pass
 
@@ -543,6 +1908,7 @@ class CacheManager:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
                     asyncio.create_task(self._l2.clear())
+                    self._broadcast_background("clear")
             except RuntimeError:
                 pass
 
@@ -554,47 +1920,286 @@ class CacheManager:
 
     async def aget(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회 (비동기)"""
-        # L1 먼저
+        return self._unwrap(await self._aget_raw(key))
+
+    async def _aget_raw(self, key: str, record: bool = True) -> Optional[Any]:
+        """
+        L1 → 디스크 → L2 순서로 저장된 값 그대로 조회 (SWRValue 포함)
+        record: 키 계열별 히트/미스 기록 (get_or_set 내부 재확인은 중복 집계하지 않음)
+        """
+        value = await self._lookup(key)
+        if record:
+            self._metrics.record_lookup(
+                key, value is not None, negative=isinstance(value, NegativeResult)
+            )
+        return value
+
+    def _timed_l1_get(self, key: str) -> Optional[Any]:
+        started = time.perf_counter()
         value = self._l1.get(key)
+        self._metrics.observe("l1_get", time.perf_counter() - started)
+        return value
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        # L1 먼저
+        value = self._timed_l1_get(key)
         if value is not None:
             return value
 
+        # 디스크 계층 확인 (Redis 장애 시에도 동작)
+        if self._disk:
+            started = time.perf_counter()
+            data, tags, remaining = self._disk.get_encoded_with_tags(key)
+            self._metrics.observe("disk_get", time.perf_counter() - started)
+            if data is not None:
+                try:
+                    return self._promote(key, data, tags, max_ttl=remaining)
+                except Exception as e:
+                    logger.warning(f"Disk cache decode error for key {key}: {e}")
+
         # L2 확인
         if self._l2 and self._l2.is_connected:
+            started = time.perf_counter()
             try:
-                value = await asyncio.wait_for(
-                    self._l2.get(key),
+                data, tags = await asyncio.wait_for(
+                    self._l2.get_encoded_with_tags(key),
                     timeout=1.0
                 )
-                if value is not None:
-                    # L1에 채우기 (짧은 TTL)
-                    self._l1.set(key, value, ttl_seconds=60)
-                    return value
+                self._metrics.observe("l2_get", time.perf_counter() - started)
+                if data is not None:
+                    return self._promote(key, data, tags)
             except asyncio.TimeoutError:
+                self._metrics.observe("l2_get", time.perf_counter() - started)
                 logger.warning(f"L2 cache timeout for key: {key}")
             except Exception as e:
                 logger.warning(f"L2 cache error: {e}")
 
         return None
 
-    async def aset(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
-        """캐시에 값 저장 (비동기)"""
-        # L1에 짧은 TTL (1/5)
-        l1_ttl = max(60, ttl_seconds // 5)
-        self._l1.set(key, value, l1_ttl)
+    def _promote(
+        self,
+        key: str,
+        data: bytes,
+        tags: Tuple[str, ...],
+        max_ttl: Optional[float] = None
+    ) -> Any:
+        """
+        L2 / 디스크 바이트를 역직렬화해 L1에 채우기 (짧은 TTL, SWRValue는 최소 soft 만료까지)
+        max_ttl: 하위 계층의 남은 TTL (L1이 더 오래 남지 않도록)
+        """
+        value, raw_size = self._codec.decode_sized(data)
+        l1_ttl = self.L1_MIN_TTL
+        if isinstance(value, SWRValue):
+            l1_ttl = max(l1_ttl, int(value.soft_expires_at - time.time()))
+        if max_ttl is not None:
+            l1_ttl = max(1, min(l1_ttl, int(max_ttl)))
+        self._l1.set(
+            key, value, ttl_seconds=l1_ttl, size_bytes=raw_size, tags=tags, encoded=data
+        )
+        return value
 
-        # L2에 전체 TTL
-        if self._l2 and self._l2.is_connected:
-            await self._l2.set(key, value, ttl_seconds)
+    async def aget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        여러 키 조회 (비동기) - L1 1회 순회 후 미스만 L2 MGET 1회
+        캐시에 없는 키는 결과에서 제외
+        """
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            value = self._timed_l1_get(key)
+            if value is not None:
+                found[key] = self._unwrap(value)
+            else:
+                missing.append(key)
+
+        if missing and self._disk:
+            started = time.perf_counter()
+            from_disk = self._disk.get_many_encoded_with_tags(missing)
+            self._metrics.observe("disk_get", time.perf_counter() - started)
+            for key, (data, tags, remaining) in from_disk.items():
+                try:
+                    found[key] = self._unwrap(self._promote(key, data, tags, max_ttl=remaining))
+                except Exception as e:
+                    logger.warning(f"Disk cache decode error for key {key}: {e}")
+            missing = [key for key in missing if key not in found]
+
+        if missing and self._l2 and self._l2.is_connected:
+            started = time.perf_counter()
+            try:
+                encoded = await asyncio.wait_for(
+                    self._l2.get_many_encoded_with_tags(missing),
+                    timeout=1.0
+                )
+                self._metrics.observe("l2_get", time.perf_counter() - started)
+                for key, (data, tags) in encoded.items():
+                    try:
+                        found[key] = self._unwrap(self._promote(key, data, tags))
+                    except Exception as e:
+                        logger.warning(f"L2 cache decode error for key {key}: {e}")
+            except asyncio.TimeoutError:
+                self._metrics.observe("l2_get", time.perf_counter() - started)
+                logger.warning(f"L2 cache timeout for {len(missing)} keys")
+            except Exception as e:
+                logger.warning(f"L2 cache error: {e}")
+
+        for key in unique_keys:
+            self._metrics.record_lookup(
+                key, key in found, negative=isinstance(found.get(key), NegativeResult)
+            )
+        return found
+
+    async def aset_many(
+        self,
+        items: Dict[str, Any],
+        ttl_seconds: int = 300,
+        tags: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        """
+        여러 키 저장 (비동기) - 키별 1회 직렬화, L2는 파이프라인 SETEX 1회
+        tags: 키별 태그 (예: {"stock_detail_AAPL": ["ticker:AAPL"]})
+        """
+        tags = tags or {}
+        encoded: Dict[str, bytes] = {}
+        for key, value in items.items():
+            data, raw_size = self._encode(value)
+            self._l1.set(
+                key, value, self._l1_ttl_for(value, ttl_seconds),
+                size_bytes=raw_size, tags=tags.get(key), encoded=data
+            )
+            self._metrics.record_set(key, raw_size, negative=isinstance(value, NegativeResult))
+            if data is not None:
+                encoded[key] = data
+
+        if encoded and self._disk:
+            self._disk.set_many_encoded(encoded, ttl_seconds, tags=tags)
+
+        if encoded and self._l2 and self._l2.is_connected:
+            started = time.perf_counter()
+            await self._l2.set_many_encoded(encoded, ttl_seconds, tags=tags)
+            self._metrics.observe("l2_set", time.perf_counter() - started)
+            await self._broadcast("delete", keys=list(encoded))
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Optional[List[str]] = None
+    ) -> None:
+        """
+        캐시에 값 저장 (비동기) - 1회 직렬화 후 L1 크기 계산과 L2 저장에 재사용
+        tags: invalidate_tags()로 함께 삭제할 태그 (예: ticker:AAPL)
+        """
+        data, raw_size = self._encode(value)
+
+        self._l1.set(
+            key, value, self._l1_ttl_for(value, ttl_seconds),
+            size_bytes=raw_size,
+            tags=tags,
+            encoded=data
+        )
+        self._metrics.record_set(key, raw_size, negative=isinstance(value, NegativeResult))
+
+        # 디스크 / L2에 전체 TTL
+        if data is not None and self._disk:
+            self._disk.set_encoded(key, data, ttl_seconds, tags=tags)
+        if data is not None and self._l2 and self._l2.is_connected:
+            started = time.perf_counter()
+            await self._l2.set_encoded(key, data, ttl_seconds)
+            if tags:
+                await self._l2.tag_key(key, tags, ttl_seconds)
+            self._metrics.observe("l2_set", time.perf_counter() - started)
+            # 다른 워커의 L1에 남은 이전 값 제거
+            await self._broadcast("delete", keys=[key])
+
+    def _l1_ttl_for(self, value: Any, ttl_seconds: int) -> int:
+        """
+        값 종류별 L1 TTL (버스 구독 중이면 다른 워커의 변경이 전파되므로 연장)
+        - SWRValue는 soft 만료 시각을 스스로 가지므로 hard TTL까지 유지해야 stale 반환/조기 갱신이 동작
+        - NegativeResult는 negative TTL 자체가 짧으므로 그대로 사용
+        """
+        if isinstance(value, (SWRValue, NegativeResult)):
+            return ttl_seconds
+        return self._l1_ttl(ttl_seconds)
+
+    def _l1_ttl(self, ttl_seconds: int) -> int:
+        """L2 TTL 기준 L1 TTL 계산"""
+        if self._bus and self._bus.is_listening:
+            return max(self.L1_MIN_TTL, int(ttl_seconds * self._bus_l1_ttl_ratio))
+        return max(self.L1_MIN_TTL, int(ttl_seconds * self.L1_TTL_RATIO))
+
+    async def _broadcast(self, op: str, **kwargs) -> None:
+        """무효화 버스로 발행 (버스 미사용 시 무시)"""
+        if self._bus:
+            await self._bus.publish(op, **kwargs)
+
+    def _broadcast_background(self, op: str, **kwargs) -> None:
+        """동기 인터페이스용 백그라운드 발행"""
+        if self._bus:
+            asyncio.create_task(self._bus.publish(op, **kwargs))
+
+    def _apply_invalidation(self, message: dict) -> None:
+        """다른 워커에서 온 무효화 메시지를 L1에 적용"""
+        op = message.get("op")
+        if op == "delete":
+            for key in message.get("keys", []):
+                self._l1.delete(key)
+        elif op == "clear":
+            pattern = message.get("pattern")
+            if pattern:
+                self._l1.clear_pattern(pattern)
+            else:
+                self._l1.clear()
+        elif op == "tags":
+            self._l1.invalidate_tags(message.get("tags", []))
+        else:
+            logger.warning(f"Unknown cache invalidation op: {op}")
+
+    async def invalidate_tags(self, tags: List[str], layers: List[str] = None) -> int:
+        """
+        태그가 붙은 모든 키를 L1 + L2에서 삭제 (삭제된 고유 키 수 반환)
+        디스크 계층은 l2 또는 disk 지정 시 함께 삭제
+        """
+        if layers is None:
+            layers = ["l1", "l2"]
+
+        deleted: Set[str] = set()
+        if "l1" in layers:
+            deleted.update(self._l1.invalidate_tags(tags))
+        if self._disk and ("l2" in layers or "disk" in layers):
+            deleted.update(self._disk.invalidate_tags(tags))
+        if "l2" in layers and self._l2 and self._l2.is_connected:
+            deleted.update(await self._l2.invalidate_tags(tags))
+        total = len(deleted)
+        if "l1" in layers:
+            await self._broadcast("tags", tags=tags)
+
+        logger.info(f"Invalidated tags {tags} ({total} keys)")
+        return total
+
+    def _encode(self, value: Any) -> Tuple[Optional[bytes], Optional[int]]:
+        """
+        코덱으로 직렬화 - (L2용 바이트, L1 크기용 비압축 크기)
+        실패 시 (None, None) - L1에만 저장 (크기는 L1에서 추정)
+        """
+        try:
+            return self._codec.encode_sized(value)
+        except Exception as e:
+            logger.warning(f"Cache encode error ({self._codec.name}): {e}")
+            return None, None
 
     async def adelete(self, key: str) -> None:
         """캐시에서 값 삭제 (비동기)"""
         self._l1.delete(key)
+        if self._disk:
+            self._disk.delete(key)
         if self._l2 and self._l2.is_connected:
             await self._l2.delete(key)
+        await self._broadcast("delete", keys=[key])
 
     async def aclear(self, pattern: Optional[str] = None, layers: List[str] = None) -> int:
-        """캐시 삭제 (비동기)"""
+        """캐시 삭제 (비동기) - 디스크 계층은 l2 또는 disk 지정 시 함께 삭제"""
         if layers is None:
             layers = ["l1", "l2"]
 
@@ -605,6 +2210,13 @@ class CacheManager:
                 total += self._l1.clear_pattern(pattern)
             else:
                 total += self._l1.clear()
+            await self._broadcast("clear", pattern=pattern)
+
+        if self._disk and ("l2" in layers or "disk" in layers):
+            if pattern:
+                total += self._disk.clear_pattern(pattern)
+            else:
+                total += self._disk.clear()
 
         if "l2" in layers and self._l2 and self._l2.is_connected:
             if pattern:
@@ -616,92 +2228,253 @@ class CacheManager:
         self._last_cleared = datetime.now()
         return total
 
-    def _cleanup_stale_locks(self) -> int:
-        """오래된 락 정리 (메모리 누수 방지)"""
-        current_time = time.time()
-
-        # 정리 주기 체크
-        if current_time - self._last_lock_cleanup < self.LOCK_CLEANUP_INTERVAL:
-            return 0
-
-        self._last_lock_cleanup = current_time
-        removed_count = 0
-
-        # 오래된 락 또는 최대 개수 초과 시 정리
-        keys_to_remove = []
-        for key, timestamp in list(self._lock_timestamps.items()):
-            # 오래된 락 제거
-            if current_time - timestamp > self.LOCK_MAX_AGE:
-                keys_to_remove.append(key)
-
-        # 최대 개수 초과 시 가장 오래된 것부터 제거
-        if len(self._locks) > self.MAX_LOCKS:
-            sorted_keys = sorted(
-                self._lock_timestamps.keys(),
-                key=lambda k: self._lock_timestamps.get(k, 0)
-            )
-            excess_count = len(self._locks) - self.MAX_LOCKS
-            keys_to_remove.extend(sorted_keys[:excess_count])
-
-        # 중복 제거 후 삭제
-        for key in set(keys_to_remove):
-            if key in self._locks and not self._locks[key].locked():
-                del self._locks[key]
-                if key in self._lock_timestamps:
-                    del self._lock_timestamps[key]
-                removed_count += 1
-
-        if removed_count > 0:
-            logger.debug(f"Cleaned up {removed_count} stale locks")
-
-        return removed_count
-
     async def get_or_set(
         self,
         key: str,
         factory: Callable[[], Awaitable[Any]],
-        ttl_seconds: int
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
     ) -> Any:
         """
         캐시에서 조회하거나 없으면 생성 후 저장
         Stampede 방지: 동시 요청 시 한 번만 factory 호출
+        - 워커 내부: 진행 중 Future 테이블 (첫 요청이 리더, 나머지는 리더의 결과 / 예외를 함께 받음)
+        - 워커 간: Redis 분산 락 (L2 연결 시)
+        SWR 모드: soft 만료된 값은 즉시 반환하고 factory로 백그라운드 갱신
+        조기 갱신 모드: 만료 전이라도 확률적으로 백그라운드 갱신 (XFetch)
         """
-        value = await self.aget(key)
-        if value is not None:
-            return value
+        cached = await self._aget_raw(key)
+        if cached is not None:
+            return self._serve(key, cached, factory, ttl_seconds, tags)
 
         if self._enable_stampede_prevention:
-            # 주기적으로 오래된 락 정리
-            self._cleanup_stale_locks()
+            return await self._single_flight(key, factory, ttl_seconds, tags)
 
-            if key not in self._locks:
-                self._locks[key] = asyncio.Lock()
-                self._lock_timestamps[key] = time.time()
+        value, elapsed = await self._compute(factory)
+        await self._store(key, value, ttl_seconds, elapsed, tags)
+        return value
 
-            async with self._locks[key]:
-                # Double-check
-                value = await self.aget(key)
+    async def _single_flight(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> Any:
+        """
+        워커 내부 single-flight
+        - 진행 중인 키면 리더의 Future를 기다림 (factory 예외도 모든 대기자에게 전달)
+        - 리더가 취소되면 대기자 중 하나가 새 리더가 됨
+        - 테이블 항목은 완료 즉시 제거 → 메모리는 진행 중인 키 수에 비례, 주기적 정리 없음
+        """
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # shield: 대기자 취소가 리더의 Future를 취소하지 않도록
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # 대기자 자신이 취소됨
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # Double-check (직전 리더가 방금 저장했을 수 있음)
+            cached = await self._aget_raw(key, record=False)
+            if cached is not None:
+                value = self._serve(key, cached, factory, ttl_seconds, tags)
+            else:
+                value = await self._load_with_distributed_lock(key, factory, ttl_seconds, tags)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _load_with_distributed_lock(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Redis 락을 잡은 워커만 factory 호출
+        나머지 워커는 L2에 값이 채워질 때까지 대기 (타임아웃 시 직접 호출)
+        """
+        token = None
+        if self._l2 and self._l2.is_connected:
+            deadline = time.time() + self.DISTRIBUTED_LOCK_WAIT
+            while True:
+                token = await self._l2.acquire_lock(key, self.DISTRIBUTED_LOCK_TTL)
+                if token is not None:
+                    break
+                if not self._l2.is_connected or time.time() >= deadline:
+                    logger.warning(f"Distributed lock wait timed out for key: {key}")
+                    break
+
+                await asyncio.sleep(self.DISTRIBUTED_LOCK_POLL_INTERVAL)
+                value = self._unwrap(await self._aget_raw(key, record=False))
                 if value is not None:
-                    # 락 사용 완료 후 타임스탬프 갱신
-                    self._lock_timestamps[key] = time.time()
                     return value
 
-                value = await factory()
-                await self.aset(key, value, ttl_seconds)
-                # 락 사용 완료 후 타임스탬프 갱신
-                self._lock_timestamps[key] = time.time()
-                return value
-        else:
-            value = await factory()
-            await self.aset(key, value, ttl_seconds)
+        try:
+            if token is not None:
+                # 락 획득 직전에 다른 워커가 저장했을 수 있음
+                value = self._unwrap(await self._aget_raw(key, record=False))
+                if value is not None:
+                    return value
+
+            value, elapsed = await self._compute(factory)
+            await self._store(key, value, ttl_seconds, elapsed, tags)
             return value
+        finally:
+            if token is not None:
+                await self._l2.release_lock(key, token)
+
+    async def _compute(self, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, float]:
+        """factory 실행 (결과, 소요 시간 초)"""
+        started = time.perf_counter()
+        value = await factory()
+        elapsed = time.perf_counter() - started
+        self._metrics.observe("factory", elapsed)
+        return value, elapsed
+
+    async def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int,
+        compute_seconds: float = 0.0,
+        tags: Optional[List[str]] = None
+    ) -> None:
+        """
+        get_or_set 결과 저장
+        SWR / 조기 갱신 모드면 soft 만료 시각과 factory 소요 시간을 함께 저장
+        NegativeResult는 negative TTL로 그대로 저장 (SWR 대상 아님)
+        """
+        if isinstance(value, NegativeResult):
+            await self.aset(key, value, self.negative_ttl(value), tags=tags)
+            return
+
+        if not (self._enable_swr or self._enable_early_refresh):
+            await self.aset(key, value, ttl_seconds, tags=tags)
+            return
+
+        stale_seconds = int(ttl_seconds * self._swr_stale_ratio) if self._enable_swr else 0
+        wrapped = SWRValue(
+            value=value,
+            soft_expires_at=time.time() + ttl_seconds,
+            compute_seconds=compute_seconds
+        )
+        await self.aset(key, wrapped, ttl_seconds + stale_seconds, tags=tags)
+
+    def negative_ttl(self, value: NegativeResult) -> int:
+        """부정 캐시 TTL (업스트림 실패는 더 짧게)"""
+        return self._negative_error_ttl if value.upstream_error else self._negative_ttl
+
+    def _serve(
+        self,
+        key: str,
+        cached: Any,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> Any:
+        """캐시 값 반환 (soft 만료 또는 조기 갱신 당첨 시 백그라운드 갱신 예약)"""
+        if not isinstance(cached, SWRValue):
+            return cached
+
+        if cached.is_stale or (
+            self._enable_early_refresh
+            and cached.should_refresh_early(self._early_refresh_beta)
+        ):
+            self._schedule_refresh(key, factory, ttl_seconds, tags)
+        return cached.value
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> None:
+        """키별로 하나의 백그라운드 갱신 작업만 실행"""
+        if key in self._refresh_tasks:
+            return
+
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self._refresh(key, factory, ttl_seconds, tags)
+            )
+        except RuntimeError:
+            return
+
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> None:
+        """백그라운드 갱신 (실패 시 stale 값 유지)"""
+        try:
+            if await self.refresh(key, factory, ttl_seconds, tags):
+                logger.debug(f"Background refresh completed for key: {key}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for key {key}: {e}")
+
+    async def refresh(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """
+        캐시 값과 무관하게 factory로 다시 계산해 저장 (백그라운드 갱신, 캐시 워머용)
+        다른 워커가 같은 키를 갱신 중이면 건너뜀 (False), factory 예외는 그대로 전파
+        """
+        token = None
+        if self._l2 and self._l2.is_connected:
+            token = await self._l2.acquire_lock(key, self.DISTRIBUTED_LOCK_TTL)
+            if token is None:
+                return False  # 다른 워커가 갱신 중
+
+        try:
+            value, elapsed = await self._compute(factory)
+            await self._store(key, value, ttl_seconds, elapsed, tags)
+            return True
+        finally:
+            if token is not None:
+                await self._l2.release_lock(key, token)
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """SWRValue면 실제 값만 반환"""
+        if isinstance(value, SWRValue):
+            return value.value
+        return value
 
     # ---- 통계 및 모니터링 ----
 
     def get_stats(self) -> dict:
         """캐시 통계 반환"""
         l1_stats = {
-            "backend": "memory",
+            "backend": "shared" if self._backend_mode == "shared" else "memory",
             "hits": self._l1.stats.hits,
             "misses": self._l1.stats.misses,
             "sets": self._l1.stats.sets,
@@ -728,40 +2501,105 @@ class CacheManager:
                 "connected": self._l2.is_connected
             }
 
+        disk_stats = None
+        if self._disk:
+            disk_stats = {
+                "backend": "disk",
+                "hits": self._disk.stats.hits,
+                "misses": self._disk.stats.misses,
+                "sets": self._disk.stats.sets,
+                "deletes": self._disk.stats.deletes,
+                "errors": self._disk.stats.errors,
+                "hit_rate": round(self._disk.stats.hit_rate, 2),
+                "key_count": self._disk.key_count,
+                "memory_usage_mb": round(self._disk.size_mb, 2),
+                "connected": True
+            }
+
         # 전체 히트율
-        total_hits = l1_stats["hits"] + (l2_stats["hits"] if l2_stats else 0)
-        total_misses = l1_stats["misses"] + (l2_stats["misses"] if l2_stats else 0)
+        lower_layers = [stats for stats in (disk_stats, l2_stats) if stats]
+        total_hits = l1_stats["hits"] + sum(stats["hits"] for stats in lower_layers)
+        total_misses = l1_stats["misses"] + sum(stats["misses"] for stats in lower_layers)
         combined_rate = (total_hits / (total_hits + total_misses) * 100) if (total_hits + total_misses) > 0 else 0
 
+        metrics = self._metrics.summary()
+        metrics["negative"].update(
+            ttl_seconds=self._negative_ttl,
+            error_ttl_seconds=self._negative_error_ttl
+        )
+
         return {
             "l1_stats": l1_stats,
             "l2_stats": l2_stats,
+            "disk_stats": disk_stats,
             "combined_hit_rate": round(combined_rate, 2),
             "uptime_seconds": round(time.time() - self._start_time, 2),
             "last_cleared": self._last_cleared.isoformat() if self._last_cleared else None,
-            "cache_backend": self._backend_mode
+            "cache_backend": self._backend_mode,
+            "invalidation_bus": self._bus.stats() if self._bus else None,
+            "l1_admission": self._l1.admission_stats(),
+            "l1_compression": self._l1.compression_stats(),
+            **metrics
         }
 
+    def prometheus_metrics(self, prefix: str = "noname_cache") -> str:
+        """Prometheus 텍스트 포맷 - 지연 히스토그램 / 키 계열 카운터 + 레이어별 카운터"""
+        stats = self.get_stats()
+        lines = [self._metrics.to_prometheus(prefix).rstrip("\n")]
+
+        layers = [("l1", stats["l1_stats"]), ("disk", stats["disk_stats"]), ("l2", stats["l2_stats"])]
+        for field_name in ("hits", "misses", "sets", "deletes", "errors"):
+            metric = f"{prefix}_layer_{field_name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for layer, layer_stats in layers:
+                if layer_stats:
+                    lines.append(f'{metric}{{layer="{layer}"}} {layer_stats[field_name]}')
+
+        lines.append(f"# TYPE {prefix}_l1_keys gauge")
+        lines.append(f"{prefix}_l1_keys {stats['l1_stats']['key_count']}")
+        lines.append(f"# TYPE {prefix}_l1_memory_bytes gauge")
+        lines.append(f"{prefix}_l1_memory_bytes {int(self._l1.memory_usage_mb * 1024 * 1024)}")
+
+        if self._l2:
+            circuit = self._l2.breaker.stats()
+            lines.append(f"# TYPE {prefix}_l2_circuit_state gauge")
+            for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+                value = 1 if circuit["state"] == state else 0
+                lines.append(f'{prefix}_l2_circuit_state{{state="{state}"}} {value}')
+            lines.append(f"# TYPE {prefix}_l2_circuit_open_total counter")
+            lines.append(f"{prefix}_l2_circuit_open_total {circuit['open_count']}")
+
+        return "\n".join(lines) + "\n"
+
     async def health_check(self) -> dict:
         """헬스 체크"""
         l1_ok = True  # 메모리는 항상 OK
         l2_ok = self._l2.is_connected if self._l2 else None
+        circuit = self._l2.breaker.stats() if self._l2 else None
 
         if l2_ok is None:
             status = "healthy"
             message = "L1 (memory) cache operational"
+            l2_status = None
         elif l2_ok:
             status = "healthy"
             message = "L1 + L2 cache operational"
+            l2_status = "healthy"
+        elif circuit["state"] == CircuitBreaker.OPEN and self._l2.is_socket_connected:
+            status = "degraded"
+            message = "L2 (Redis) circuit open (errors/slow calls), using L1 only"
+            l2_status = "circuit_open"
         else:
             status = "degraded"
-            message = "L2 (Redis) unavailable, using L1 only"
+            message = "L2 (Redis) unavailable, using L1 only (reconnecting)"
+            l2_status = "unavailable"
 
         return {
             "status": status,
             "l1_status": "healthy" if l1_ok else "unhealthy",
-            "l2_status": "healthy" if l2_ok else ("unavailable" if l2_ok is False else None),
+            "l2_status": l2_status,
             "l2_connected": l2_ok if l2_ok is not None else False,
+            "l2_circuit": circuit,
             "message": message
         }
 
@@ -790,8 +2628,21 @@ CACHE_KEY_TOP_N = "top_n_stocks_{type}_{count}"
 CACHE_KEY_NEWS = "news_{ticker}"
 CACHE_KEY_STOCK_DETAIL = "stock_detail_{ticker}"
 CACHE_KEY_CHART = "chart_{ticker}_{period}"
-CACHE_KEY_BRIEFING_LIST = "briefing_list_{page}_{limit}"
-CACHE_KEY_BRIEFING_DETAIL = "briefing_detail_{date}"
+CACHE_KEY_COMPARE_ITEM = "compare_item_{ticker}"
+# version: 브리핑 저장 파일 버전 (다른 프로세스가 저장하면 키가 바뀜)
+CACHE_KEY_BRIEFING_LIST = "briefing_list_{version}_{page}_{limit}"
+CACHE_KEY_BRIEFING_DETAIL = "briefing_detail_{version}_{date}"
+CACHE_KEY_SCREENER_SNAPSHOT = "screener_snapshot"  # trending / TOP N 공용 스크리너 스냅샷
+CACHE_KEY_MOMENTUM = "momentum_{ticker}_{date}"  # date: 거래일 (장 마감 시 다음 거래일)
+
+
+# ============================================================
+# 캐시 태그 (invalidate_tags용)
+# ============================================================
+
+CACHE_TAG_TICKER = "ticker:{ticker}"
+CACHE_TAG_SCREENER = "screener:{type}"
+CACHE_TAG_BRIEFINGS = "briefings"
 
 
 # ============================================================
@@ -0,0 +1,296 @@
+"""
+캐시 워머 (프로세스 내부)
+
+기능:
+- 서비스 계층을 직접 호출해 캐시를 미리 채움 (자기 자신에게 HTTP 요청하지 않음)
+- 선언적 워밍 세트: 각 API 모듈이 @cache_warmer.warm_set(이름)으로 (키, factory, TTL, 태그) 목록 등록
+- 세트 안의 작업은 세마포어로 동시 실행 수를 제한해 병렬 실행, 세트는 등록 순서대로 실행
+  (뒤 세트가 앞 세트의 캐시 결과를 읽을 수 있음, 예: TOP N 결과 → 종목 상세/차트)
+- 키별 재워밍 예약: TTL 만료 lead 초 전에 다시 계산 (기간별 TTL이 달라도 키마다 따로 예약)
+- 진행 상황 / 세트별 결과를 status()로 제공 (/api/cache/warmer)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from services.cache_service import cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmTask:
+    """워밍 작업 하나 (get_or_set과 같은 인자)"""
+    key: str
+    factory: Callable[[], Awaitable[Any]]
+    ttl_seconds: int
+    tags: Optional[List[str]] = None
+
+
+WarmSetBuilder = Callable[[], Awaitable[List[WarmTask]]]
+
+
+@dataclass
+class WarmSetStatus:
+    """워밍 세트별 마지막 실행 결과"""
+    name: str
+    runs: int = 0
+    tasks: int = 0          # 마지막 실행에서 빌더가 만든 작업 수
+    warmed: int = 0         # 계산 후 저장
+    skipped: int = 0        # 아직 재워밍 시각 전이거나 다른 워커가 갱신 중
+    failed: int = 0
+    last_error: Optional[str] = None
+    last_started_at: Optional[float] = None
+    last_duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "tasks": self.tasks,
+            "warmed": self.warmed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "last_error": self.last_error,
+            "last_started_at": self.last_started_at,
+            "last_duration_seconds": round(self.last_duration_seconds, 3),
+        }
+
+
+@dataclass
+class _Progress:
+    """현재 실행 중인 사이클 진행 상황"""
+    warm_set: Optional[str] = None
+    done: int = 0
+    total: int = 0
+    failed_keys: List[str] = field(default_factory=list)
+
+
+class CacheWarmer:
+    """
+    캐시 워머
+    - start() 후 백그라운드 루프: 사이클 실행 → 가장 이른 재워밍 시각까지 대기
+    - 재워밍 시각 = 저장 시각 + TTL - lead (TTL이 짧으면 최소 TTL의 절반 뒤)
+    - 실패한 키는 retry_seconds 뒤 재시도
+    """
+
+    def __init__(
+        self,
+        cache: Any = None,
+        concurrency: int = 4,
+        rewarm_lead_seconds: float = 30.0,
+        retry_seconds: float = 60.0,
+        idle_seconds: float = 60.0
+    ):
+        self._cache = cache
+        self._concurrency = concurrency
+        self._rewarm_lead_seconds = rewarm_lead_seconds
+        self._retry_seconds = retry_seconds
+        self._idle_seconds = idle_seconds
+
+        self._builders: Dict[str, WarmSetBuilder] = {}
+        self._status: Dict[str, WarmSetStatus] = {}
+        self._due: Dict[str, float] = {}  # 키 → 다음 워밍 시각
+        self._set_keys: Dict[str, Set[str]] = {}  # 세트 → 마지막 빌더 실행에서 만든 키
+        self._progress = _Progress()
+        self._task: Optional[asyncio.Task] = None
+        self._cycles = 0
+        self._running = False
+        self._next_run_at: Optional[float] = None
+
+    # ---- 세트 등록 ----
+
+    def warm_set(self, name: str) -> Callable[[WarmSetBuilder], WarmSetBuilder]:
+        """워밍 세트 등록 데코레이터 (등록 순서대로 실행)"""
+        def decorator(builder: WarmSetBuilder) -> WarmSetBuilder:
+            self.register(name, builder)
+            return builder
+        return decorator
+
+    def register(self, name: str, builder: WarmSetBuilder) -> None:
+        self._builders[name] = builder
+        self._status.setdefault(name, WarmSetStatus(name=name))
+
+    @property
+    def warm_sets(self) -> List[str]:
+        return list(self._builders)
+
+    # ---- 실행 ----
+
+    def start(
+        self,
+        concurrency: Optional[int] = None,
+        rewarm_lead_seconds: Optional[float] = None
+    ) -> None:
+        """백그라운드 워밍 루프 시작"""
+        if self._task and not self._task.done():
+            return
+        if concurrency is not None:
+            self._concurrency = concurrency
+        if rewarm_lead_seconds is not None:
+            self._rewarm_lead_seconds = rewarm_lead_seconds
+        self._task = asyncio.create_task(self._run_forever())
+        logger.info(
+            f"Cache warmer started (sets={self.warm_sets}, concurrency={self._concurrency})"
+        )
+
+    async def stop(self) -> None:
+        """백그라운드 워밍 루프 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._next_run_at = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"Cache warmer cycle error: {e}")
+            delay = self._seconds_until_due()
+            self._next_run_at = time.time() + delay
+            await asyncio.sleep(delay)
+
+    async def run_once(self, force: bool = False) -> Dict[str, WarmSetStatus]:
+        """
+        모든 세트를 등록 순서대로 한 번 실행
+        force: 재워밍 시각과 무관하게 모든 키 다시 계산
+        """
+        semaphore = asyncio.Semaphore(max(1, self._concurrency))
+        self._running = True
+        try:
+            for name, builder in list(self._builders.items()):
+                await self._run_set(name, builder, semaphore, force)
+            self._cycles += 1
+        finally:
+            self._running = False
+            self._progress = _Progress()
+        return self._status
+
+    async def _run_set(
+        self,
+        name: str,
+        builder: WarmSetBuilder,
+        semaphore: asyncio.Semaphore,
+        force: bool
+    ) -> None:
+        status = self._status[name]
+        started = time.time()
+        status.runs += 1
+        status.last_started_at = started
+        status.warmed = status.skipped = status.failed = 0
+        status.last_error = None
+
+        try:
+            tasks = await builder()
+        except Exception as e:
+            status.tasks = 0
+            status.failed = 1
+            status.last_error = f"builder: {e}"
+            status.last_duration_seconds = time.time() - started
+            logger.warning(f"Cache warm set '{name}' builder failed: {e}")
+            return
+
+        status.tasks = len(tasks)
+        self._forget_dropped_keys(name, {task.key for task in tasks})
+        due = [task for task in tasks if force or self._is_due(task.key, started)]
+        status.skipped = len(tasks) - len(due)
+        self._progress = _Progress(warm_set=name, total=len(due))
+
+        results = await asyncio.gather(
+            *(self._warm(task, semaphore) for task in due),
+            return_exceptions=True
+        )
+        for task, result in zip(due, results):
+            if isinstance(result, BaseException):
+                status.failed += 1
+                status.last_error = f"{task.key}: {result}"
+            elif result:
+                status.warmed += 1
+            else:
+                status.skipped += 1
+
+        status.last_duration_seconds = time.time() - started
+        logger.info(
+            f"Cache warm set '{name}': {status.warmed} warmed, "
+            f"{status.skipped} skipped, {status.failed} failed "
+            f"({status.last_duration_seconds:.1f}s)"
+        )
+
+    async def _warm(self, task: WarmTask, semaphore: asyncio.Semaphore) -> bool:
+        """키 하나 워밍 후 다음 워밍 시각 예약"""
+        async with semaphore:
+            try:
+                warmed = await self._cache.refresh(
+                    task.key, task.factory, task.ttl_seconds, tags=task.tags
+                )
+            except Exception:
+                self._due[task.key] = time.time() + self._retry_seconds
+                self._progress.failed_keys.append(task.key)
+                raise
+            finally:
+                self._progress.done += 1
+
+        # 다른 워커가 갱신 중이었던 경우도 곧 저장되므로 같은 주기로 예약
+        self._due[task.key] = time.time() + self._rewarm_delay(task.ttl_seconds)
+        return warmed
+
+    def _forget_dropped_keys(self, name: str, keys: Set[str]) -> None:
+        """
+        세트에서 빠진 키 (TOP N에서 밀려난 종목, 최신 목록에서 빠진 브리핑 날짜 등)의 재워밍 예약 삭제
+        남겨 두면 지난 시각이 계속 가장 이른 예약이 되어 매초 사이클이 돌게 됨
+        """
+        dropped = self._set_keys.get(name, set()) - keys
+        self._set_keys[name] = keys
+        if not dropped:
+            return
+        claimed = set().union(*(k for other, k in self._set_keys.items() if other != name))
+        for key in dropped - claimed:
+            self._due.pop(key, None)
+
+    def _rewarm_delay(self, ttl_seconds: int) -> float:
+        return max(ttl_seconds - self._rewarm_lead_seconds, ttl_seconds / 2)
+
+    def _is_due(self, key: str, now: float) -> bool:
+        return now >= self._due.get(key, 0.0)
+
+    def _seconds_until_due(self) -> float:
+        """가장 이른 재워밍 시각까지 대기 시간 (새 키 반영을 위해 최대 idle_seconds)"""
+        if not self._due:
+            return self._idle_seconds
+        wait = min(self._due.values()) - time.time()
+        return min(max(wait, 1.0), self._idle_seconds)
+
+    # ---- 상태 ----
+
+    def status(self) -> dict:
+        """/api/cache/warmer용 상태"""
+        return {
+            "enabled": self._task is not None and not self._task.done(),
+            "running": self._running,
+            "cycles": self._cycles,
+            "concurrency": self._concurrency,
+            "next_run_at": self._next_run_at,
+            "scheduled_keys": len(self._due),
+            "progress": {
+                "warm_set": self._progress.warm_set,
+                "done": self._progress.done,
+                "total": self._progress.total,
+                "failed_keys": list(self._progress.failed_keys),
+            },
+            "warm_sets": [self._status[name].to_dict() for name in self._builders],
+        }
+
+
+# ============================================================
+# 싱글톤 인스턴스
+# ============================================================
+
+cache_warmer = CacheWarmer(cache_manager)
@@ -0,0 +1,311 @@
+"""
+디스크 캐시 계층 (SQLite)
+
+기능:
+- L1과 L2(Redis) 사이의 영속 계층: 재시작/배포 후에도 캐시 유지 (warm restart)
+- 코덱으로 직렬화된 바이트를 그대로 저장 (L2와 같은 형식)
+- TTL 유지 (만료 시각 저장, 만료 엔트리는 조회되지 않음)
+- 키별 조회 수 기록 (메모리에 모았다가 정리 주기에 한 번에 기록) → 시작 시 가장 많이 조회된 N개를 L1에 미리 적재
+- 단일 노드에서 Redis를 쓸 수 없을 때 폴백
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _default_path() -> Path:
+    return Path(__file__).parent.parent / "data" / "cache.sqlite3"
+
+
+class DiskCache:
+    """
+    디스크 캐시 (SQLite, WAL 모드)
+    - 같은 파일을 여러 워커가 함께 사용 가능 (SQLite 파일 락)
+    - 조회는 읽기만 함 (WAL 모드라 다른 워커의 쓰기 트랜잭션을 기다리지 않음) → 이벤트 루프에서 직접 호출
+      조회 수는 메모리에 모았다가 cleanup_expired() (L1 정리 주기) / close()에서 한 트랜잭션으로 기록
+    - max_entries 초과분은 cleanup_expired()에서 조회 수가 적은 순으로 정리
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            expires_at REAL NOT NULL,
+            tags TEXT NOT NULL DEFAULT '[]',
+            hits INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at);
+        CREATE TABLE IF NOT EXISTS cache_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags (key);
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10000):
+        # CacheStats는 cache_service에 정의 (순환 import 방지)
+        from services.cache_service import CacheStats
+
+        self._path = Path(path) if path else _default_path()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._stats = CacheStats()
+        self._pending_hits: Counter = Counter()  # 아직 기록하지 않은 키별 조회 수
+
+        self._conn = sqlite3.connect(
+            str(self._path),
+            timeout=5.0,
+            isolation_level=None,  # autocommit, 다중 문장은 명시적 트랜잭션
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def close(self) -> None:
+        self.flush_hits()
+        self._conn.close()
+
+    # ---- 조회 ----
+
+    def get_encoded_with_tags(
+        self, key: str
+    ) -> Tuple[Optional[bytes], Tuple[str, ...], Optional[float]]:
+        """(바이트, 태그, 남은 TTL 초) - 없거나 만료되면 (None, (), None)"""
+        return self.get_many_encoded_with_tags([key]).get(key, (None, (), None))
+
+    def get_many_encoded_with_tags(
+        self, keys: List[str]
+    ) -> Dict[str, Tuple[bytes, Tuple[str, ...], float]]:
+        """여러 키 조회 - 찾은 키만 {key: (바이트, 태그, 남은 TTL 초)}"""
+        if not keys:
+            return {}
+        now = time.time()
+        found: Dict[str, Tuple[bytes, Tuple[str, ...], float]] = {}
+        try:
+            placeholders = ",".join("?" * len(keys))
+            rows = self._conn.execute(
+                f"SELECT key, data, expires_at, tags FROM cache_entries "
+                f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*keys, now)
+            ).fetchall()
+            for key, data, expires_at, tags in rows:
+                found[key] = (bytes(data), tuple(json.loads(tags)), expires_at - now)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache get error: {e}")
+            self._stats.errors += 1
+            return {}
+
+        self._pending_hits.update(found.keys())
+        self._stats.hits += len(found)
+        self._stats.misses += len(keys) - len(found)
+        return found
+
+    def hottest(self, limit: int) -> List[Tuple[str, bytes, Tuple[str, ...], float]]:
+        """조회 수가 많은 순으로 유효한 엔트리 (key, 바이트, 태그, 남은 TTL 초)"""
+        self.flush_hits()
+        now = time.time()
+        try:
+            rows = self._conn.execute(
+                "SELECT key, data, expires_at, tags FROM cache_entries "
+                "WHERE expires_at > ? ORDER BY hits DESC LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache preload error: {e}")
+            self._stats.errors += 1
+            return []
+        return [
+            (key, bytes(data), tuple(json.loads(tags)), expires_at - now)
+            for key, data, expires_at, tags in rows
+        ]
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        """패턴에 매칭되는 유효한 키 목록 (fnmatch와 같은 GLOB 문법)"""
+        try:
+            rows = self._conn.execute(
+                "SELECT key FROM cache_entries WHERE key GLOB ? AND expires_at > ?",
+                (pattern, time.time())
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache keys error: {e}")
+            self._stats.errors += 1
+            return []
+        return [row[0] for row in rows]
+
+    # ---- 저장 ----
+
+    def set_encoded(
+        self,
+        key: str,
+        data: bytes,
+        ttl_seconds: int,
+        tags: Optional[Iterable[str]] = None
+    ) -> bool:
+        """직렬화된 바이트 저장"""
+        return self.set_many_encoded({key: data}, ttl_seconds, {key: list(tags or [])})
+
+    def set_many_encoded(
+        self,
+        items: Dict[str, bytes],
+        ttl_seconds: int,
+        tags: Optional[Dict[str, List[str]]] = None
+    ) -> bool:
+        """여러 키를 한 트랜잭션으로 저장 (기존 조회 수는 유지)"""
+        tags = tags or {}
+        expires_at = time.time() + ttl_seconds
+        try:
+            with self._transaction():
+                for key, data in items.items():
+                    key_tags = list(tags.get(key) or [])
+                    self._conn.execute(
+                        "INSERT INTO cache_entries (key, data, expires_at, tags) "
+                        "VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET data = excluded.data, "
+                        "expires_at = excluded.expires_at, tags = excluded.tags",
+                        (key, data, expires_at, json.dumps(key_tags))
+                    )
+                    self._conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                        [(tag, key) for tag in key_tags]
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache set error: {e}")
+            self._stats.errors += 1
+            return False
+
+        self._stats.sets += len(items)
+        return True
+
+    # ---- 삭제 ----
+
+    def delete(self, key: str) -> bool:
+        return self._delete_where("key = ?", (key,)) > 0
+
+    def clear(self) -> int:
+        return self._delete_where("1", ())
+
+    def clear_pattern(self, pattern: str) -> int:
+        return self._delete_where("key GLOB ?", (pattern,))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그가 붙은 모든 키 삭제 (삭제된 키 목록 반환)"""
+        tags = list(tags)
+        if not tags:
+            return []
+        try:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT key FROM cache_tags WHERE tag IN ({','.join('?' * len(tags))})",
+                tags
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache invalidate error: {e}")
+            self._stats.errors += 1
+            return []
+        keys = [row[0] for row in rows]
+        if keys:
+            self._delete_where(f"key IN ({','.join('?' * len(keys))})", keys)
+        return keys
+
+    def cleanup_expired(self) -> int:
+        """밀린 조회 수 기록 + 만료 엔트리 삭제 + max_entries 초과분은 조회 수가 적은 순으로 삭제"""
+        self.flush_hits()
+        removed = self._delete_where("expires_at <= ?", (time.time(),), count_deletes=False)
+        excess = self.key_count - self._max_entries
+        if excess > 0:
+            removed += self._delete_where(
+                "key IN (SELECT key FROM cache_entries ORDER BY hits ASC, expires_at ASC LIMIT ?)",
+                (excess,),
+                count_deletes=False
+            )
+        return removed
+
+    def flush_hits(self) -> int:
+        """메모리에 모은 조회 수를 한 트랜잭션으로 기록 (실패하면 다음 주기에 다시 시도)"""
+        if not self._pending_hits:
+            return 0
+        pending, self._pending_hits = self._pending_hits, Counter()
+        try:
+            with self._transaction():
+                self._conn.executemany(
+                    "UPDATE cache_entries SET hits = hits + ? WHERE key = ?",
+                    [(count, key) for key, count in pending.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache hit flush error: {e}")
+            self._stats.errors += 1
+            self._pending_hits.update(pending)
+            return 0
+        return len(pending)
+
+    def _delete_where(self, where: str, params: Iterable, count_deletes: bool = True) -> int:
+        try:
+            with self._transaction():
+                self._conn.execute(
+                    f"DELETE FROM cache_tags WHERE key IN (SELECT key FROM cache_entries WHERE {where})",
+                    tuple(params)
+                )
+                removed = self._conn.execute(
+                    f"DELETE FROM cache_entries WHERE {where}", tuple(params)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache delete error: {e}")
+            self._stats.errors += 1
+            return 0
+
+        if count_deletes:
+            self._stats.deletes += removed
+        return removed
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._conn)
+
+    # ---- 통계 ----
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @property
+    def key_count(self) -> int:
+        try:
+            return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache count error: {e}")
+            self._stats.errors += 1
+            return 0
+
+    @property
+    def size_mb(self) -> float:
+        try:
+            page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache size error: {e}")
+            self._stats.errors += 1
+            return 0.0
+        return page_count * page_size / (1024 * 1024)
+
+
+class _Transaction:
+    """autocommit 연결에서 BEGIN IMMEDIATE ~ COMMIT/ROLLBACK"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
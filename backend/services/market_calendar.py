@@ -0,0 +1,189 @@
+"""
+NYSE 거래 세션 캘린더
+
+기능:
+- 현재 시각의 미국 주식시장 세션 판별 (프리마켓 / 정규장 / 애프터마켓 / 야간 / 휴장)
+- NYSE 휴장일 (대체 휴일 포함) / 조기 폐장일(half day) 규칙 기반 계산 (외부 패키지 없음)
+- 다음 세션 전환 시각 → 캐시 TTL이 세션 경계를 넘지 않도록 사용
+- 거래일 (장 마감 시각에 다음 거래일로 넘어감) → 일봉 기반 데이터의 캐시 키
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional
+from zoneinfo import ZoneInfo
+
+NY_TZ = ZoneInfo("America/New_York")
+
+# 세션 경계 (뉴욕 현지 시각)
+PRE_MARKET_OPEN = time(4, 0)
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+AFTER_HOURS_CLOSE = time(20, 0)
+HALF_DAY_CLOSE = time(13, 0)
+HALF_DAY_AFTER_HOURS_CLOSE = time(17, 0)
+
+
+class MarketSession(str, Enum):
+    """미국 주식시장 세션"""
+    PRE_MARKET = "pre_market"      # 04:00 ~ 09:30
+    REGULAR = "regular"            # 09:30 ~ 16:00 (조기 폐장일 13:00)
+    AFTER_HOURS = "after_hours"    # 16:00 ~ 20:00 (조기 폐장일 13:00 ~ 17:00)
+    OVERNIGHT = "overnight"        # 거래일 사이 야간
+    CLOSED = "closed"              # 주말 / 휴장일 (다음 거래일 프리마켓 전까지)
+
+
+@dataclass(frozen=True)
+class SessionInfo:
+    """현재 세션과 다음 세션 전환 시각"""
+    session: MarketSession
+    ends_at: datetime  # 뉴욕 시각 (tz-aware)
+    half_day: bool = False
+
+    def seconds_remaining(self, now: datetime) -> float:
+        return max(0.0, (self.ends_at - now).total_seconds())
+
+
+# ============================================================
+# 휴장일 / 조기 폐장일
+# ============================================================
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """month의 n번째 weekday (월=0)"""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """month의 마지막 weekday"""
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """토요일 → 금요일, 일요일 → 월요일 대체 휴일"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=16)
+def nyse_holidays(year: int) -> Dict[date, str]:
+    """NYSE 정규 휴장일 {날짜: 이름}"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3): "Martin Luther King Jr. Day",
+        _nth_weekday(year, 2, 0, 3): "Washington's Birthday",
+        _easter(year) - timedelta(days=2): "Good Friday",
+        _last_weekday(year, 5, 0): "Memorial Day",
+        _observed(date(year, 7, 4)): "Independence Day",
+        _nth_weekday(year, 9, 0, 1): "Labor Day",
+        _nth_weekday(year, 11, 3, 4): "Thanksgiving Day",
+        _observed(date(year, 12, 25)): "Christmas Day",
+    }
+    # 새해: 토요일이면 전년도 12/31로 옮기지 않음 (NYSE 규칙)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    return holidays
+
+
+@lru_cache(maxsize=16)
+def nyse_half_days(year: int) -> FrozenSet[date]:
+    """조기 폐장일 (13:00): 독립기념일 전날, 추수감사절 다음 날, 크리스마스 이브"""
+    candidates = (
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    )
+    return frozenset(day for day in candidates if is_trading_day(day))
+
+
+def is_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def is_half_day(day: date) -> bool:
+    return day in nyse_half_days(day.year)
+
+
+def _next_trading_day(day: date) -> date:
+    day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def session_close(day: date) -> datetime:
+    """day의 정규장 마감 시각 (조기 폐장일 13:00)"""
+    return datetime.combine(
+        day, HALF_DAY_CLOSE if is_half_day(day) else REGULAR_CLOSE, tzinfo=NY_TZ
+    )
+
+
+def trading_date(now: Optional[datetime] = None) -> date:
+    """
+    now가 속한 거래일 - 정규장 마감 시각에 다음 거래일로 넘어감
+    (마감 후 / 주말 / 휴장일은 다음 거래일, 일봉 종가가 바뀌는 시점과 일치)
+    """
+    now = (now or datetime.now(NY_TZ)).astimezone(NY_TZ)
+    today = now.date()
+    if is_trading_day(today) and now < session_close(today):
+        return today
+    return _next_trading_day(today)
+
+
+# ============================================================
+# 세션 판별
+# ============================================================
+
+def market_session(now: Optional[datetime] = None) -> SessionInfo:
+    """now(기본: 현재 시각)의 세션과 다음 전환 시각"""
+    now = (now or datetime.now(NY_TZ)).astimezone(NY_TZ)
+    today = now.date()
+
+    def at(day: date, clock: time) -> datetime:
+        return datetime.combine(day, clock, tzinfo=NY_TZ)
+
+    next_pre_market = at(_next_trading_day(today), PRE_MARKET_OPEN)
+    if not is_trading_day(today):
+        return SessionInfo(MarketSession.CLOSED, next_pre_market)
+
+    half_day = is_half_day(today)
+    boundaries = (
+        (at(today, PRE_MARKET_OPEN), MarketSession.OVERNIGHT),
+        (at(today, REGULAR_OPEN), MarketSession.PRE_MARKET),
+        (at(today, HALF_DAY_CLOSE if half_day else REGULAR_CLOSE), MarketSession.REGULAR),
+        (
+            at(today, HALF_DAY_AFTER_HOURS_CLOSE if half_day else AFTER_HOURS_CLOSE),
+            MarketSession.AFTER_HOURS
+        ),
+    )
+    for ends_at, session in boundaries:
+        if now < ends_at:
+            return SessionInfo(session, ends_at, half_day)
+
+    # 장 마감 후: 다음 날이 거래일이면 야간, 아니면 휴장 (주말 / 휴일 전날 밤)
+    if next_pre_market.date() == today + timedelta(days=1):
+        return SessionInfo(MarketSession.OVERNIGHT, next_pre_market, half_day)
+    return SessionInfo(MarketSession.CLOSED, next_pre_market, half_day)
@@ -0,0 +1,134 @@
+"""
+응답 캐시 (직렬화된 JSON 바이트 + ETag)
+
+기능:
+- 엔드포인트 결과를 최종 JSON 바이트로 한 번만 직렬화해 캐시에 저장
+- 캐시 히트 시 Pydantic 검증 / 직렬화 없이 바이트를 그대로 응답
+- 본문 해시 기반 ETag, 남은 TTL 기반 Cache-Control
+- If-None-Match 일치 시 본문 없이 304 Not Modified
+- factory의 404는 부정 캐시(NegativeResult)로 저장 → 짧은 TTL 동안 업스트림 호출 없이 404
+  (negative_cache=False면 404는 캐시하지 않고 그대로 전파)
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Type, Union
+
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+
+from services.cache_service import NegativeResult
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def compute_etag(body: bytes) -> str:
+    """본문 해시로 강한 ETag 생성 (따옴표 포함)"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 (RFC 9110 약한 비교)
+    - 쉼표로 구분된 여러 값, W/ 접두사, * 지원
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장되는 직렬화된 응답"""
+    body: bytes
+    etag: str
+    expires_at: float
+
+    @classmethod
+    def from_model(cls, model: BaseModel, ttl_seconds: int) -> "CachedResponse":
+        """모델을 JSON 바이트로 직렬화 (FastAPI response_model 출력과 같은 형식)"""
+        body = model.model_dump_json().encode()
+        return cls(body=body, etag=compute_etag(body), expires_at=time.time() + ttl_seconds)
+
+    @classmethod
+    def coerce(
+        cls, value: Any, model_cls: Type[BaseModel], ttl_seconds: int
+    ) -> "CachedResponse":
+        """
+        캐시 값을 CachedResponse로 변환
+        이전 형식(모델 / dict)으로 저장된 값은 응답 모델로 검증 후 직렬화
+        """
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, model_cls):
+            value = model_cls.model_validate(value)
+        return cls.from_model(value, ttl_seconds)
+
+    def parse(self, model_cls: Type[BaseModel]) -> BaseModel:
+        """저장된 본문을 모델로 복원 (캐시 워머 등 내부 재사용용)"""
+        return model_cls.model_validate_json(self.body)
+
+    @property
+    def max_age(self) -> int:
+        """남은 TTL (초, Cache-Control max-age)"""
+        return max(0, int(self.expires_at - time.time()))
+
+    def to_response(self, request: Request) -> Response:
+        """요청의 If-None-Match에 따라 200 (본문) 또는 304 응답"""
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+async def cached_json_response(
+    cache: Any,
+    request: Request,
+    cache_key: str,
+    factory: Callable[[], Awaitable[BaseModel]],
+    model_cls: Type[BaseModel],
+    ttl_seconds: int,
+    tags: Optional[List[str]] = None,
+    negative_cache: bool = True
+) -> Response:
+    """
+    직렬화된 응답 캐시 조회 (미스 시 factory 결과를 JSON 바이트로 한 번만 직렬화해 저장)
+    히트 시 바이트를 그대로 반환, ETag / Cache-Control 포함, If-None-Match 일치 시 304
+    부정 캐시 히트면 저장된 404를 그대로 발생
+    """
+    cached = await cache.get_or_set(
+        cache_key, serialized(factory, ttl_seconds, negative_cache), ttl_seconds, tags=tags
+    )
+    if isinstance(cached, NegativeResult):
+        raise HTTPException(status_code=cached.status_code, detail=cached.reason)
+    return CachedResponse.coerce(cached, model_cls, ttl_seconds).to_response(request)
+
+
+def serialized(
+    factory: Callable[[], Awaitable[BaseModel]], ttl_seconds: int, negative_cache: bool = True
+) -> Callable[[], Awaitable[Union[CachedResponse, NegativeResult]]]:
+    """
+    모델 factory를 CachedResponse factory로 변환 (엔드포인트 / 캐시 워머 공용)
+    factory의 404 HTTPException은 NegativeResult로 변환해 부정 캐시 (negative_cache=False면 그대로 전파)
+    """
+    async def render() -> Union[CachedResponse, NegativeResult]:
+        try:
+            model = await factory()
+        except HTTPException as e:
+            if e.status_code != 404 or not negative_cache:
+                raise
+            return NegativeResult(reason=str(e.detail), status_code=e.status_code)
+        return CachedResponse.from_model(model, ttl_seconds)
+    return render
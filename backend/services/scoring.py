@@ -0,0 +1,467 @@
+"""
+선언적 화제 종목 점수 규칙 + 컬럼 기반 평가 엔진 (NumPy / pandas)
+
+기능:
+- 점수 규칙은 JSON / YAML 스펙 하나 (기본 backend/scoring_rules.json, config.py의 ScoringSettings로 경로 지정)
+- 스펙을 한 번 컴파일(ScoringRules) → 구성 요소별 임계값 구간을 np.select로 한 번에 평가
+- 스크리너 / 브리핑 생성 / WHY HOT이 같은 규칙 사용 (구간별 reason 템플릿 → WHY HOT 문구)
+- 핫 리로드: 파일 변경 시각을 주기적으로 확인해 다시 컴파일, 잘못된 스펙은 무시하고 이전 규칙 유지
+- 배치 조회한 일봉 히스토리(MultiIndex: symbol, date)에서 groupby 한 번으로 5일 / 10일 수익률 계산
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.stock import ScoreBreakdown
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 기본 규칙 파일 (backend/scoring_rules.json)
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent / "scoring_rules.json"
+
+# 점수 구성 요소 (ScoreBreakdown의 {name}_score 필드)
+COMPONENTS = ("volume", "price_change", "momentum", "market_cap")
+
+# 후보 dict에서 읽는 원본 컬럼 (없거나 None이면 0)
+SCORE_COLUMNS = ("volume", "avg_volume", "change_percent", "market_cap")
+
+# 규칙 입력값 (후보 원본 컬럼에서 계산, NaN이면 구성 요소의 missing_points)
+# - volume_ratio: 거래량 / 평균 거래량 (평균 거래량이 없으면 NaN)
+# - change_percent / abs_change_percent: 등락률 / 절댓값
+# - market_cap_billions: 시가총액 (10억 달러, 없으면 NaN)
+# - momentum: 추세 단계 (10: 5일·10일 수익률 양수, 5: 5일만 양수, 0: 그 외, 모르면 NaN)
+RULE_INPUTS = ("volume_ratio", "change_percent", "abs_change_percent", "market_cap_billions", "momentum")
+
+# reason 템플릿 검증용 예시 값
+_SAMPLE_VALUES = {
+    "symbol": "AAPL", "volume_ratio": 1.0, "change_percent": 1.0, "abs_change_percent": 1.0,
+    "direction": "상승", "market_cap_billions": 1.0, "momentum": 10, "points": 10,
+}
+
+# 모멘텀 계산에 필요한 최소 일봉 개수
+MOMENTUM_MIN_DAYS = 10
+
+
+class RuleSpecError(Exception):
+    """점수 규칙 스펙 에러"""
+    pass
+
+
+def _safe_return(last: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """(last - base) / base * 100, base가 0이면 0"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(base != 0, (last - base) / base * 100, 0.0)
+
+
+# ============================================================
+# 규칙 컴파일
+# ============================================================
+
+@dataclass(frozen=True)
+class RuleTier:
+    """점수 구간 (min <= 입력값 <= max 이면 points)"""
+    min: float
+    max: float
+    points: int  # 가중치 적용 후
+    reason: Optional[str]
+
+
+@dataclass(frozen=True)
+class RuleComponent:
+    """점수 구성 요소 (위에서부터 처음 맞는 구간의 점수)"""
+    name: str
+    label: str
+    input: str
+    weight: float
+    missing_points: int  # 입력값이 없을 때 (가중치 적용 후)
+    tiers: Tuple[RuleTier, ...]
+
+    @property
+    def max_points(self) -> int:
+        return max([self.missing_points] + [tier.points for tier in self.tiers])
+
+    def evaluate(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """입력값 배열 → (점수, 맞은 구간 인덱스, 없으면 -1)"""
+        conditions = [(values >= tier.min) & (values <= tier.max) for tier in self.tiers]
+        tier_index = np.select(conditions, list(range(len(self.tiers))), default=-1)
+        # 마지막 원소 0 = 맞는 구간 없음 (tier_index -1)
+        lookup = np.array([tier.points for tier in self.tiers] + [0], dtype=np.int64)
+        points = np.where(np.isnan(values), self.missing_points, lookup[tier_index])
+        return points, tier_index
+
+
+def _number(raw: Dict[str, Any], key: str, default: float, where: str) -> float:
+    value = raw.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RuleSpecError(f"{where}.{key}: 숫자가 아님 ({value!r})")
+    return float(value)
+
+
+def _check_template(template: Optional[str], where: str) -> Optional[str]:
+    if template is None:
+        return None
+    try:
+        str(template).format(**_SAMPLE_VALUES)
+    except (KeyError, IndexError, ValueError) as e:
+        raise RuleSpecError(f"{where}.reason: 템플릿 오류 ({e!r})")
+    return str(template)
+
+
+def _compile_component(name: str, raw: Any) -> RuleComponent:
+    where = f"components.{name}"
+    if not isinstance(raw, dict):
+        raise RuleSpecError(f"{where}: 객체가 아님")
+    if raw.get("input") not in RULE_INPUTS:
+        raise RuleSpecError(f"{where}.input: {RULE_INPUTS} 중 하나여야 함 ({raw.get('input')!r})")
+    weight = _number(raw, "weight", 1.0, where)
+    if weight < 0:
+        raise RuleSpecError(f"{where}.weight: 음수 불가")
+
+    tiers = []
+    for i, tier in enumerate(raw.get("tiers") or []):
+        tier_where = f"{where}.tiers[{i}]"
+        if not isinstance(tier, dict) or "points" not in tier:
+            raise RuleSpecError(f"{tier_where}: points 필요")
+        lower = _number(tier, "min", -np.inf, tier_where)
+        upper = _number(tier, "max", np.inf, tier_where)
+        if lower > upper:
+            raise RuleSpecError(f"{tier_where}: min > max")
+        tiers.append(RuleTier(
+            min=lower,
+            max=upper,
+            points=int(round(_number(tier, "points", 0, tier_where) * weight)),
+            reason=_check_template(tier.get("reason", raw.get("reason")), tier_where)
+        ))
+    if not tiers:
+        raise RuleSpecError(f"{where}.tiers: 구간이 없음")
+
+    return RuleComponent(
+        name=name,
+        label=str(raw.get("label", name)),
+        input=raw["input"],
+        weight=weight,
+        missing_points=int(round(_number(raw, "missing_points", 0, where) * weight)),
+        tiers=tuple(tiers)
+    )
+
+
+class ScoringRules:
+    """
+    컴파일된 점수 규칙 (불변, 스펙이 바뀌면 새 인스턴스)
+    digest: 정규화한 스펙의 해시 → 캐시된 점수가 어떤 규칙으로 계산됐는지 구분
+    """
+
+    def __init__(self, spec: Dict[str, Any], source: Optional[str] = None):
+        if not isinstance(spec, dict) or not isinstance(spec.get("components"), dict):
+            raise RuleSpecError("components 객체가 필요함")
+        unknown = set(spec["components"]) - set(COMPONENTS)
+        missing = set(COMPONENTS) - set(spec["components"])
+        if unknown or missing:
+            raise RuleSpecError(
+                f"components는 {COMPONENTS} 모두 필요 (누락: {sorted(missing)}, 알 수 없음: {sorted(unknown)})"
+            )
+
+        self.spec = spec
+        self.source = source
+        self.version = str(spec.get("version", ""))
+        self.description = str(spec.get("description", ""))
+        self.components = tuple(_compile_component(name, spec["components"][name]) for name in COMPONENTS)
+        canonical = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+        self.digest = hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+    @property
+    def max_total(self) -> int:
+        return sum(component.max_points for component in self.components)
+
+    @staticmethod
+    def inputs(candidates: List[Dict], momentum: Optional[Dict[str, int]] = None) -> Dict[str, np.ndarray]:
+        """후보 dict 목록 → 규칙 입력값 배열 (momentum이 None이면 모멘텀 입력 NaN)"""
+        frame = pd.DataFrame.from_records(candidates, columns=SCORE_COLUMNS)
+        frame = frame.apply(pd.to_numeric, errors="coerce").fillna(0.0).astype(float)
+
+        volume = frame["volume"].to_numpy()
+        avg_volume = frame["avg_volume"].to_numpy()
+        change_percent = frame["change_percent"].to_numpy()
+        market_cap = frame["market_cap"].to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_ratio = np.where(avg_volume > 0, volume / avg_volume, np.nan)
+
+        if momentum is None:
+            momentum_level = np.full(len(candidates), np.nan)
+        else:
+            momentum_level = np.fromiter(
+                (momentum.get(c["symbol"], 0) for c in candidates), dtype=float, count=len(candidates)
+            )
+
+        return {
+            "volume_ratio": volume_ratio,
+            "change_percent": change_percent,
+            "abs_change_percent": np.abs(change_percent),
+            "market_cap_billions": np.where(market_cap != 0, market_cap / 1_000_000_000, np.nan),
+            "momentum": momentum_level,
+        }
+
+    def score(self, candidates: List[Dict], momentum: Optional[Dict[str, int]] = None) -> List[Dict]:
+        """
+        복합 점수 계산 (후보 dict를 제자리에서 갱신)
+        - "score": ScoreBreakdown, "reasons": 맞은 구간의 WHY HOT 문구 (구성 요소 순서)
+        - "volume_ratio": 평균 거래량이 있을 때만, "momentum_data": 모멘텀 점수 > 0
+        """
+        if not candidates:
+            return candidates
+
+        inputs = self.inputs(candidates, momentum)
+        results = {c.name: c.evaluate(inputs[c.input]) for c in self.components}
+        total = sum(points for points, _ in results.values())
+        volume_ratio = inputs["volume_ratio"]
+
+        for i, candidate in enumerate(candidates):
+            if not np.isnan(volume_ratio[i]):
+                candidate["volume_ratio"] = round(float(volume_ratio[i]), 2)
+            candidate["momentum_data"] = bool(results["momentum"][0][i] > 0)
+            candidate["score"] = ScoreBreakdown(
+                **{f"{name}_score": int(points[i]) for name, (points, _) in results.items()},
+                total=int(total[i])
+            )
+            candidate["reasons"] = self._reasons(candidate, inputs, results, i)
+
+        return candidates
+
+    def _reasons(
+        self,
+        candidate: Dict,
+        inputs: Dict[str, np.ndarray],
+        results: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        i: int
+    ) -> List[str]:
+        values = {name: float(column[i]) for name, column in inputs.items()}
+        values.update(
+            symbol=candidate.get("symbol", ""),
+            volume_ratio=candidate.get("volume_ratio", 0),
+            direction="상승" if values["change_percent"] > 0 else "하락",
+        )
+        reasons = []
+        for component in self.components:
+            points, tier_index = results[component.name]
+            if tier_index[i] < 0:
+                continue
+            template = component.tiers[tier_index[i]].reason
+            if template:
+                reasons.append(template.format(points=int(points[i]), **values))
+        return reasons
+
+    def describe(self) -> Dict[str, Any]:
+        """규칙 요약 (/api/screener/rules)"""
+        return {
+            "version": self.version,
+            "description": self.description,
+            "digest": self.digest,
+            "source": self.source,
+            "max_total": self.max_total,
+            "components": [
+                {
+                    "name": c.name,
+                    "label": c.label,
+                    "input": c.input,
+                    "weight": c.weight,
+                    "missing_points": c.missing_points,
+                    "max_points": c.max_points,
+                    "tiers": [
+                        {
+                            "min": None if np.isinf(t.min) else t.min,
+                            "max": None if np.isinf(t.max) else t.max,
+                            "points": t.points,
+                            "reason": t.reason,
+                        }
+                        for t in c.tiers
+                    ],
+                }
+                for c in self.components
+            ],
+        }
+
+
+def load_rule_spec(path: Path) -> Dict[str, Any]:
+    """규칙 파일 읽기 (.yaml / .yml은 PyYAML 필요, 그 외 JSON)"""
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        if not YAML_AVAILABLE:
+            raise RuleSpecError("YAML 규칙 파일은 PyYAML 설치 필요: pip install pyyaml")
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise RuleSpecError(f"YAML 파싱 실패: {e}")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise RuleSpecError(f"JSON 파싱 실패: {e}")
+
+
+def compile_rules(path: Path) -> ScoringRules:
+    """규칙 파일 → 컴파일된 규칙"""
+    return ScoringRules(load_rule_spec(path), source=str(path))
+
+
+# ============================================================
+# 핫 리로드
+# ============================================================
+
+class RuleStore:
+    """
+    현재 점수 규칙 보관 + 핫 리로드
+    - current(): reload_interval 초마다 파일 변경 시각 확인, 바뀌었으면 다시 컴파일
+    - 새 스펙이 잘못됐으면 경고 로그 + last_error 기록, 이전 규칙 계속 사용
+    """
+
+    def __init__(self, path: Optional[Path] = None, reload_interval: float = 5.0):
+        self._path = Path(path) if path else DEFAULT_RULES_PATH
+        self._reload_interval = reload_interval
+        self._rules: Optional[ScoringRules] = None
+        self._mtime: Optional[float] = None
+        self._loaded_at: Optional[float] = None
+        self._checked_at = 0.0
+        self._last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def configure(self, path: Optional[str] = None, reload_interval: float = 5.0) -> None:
+        """규칙 파일 / 확인 주기 설정 (다음 current()에서 다시 로드)"""
+        with self._lock:
+            self._path = Path(path) if path else DEFAULT_RULES_PATH
+            self._reload_interval = reload_interval
+            self._rules = None
+            self._mtime = None
+
+    def current(self) -> ScoringRules:
+        """현재 규칙 (확인 주기가 지났으면 파일 변경 확인, 주기 0 이하면 처음 한 번만 로드)"""
+        rules = self._rules
+        if rules is not None and (
+            self._reload_interval <= 0
+            or time.monotonic() - self._checked_at < self._reload_interval
+        ):
+            return rules
+        self.reload()
+        return self._rules
+
+    def reload(self, force: bool = False) -> bool:
+        """파일이 바뀌었으면 (force면 항상) 다시 컴파일, 새 규칙을 적용했으면 True"""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                mtime = os.stat(self._path).st_mtime
+                if not force and self._rules is not None and mtime == self._mtime:
+                    return False
+                rules = compile_rules(self._path)
+            except (OSError, RuleSpecError) as e:
+                self._last_error = f"{self._path}: {e}"
+                if self._rules is None:
+                    if self._path == DEFAULT_RULES_PATH:
+                        raise RuleSpecError(self._last_error)
+                    # 사용자 지정 규칙을 처음부터 못 읽으면 기본 규칙으로 시작
+                    logger.warning(f"Scoring rules load failed, using defaults: {self._last_error}")
+                    self._rules = compile_rules(DEFAULT_RULES_PATH)
+                    self._loaded_at = time.time()
+                else:
+                    logger.warning(f"Scoring rules reload failed, keeping {self._rules.digest}: {self._last_error}")
+                return False
+
+            changed = self._rules is None or rules.digest != self._rules.digest
+            self._rules = rules
+            self._mtime = mtime
+            self._loaded_at = time.time()
+            self._last_error = None
+            if changed:
+                logger.info(f"Scoring rules loaded from {self._path} (version={rules.version}, digest={rules.digest})")
+            return changed
+
+    def status(self) -> Dict[str, Any]:
+        """현재 규칙 요약 + 로드 상태"""
+        rules = self.current()
+        return {
+            **rules.describe(),
+            "loaded_at": self._loaded_at,
+            "reload_interval_seconds": self._reload_interval,
+            "last_error": self._last_error,
+        }
+
+
+# 싱글톤 인스턴스 (main.py에서 config.py의 ScoringSettings로 configure)
+scoring_rules = RuleStore()
+
+
+# ============================================================
+# 복합 점수 / 모멘텀 점수
+# ============================================================
+
+def score_candidates(
+    candidates: List[Dict],
+    momentum: Optional[Dict[str, int]] = None,
+    rules: Optional[ScoringRules] = None
+) -> List[Dict]:
+    """현재 규칙(rules 미지정 시 scoring_rules.current())으로 후보 점수 계산"""
+    return (rules or scoring_rules.current()).score(candidates, momentum)
+
+
+def momentum_scores(
+    hist: Optional[pd.DataFrame], symbols: List[str]
+) -> Tuple[Dict[str, int], Set[str]]:
+    """
+    배치 일봉 히스토리 → (종목별 모멘텀 추세 단계, 히스토리가 있던 종목)
+    - 5일 / 10일 수익률 모두 양수 10, 5일만 양수 5, 그 외 / 일봉 10개 미만 0
+    - 히스토리에 행이 없는 종목도 0이지만 두 번째 값에 빠짐 (부분 실패 → 호출부에서 캐시하지 않음)
+    - hist는 yahooquery Ticker.history 형식 (MultiIndex: symbol, date)
+      단일 종목 조회로 일반 인덱스면 symbols[0]의 히스토리로 간주
+    """
+    scores = {symbol: 0 for symbol in symbols}
+    if hist is None or hist.empty or "close" not in hist.columns or not symbols:
+        return scores, set()
+
+    close = pd.to_numeric(hist["close"], errors="coerce")
+    if isinstance(hist.index, pd.MultiIndex):
+        keys = hist.index.get_level_values(0)
+    elif len(symbols) == 1:
+        keys = pd.Index([symbols[0]] * len(hist))
+    else:
+        return scores, set()
+
+    close = pd.Series(close.to_numpy(dtype=float), index=keys)
+    grouped = close.groupby(level=0, sort=False)
+    # 각 행 기준 4 / 9행 전 종가 → 종목별 마지막 행이 closes[-5] / closes[-10]
+    last_rows = pd.DataFrame({
+        "last": close,
+        "base_5d": grouped.shift(4),
+        "base_10d": grouped.shift(9),
+        "days": grouped.transform("size"),
+    }).groupby(level=0, sort=False).tail(1)
+
+    last = last_rows["last"].to_numpy()
+    return_5d = _safe_return(last, last_rows["base_5d"].to_numpy())
+    return_10d = _safe_return(last, last_rows["base_10d"].to_numpy())
+    enough = last_rows["days"].to_numpy() >= MOMENTUM_MIN_DAYS
+
+    points = np.select(
+        [enough & (return_5d > 0) & (return_10d > 0), enough & (return_5d > 0)],
+        [10, 5],
+        default=0
+    )
+    with_data = set()
+    for symbol, point in zip(last_rows.index, points):
+        if symbol in scores:
+            scores[symbol] = int(point)
+            with_data.add(symbol)
+    return scores, with_data
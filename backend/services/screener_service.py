@@ -1,10 +1,24 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import partial
 from yahooquery import Screener, Ticker
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from models.stock import (
     ScreenerType, ScoreBreakdown, WhyHotItem,
     StockDetail, HotStockResponse, RankedStock, TopNStocksResponse
 )
+from services.cache_service import (
+    CacheManager, CacheTTL, cache_manager, CACHE_KEY_MOMENTUM, CACHE_KEY_SCREENER_SNAPSHOT,
+    CACHE_TAG_SCREENER, CACHE_TAG_TICKER
+)
+from services.market_calendar import NY_TZ, session_close, trading_date
+from services.scoring import ScoringRules, momentum_scores, score_candidates, scoring_rules
+
+logger = logging.getLogger(__name__)
 
 
 class ScreenerServiceError(Exception):
@@ -12,8 +26,36 @@ class ScreenerServiceError(Exception):
     pass
 
 
+@dataclass
+class ScreenerSnapshot:
+    """
+    3개 스크리너를 한 번에 조회하고 점수까지 계산한 스냅샷
+    화제 종목 / 모든 (타입, 개수) TOP N 응답은 이 스냅샷을 잘라서 생성
+    """
+    version: int  # 조회 시각 (epoch ms), 새 스냅샷일수록 큼
+    fetched_at: str
+    candidates: Dict[str, List[Dict[str, Any]]]  # 스크리너 타입 → 점수 계산된 후보 (Yahoo 순서)
+    rules_version: str = ""  # 점수 계산에 쓴 규칙 digest (규칙이 바뀌면 스냅샷 다시 생성)
+
+    def top(self, screener_type: ScreenerType, count: int) -> List[Dict[str, Any]]:
+        """스크리너 타입의 상위 count개 (Yahoo 순서)"""
+        return self.candidates.get(screener_type.value, [])[:count]
+
+    def hot_candidates(self, per_type: int) -> List[Dict[str, Any]]:
+        """화제 종목 후보: 타입별 상위 per_type개 합집합 (중복 제거, 먼저 나온 타입 기준)"""
+        unique: Dict[str, Dict[str, Any]] = {}
+        for rows in self.candidates.values():
+            for candidate in rows[:per_type]:
+                unique.setdefault(candidate["symbol"], candidate)
+        return list(unique.values())
+
+
 class HotStockScreener:
-    """복합 지표 기반 화제 종목 스크리너"""
+    """
+    복합 지표 기반 화제 종목 스크리너
+    - 비동기 API (aget_*): yahooquery 블로킹 호출은 전용 스레드 풀에서 실행 → 이벤트 루프 차단 없음
+    - 동기 API (get_*): 이벤트 루프 밖(scripts/daily_briefing.py 등)에서 쓰는 얇은 래퍼
+    """
 
     SCREENER_TYPES = [
         ScreenerType.MOST_ACTIVES,
@@ -21,47 +63,153 @@ class HotStockScreener:
         ScreenerType.DAY_LOSERS
     ]
     CANDIDATES_PER_TYPE = 10  # 각 타입에서 10개씩 = 총 30개
+    MAX_TOP_N = 10  # TOP N 최대 개수 (스냅샷은 max(MAX_TOP_N, CANDIDATES_PER_TYPE)개씩 조회)
     MAX_PARALLEL_REQUESTS = 10  # 병렬 요청 최대 개수
+    MAX_IO_WORKERS = 4  # yahooquery 블로킹 호출 전용 스레드 수 (워커당 동시 업스트림 호출 상한)
+    MOMENTUM_MIN_TTL = 60  # 장 마감 직전에도 최소 이 시간은 캐시
 
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheManager] = None):
         self.screener = Screener()
-        self._momentum_cache: Dict[str, int] = {}  # 모멘텀 점수 캐시
+        # 모멘텀 점수: (심볼, 거래일) 키로 CacheManager에 저장 → 장 마감 시 만료, 워커 간 공유
+        self._cache = cache or cache_manager
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ---- 동기 인터페이스 (이벤트 루프 밖 전용) ----
 
     def get_daily_hot_stock(self) -> HotStockResponse:
+        """오늘의 화제 종목 1개 선정 (동기 래퍼 - async 코드에서는 aget_daily_hot_stock 사용)"""
+        return self._run_sync(self.aget_daily_hot_stock)
+
+    def get_top_n_stocks(
+        self,
+        screener_type: ScreenerType,
+        count: int = 5
+    ) -> TopNStocksResponse:
+        """TOP N 종목 조회 (동기 래퍼 - async 코드에서는 aget_top_n_stocks 사용)"""
+        return self._run_sync(partial(self.aget_top_n_stocks, screener_type, count))
+
+    @staticmethod
+    def _run_sync(coro_fn: Callable[[], Any]) -> Any:
+        """
+        코루틴을 끝까지 실행해 결과 반환
+        실행 중인 루프 안의 동기 코드(scripts/daily_briefing.py의 run_screener 등)에서 불리면
+        별도 스레드의 새 루프에서 실행
         """
-        오늘의 화제 종목 1개 선정
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro_fn())
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro_fn()).result()
 
-        Returns:
-            HotStockResponse: 화제 종목 정보
+    def shutdown(self) -> None:
+        """I/O 스레드 풀 종료 (다음 호출 시 다시 생성)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # ---- 비동기 인터페이스 ----
+
+    async def aget_snapshot(self) -> ScreenerSnapshot:
+        """
+        캐시된 스크리너 스냅샷 (없으면 조회, 워커 간 공유 / 캐시 워머가 만료 전 갱신)
+        점수 규칙이 핫 리로드로 바뀌었으면 캐시된 스냅샷을 버리고 새 규칙으로 다시 생성
         """
-        # 1. 후보 종목 수집 (30개)
-        candidates = self._get_candidates()
+        for _ in range(2):
+            snapshot = await self._cache.get_or_set(
+                CACHE_KEY_SCREENER_SNAPSHOT, self.abuild_snapshot, CacheTTL.for_data("top_n"),
+                tags=self.snapshot_tags()
+            )
+            if snapshot.rules_version == scoring_rules.current().digest:
+                break
+            await self._cache.adelete(CACHE_KEY_SCREENER_SNAPSHOT)
+        return snapshot
 
-        if not candidates:
-            raise ScreenerServiceError("후보 종목을 찾을 수 없습니다")
+    def snapshot_tags(self) -> List[str]:
+        """스냅샷 캐시 태그 (모든 스크리너 타입)"""
+        return [CACHE_TAG_SCREENER.format(type=st.value) for st in self.SCREENER_TYPES]
+
+    async def abuild_snapshot(self) -> ScreenerSnapshot:
+        """
+        3개 스크리너를 최대 개수로 1회 조회 → 중복 제거한 종목을 한 번만 점수 계산
+        """
+        screener_ids = [st.value for st in self.SCREENER_TYPES]
+        count = max(self.MAX_TOP_N, self.CANDIDATES_PER_TYPE)
+        rules = scoring_rules.current()
+
+        try:
+            result = await self._run_io(self.screener.get_screeners, screener_ids, count=count)
+
+            if not isinstance(result, dict):
+                raise ScreenerServiceError(f"스크리너 응답 오류: {type(result)}")
+
+            unique: Dict[str, Dict[str, Any]] = {}
+            candidates: Dict[str, List[Dict[str, Any]]] = {}
+            for screener_id in screener_ids:
+                screener_result = result.get(screener_id)
+                quotes = screener_result.get("quotes", []) if isinstance(screener_result, dict) else []
+
+                rows = []
+                for quote in quotes[:count]:
+                    symbol = quote.get("symbol")
+                    if not symbol:
+                        continue
+                    if symbol not in unique:
+                        unique[symbol] = self._to_candidate(quote, screener_id)
+                    rows.append(unique[symbol])
+                candidates[screener_id] = rows
+
+            if not unique:
+                raise ScreenerServiceError("후보 종목을 찾을 수 없습니다")
+
+            await self._ascore(list(unique.values()), rules)
+
+        except ScreenerServiceError:
+            raise
+        except Exception as e:
+            raise ScreenerServiceError(f"스크리너 스냅샷 조회 실패: {str(e)}")
+
+        now = time.time()
+        logger.info(
+            f"Screener snapshot built ({len(unique)} symbols, "
+            + ", ".join(f"{k}={len(v)}" for k, v in candidates.items()) + ")"
+        )
+        return ScreenerSnapshot(
+            version=int(now * 1000),
+            fetched_at=datetime.fromtimestamp(now).isoformat(),
+            candidates=candidates,
+            rules_version=rules.digest
+        )
+
+    async def aget_daily_hot_stock(self) -> HotStockResponse:
+        """
+        오늘의 화제 종목 1개 선정 (스냅샷의 타입별 상위 후보에서)
 
-        # 2. 복합 점수 계산
-        scored_candidates = self._calculate_scores(candidates)
+        Returns:
+            HotStockResponse: 화제 종목 정보
+        """
+        # 1. 후보 종목 (타입별 10개, 점수 계산된 스냅샷에서)
+        snapshot = await self.aget_snapshot()
+        scored_candidates = snapshot.hot_candidates(self.CANDIDATES_PER_TYPE)
 
-        # 빈 리스트 검사
         if not scored_candidates:
-            raise ScreenerServiceError("점수 계산된 후보 종목이 없습니다")
+            raise ScreenerServiceError("후보 종목을 찾을 수 없습니다")
 
-        # 3. TOP 1 선정 (점수순, 동점시 거래량순)
+        # 2. TOP 1 선정 (점수순, 동점시 거래량순)
         winner = sorted(
             scored_candidates,
             key=lambda x: (x["score"].total, x["volume"]),
             reverse=True
         )[0]
 
-        # 4. 상세 정보 조회
+        # 3. 상세 정보 조회
         stock_detail = self._get_stock_detail(winner)
 
-        # 5. WHY HOT 생성
+        # 4. WHY HOT 생성
         why_hot = self._generate_why_hot(winner, stock_detail)
 
-        # 6. 뉴스 조회 (선택)
-        news = self._get_news(winner["symbol"])
+        # 5. 뉴스 조회 (선택)
+        news = await self._run_io(self._get_news, winner["symbol"])
 
         return HotStockResponse(
             stock=stock_detail,
@@ -70,13 +218,13 @@ class HotStockScreener:
             recent_news=news
         )
 
-    def get_top_n_stocks(
+    async def aget_top_n_stocks(
         self,
         screener_type: ScreenerType,
         count: int = 5
     ) -> TopNStocksResponse:
         """
-        TOP N 종목 조회
+        TOP N 종목 조회 (스냅샷의 해당 타입 상위 count개를 점수순 정렬)
 
         Args:
             screener_type: 스크리너 타입 (most_actives, day_gainers, day_losers)
@@ -86,48 +234,24 @@ class HotStockScreener:
             TopNStocksResponse: TOP N 종목 리스트
         """
         # count 범위 검증
-        count = max(1, min(10, count))
+        count = max(1, min(self.MAX_TOP_N, count))
 
         try:
-            # 1. 해당 스크리너에서 종목 조회
-            result = self.screener.get_screeners([screener_type.value], count=count)
+            # 1. 스냅샷에서 해당 스크리너 상위 count개
+            snapshot = await self.aget_snapshot()
+            scored_candidates = snapshot.top(screener_type, count)
 
-            if not isinstance(result, dict):
-                raise ScreenerServiceError(f"스크리너 응답 오류: {type(result)}")
-
-            if screener_type.value not in result:
-                raise ScreenerServiceError(f"스크리너 '{screener_type.value}' 결과 없음")
-
-            quotes = result[screener_type.value].get("quotes", [])
-
-            if not quotes:
+            if not scored_candidates:
                 raise ScreenerServiceError(f"'{screener_type.value}' 결과가 비어있음")
 
-            # 2. 후보 리스트 생성
-            candidates = []
-            for quote in quotes[:count]:
-                candidates.append({
-                    "symbol": quote.get("symbol"),
-                    "name": quote.get("shortName") or quote.get("longName", ""),
-                    "price": quote.get("regularMarketPrice", 0),
-                    "change": quote.get("regularMarketChange", 0),
-                    "change_percent": quote.get("regularMarketChangePercent", 0),
-                    "volume": quote.get("regularMarketVolume", 0),
-                    "avg_volume": quote.get("averageDailyVolume3Month", 0),
-                    "market_cap": quote.get("marketCap"),
-                })
-
-            # 3. 점수 계산
-            scored_candidates = self._calculate_scores(candidates)
-
-            # 4. 점수순 정렬 (동점시 거래량순)
+            # 2. 점수순 정렬 (동점시 거래량순)
             sorted_candidates = sorted(
                 scored_candidates,
                 key=lambda x: (x["score"].total, x["volume"]),
                 reverse=True
             )
 
-            # 5. RankedStock 리스트 생성
+            # 3. RankedStock 리스트 생성
             ranked_stocks = []
             for rank, candidate in enumerate(sorted_candidates, 1):
                 stock_detail = StockDetail(
@@ -159,237 +283,110 @@ class HotStockScreener:
         except Exception as e:
             raise ScreenerServiceError(f"TOP N 조회 실패: {str(e)}")
 
-    def _get_candidates(self) -> List[Dict[str, Any]]:
-        """3개 스크리너에서 후보 종목 수집"""
-        candidates = []
-        seen_symbols = set()
-
-        try:
-            screener_ids = [st.value for st in self.SCREENER_TYPES]
-            result = self.screener.get_screeners(
-                screener_ids,
-                count=self.CANDIDATES_PER_TYPE
+    async def _run_io(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """블로킹 yahooquery 호출을 전용 스레드 풀에서 실행"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_IO_WORKERS, thread_name_prefix="screener-io"
             )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _to_candidate(quote: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """스크리너 quote → 후보 dict"""
+        return {
+            "symbol": quote.get("symbol"),
+            "name": quote.get("shortName") or quote.get("longName", ""),
+            "price": quote.get("regularMarketPrice", 0),
+            "change": quote.get("regularMarketChange", 0),
+            "change_percent": quote.get("regularMarketChangePercent", 0),
+            "volume": quote.get("regularMarketVolume", 0),
+            "avg_volume": quote.get("averageDailyVolume3Month", 0),
+            "market_cap": quote.get("marketCap"),
+            "source": source
+        }
+
+    async def _ascore(self, candidates: List[Dict], rules: Optional[ScoringRules] = None) -> List[Dict]:
+        """모멘텀 점수 조회 후 복합 점수 계산"""
+        momentum = await self._aget_momentum_scores([c["symbol"] for c in candidates])
+        return self._calculate_scores(candidates, momentum, rules)
+
+    async def _aget_momentum_scores(
+        self, symbols: List[str], now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        모멘텀 점수 (심볼, 거래일) 캐시 조회 → 미스만 1mo 히스토리 배치 조회 (스레드 풀)
+        - 거래일은 장 마감 시각에 넘어가므로 새 종가가 생기면 자동으로 다시 계산
+        - 배치 조회 실패 / 히스토리가 없는 종목은 0점 (캐시하지 않음, 다음 호출에서 다시 조회)
+        """
+        day = trading_date(now)
+        keys = {
+            symbol: CACHE_KEY_MOMENTUM.format(ticker=symbol, date=day.isoformat())
+            for symbol in dict.fromkeys(symbols)
+        }
+        cached = await self._cache.aget_many(list(keys.values()))
+        scores = {symbol: cached[key] for symbol, key in keys.items() if key in cached}
+
+        missing = [symbol for symbol in keys if symbol not in scores]
+        if not missing:
+            return scores
 
-            if not isinstance(result, dict):
-                raise ScreenerServiceError(f"스크리너 응답 오류: {type(result)}")
-
-            for screener_type in screener_ids:
-                if screener_type not in result:
-                    continue
-
-                quotes = result[screener_type].get("quotes", [])
-
-                for quote in quotes:
-                    symbol = quote.get("symbol")
-                    if not symbol or symbol in seen_symbols:
-                        continue
-
-                    seen_symbols.add(symbol)
-                    candidates.append({
-                        "symbol": symbol,
-                        "name": quote.get("shortName") or quote.get("longName", ""),
-                        "price": quote.get("regularMarketPrice", 0),
-                        "change": quote.get("regularMarketChange", 0),
-                        "change_percent": quote.get("regularMarketChangePercent", 0),
-                        "volume": quote.get("regularMarketVolume", 0),
-                        "avg_volume": quote.get("averageDailyVolume3Month", 0),
-                        "market_cap": quote.get("marketCap"),
-                        "source": screener_type
-                    })
-
-            return candidates
-
-        except ScreenerServiceError:
-            raise
+        try:
+            fetched = await self._run_io(self._calculate_momentum_scores_batch, missing)
         except Exception as e:
-            raise ScreenerServiceError(f"후보 수집 실패: {str(e)}")
-
-    def _calculate_scores(self, candidates: List[Dict]) -> List[Dict]:
-        """복합 점수 계산 (모멘텀 점수는 배치 병렬 처리)"""
-        # 1. 먼저 모멘텀 점수가 필요한 심볼들을 수집
-        symbols_to_fetch = [
-            c["symbol"] for c in candidates
-            if c["symbol"] not in self._momentum_cache
-        ]
-
-        # 2. 배치로 모멘텀 점수 병렬 계산 (캐시 미스인 것만)
-        if symbols_to_fetch:
-            momentum_scores = self._calculate_momentum_scores_batch(symbols_to_fetch)
-            self._momentum_cache.update(momentum_scores)
-
-        # 3. 각 종목의 점수 계산
-        for candidate in candidates:
-            score = ScoreBreakdown()
-
-            # 1. 거래량 급증 점수 (10점)
-            volume = candidate.get("volume", 0)
-            avg_volume = candidate.get("avg_volume", 0)
-
-            if avg_volume and avg_volume > 0:
-                volume_ratio = volume / avg_volume
-                candidate["volume_ratio"] = round(volume_ratio, 2)
-
-                if volume_ratio >= 3:
-                    score.volume_score = 10
-                elif volume_ratio >= 2:
-                    score.volume_score = 7
-                elif volume_ratio >= 1.5:
-                    score.volume_score = 5
-
-            # 2. 가격 변동 점수 (10점)
-            change_percent = abs(candidate.get("change_percent", 0))
-
-            if change_percent >= 5:
-                score.price_change_score = 10
-            elif change_percent >= 3:
-                score.price_change_score = 7
-            elif change_percent >= 2:
-                score.price_change_score = 5
-
-            # 3. 모멘텀 점수 (10점) - 캐시에서 가져옴
-            momentum_score = self._momentum_cache.get(candidate["symbol"], 0)
-            score.momentum_score = momentum_score
-            candidate["momentum_data"] = momentum_score > 0
-
-            # 4. 시가총액 적정성 점수 (10점)
-            market_cap = candidate.get("market_cap", 0)
-
-            if market_cap:
-                cap_billions = market_cap / 1_000_000_000
-
-                if 2 <= cap_billions <= 100:
-                    score.market_cap_score = 10
-                elif 1 <= cap_billions <= 200:
-                    score.market_cap_score = 5
-
-            # 총점 계산
-            score.total = (
-                score.volume_score +
-                score.price_change_score +
-                score.momentum_score +
-                score.market_cap_score
+            logger.warning(f"Momentum history fetch failed: {e}")
+            scores.update({symbol: 0 for symbol in missing})
+            return scores
+
+        scores.update({symbol: fetched.get(symbol, 0) for symbol in missing})
+        found = [symbol for symbol in missing if symbol in fetched]
+        if len(found) < len(missing):
+            logger.warning(f"Momentum history missing for {len(missing) - len(found)} symbols (not cached)")
+        if found:
+            await self._cache.aset_many(
+                {keys[symbol]: fetched[symbol] for symbol in found},
+                self._momentum_ttl(day, now),
+                tags={keys[symbol]: [CACHE_TAG_TICKER.format(ticker=symbol)] for symbol in found}
             )
+        return scores
 
-            candidate["score"] = score
+    def _momentum_ttl(self, day: date, now: Optional[datetime] = None) -> int:
+        """거래일 day의 장 마감까지 남은 초 (최소 MOMENTUM_MIN_TTL)"""
+        now = (now or datetime.now(NY_TZ)).astimezone(NY_TZ)
+        remaining = (session_close(day) - now).total_seconds()
+        return max(self.MOMENTUM_MIN_TTL, int(remaining))
 
-        return candidates
+    def _calculate_scores(
+        self,
+        candidates: List[Dict],
+        momentum: Dict[str, int],
+        rules: Optional[ScoringRules] = None
+    ) -> List[Dict]:
+        """
+        복합 점수 계산 (선언적 점수 규칙, 모멘텀 점수는 미리 조회한 값 사용, I/O 없음)
+        후보에 "score" / "reasons"(WHY HOT 문구) / "volume_ratio" / "momentum_data" 기록
+        """
+        return score_candidates(candidates, momentum, rules)
 
     def _calculate_momentum_scores_batch(self, symbols: List[str]) -> Dict[str, int]:
         """
-        여러 종목의 모멘텀 점수를 배치로 병렬 계산
+        여러 종목의 모멘텀 점수를 배치로 계산 (블로킹, 스레드 풀에서 실행)
         yahooquery의 Ticker는 여러 심볼을 한 번에 처리할 수 있음
+        배치 조회 자체가 실패하면 예외 발생 (호출부에서 0점 처리, 캐시하지 않음)
+        히스토리가 있는 종목만 반환 (응답에서 빠진 종목은 호출부에서 0점, 캐시하지 않음)
         """
-        momentum_scores: Dict[str, int] = {}
-
         if not symbols:
-            return momentum_scores
-
-        try:
-            # yahooquery는 여러 심볼을 한 번에 처리 가능
-            ticker = Ticker(symbols, asynchronous=True)
-            hist = ticker.history(period="1mo", interval="1d")
-
-            if hist is None or hist.empty:
-                return {s: 0 for s in symbols}
-
-            # MultiIndex DataFrame 처리
-            for symbol in symbols:
-                try:
-                    if isinstance(hist.index, type(hist.index)) and hasattr(hist.index, 'get_level_values'):
-                        # MultiIndex인 경우 심볼별로 슬라이싱
-                        try:
-                            symbol_hist = hist.loc[symbol] if symbol in hist.index.get_level_values(0) else None
-                        except KeyError:
-                            symbol_hist = None
-                    else:
-                        symbol_hist = hist
-
-                    if symbol_hist is None or (hasattr(symbol_hist, 'empty') and symbol_hist.empty):
-                        momentum_scores[symbol] = 0
-                        continue
-
-                    closes = symbol_hist["close"].values if "close" in symbol_hist.columns else []
-
-                    if len(closes) < 10:
-                        momentum_scores[symbol] = 0
-                        continue
-
-                    # 5일 수익률 (0으로 나누기 방지)
-                    return_5d = (closes[-1] - closes[-5]) / closes[-5] * 100 if closes[-5] and closes[-5] != 0 else 0
-                    # 10일 수익률 (0으로 나누기 방지)
-                    return_10d = (closes[-1] - closes[-10]) / closes[-10] * 100 if closes[-10] and closes[-10] != 0 else 0
-
-                    if return_5d > 0 and return_10d > 0:
-                        momentum_scores[symbol] = 10
-                    elif return_5d > 0:
-                        momentum_scores[symbol] = 5
-                    else:
-                        momentum_scores[symbol] = 0
-
-                except Exception:
-                    momentum_scores[symbol] = 0
-
-        except Exception:
-            # 배치 실패 시 모든 심볼에 0점
-            momentum_scores = {s: 0 for s in symbols}
-
-        # 누락된 심볼 처리
-        for symbol in symbols:
-            if symbol not in momentum_scores:
-                momentum_scores[symbol] = 0
-
-        return momentum_scores
-
-    def _calculate_momentum_score(self, symbol: str) -> int:
-        """모멘텀 점수 계산 (5일/10일 수익률 기반) - 캐시 우선 확인"""
-        # 캐시 확인
-        if symbol in self._momentum_cache:
-            return self._momentum_cache[symbol]
+            return {}
 
-        try:
-            ticker = Ticker(symbol)
-            hist = ticker.history(period="1mo", interval="1d")
-
-            if hist is None or hist.empty:
-                self._momentum_cache[symbol] = 0
-                return 0
-
-            # MultiIndex 처리
-            if isinstance(hist.index, type(hist.index)) and hasattr(hist.index, 'get_level_values'):
-                try:
-                    hist = hist.reset_index()
-                except Exception:
-                    pass
-
-            if "close" not in hist.columns:
-                self._momentum_cache[symbol] = 0
-                return 0
-
-            closes = hist["close"].values
-
-            if len(closes) < 10:
-                self._momentum_cache[symbol] = 0
-                return 0
-
-            # 5일 수익률 (0으로 나누기 방지)
-            return_5d = (closes[-1] - closes[-5]) / closes[-5] * 100 if closes[-5] and closes[-5] != 0 else 0
-            # 10일 수익률 (0으로 나누기 방지)
-            return_10d = (closes[-1] - closes[-10]) / closes[-10] * 100 if closes[-10] and closes[-10] != 0 else 0
-
-            if return_5d > 0 and return_10d > 0:
-                score = 10
-            elif return_5d > 0:
-                score = 5
-            else:
-                score = 0
-
-            self._momentum_cache[symbol] = score
-            return score
-
-        except Exception:
-            self._momentum_cache[symbol] = 0
-            return 0
+        # yahooquery는 여러 심볼을 한 번에 처리 가능 → 종목별 수익률은 groupby 한 번으로 계산
+        ticker = Ticker(symbols, asynchronous=True)
+        hist = ticker.history(period="1mo", interval="1d")
+        if isinstance(hist, dict):
+            # 전체 실패 시 yahooquery는 심볼별 에러 메시지 dict 반환
+            raise ScreenerServiceError(f"일봉 히스토리 조회 실패: {hist}")
+        scores, with_data = momentum_scores(hist, symbols)
+        return {symbol: scores[symbol] for symbol in with_data}
 
     def _get_stock_detail(self, candidate: Dict) -> StockDetail:
         """종목 상세 정보 조회 - candidate 데이터 재사용으로 API 호출 최소화"""
@@ -411,43 +408,10 @@ class HotStockScreener:
     def _generate_why_hot(self, candidate: Dict, detail: StockDetail) -> List[WhyHotItem]:
         """WHY HOT 생성"""
         items = []
-        score = candidate["score"]
-
-        # 거래량 급증
-        volume_ratio = candidate.get("volume_ratio", 0)
-        if volume_ratio >= 1.5:
-            items.append(WhyHotItem(
-                icon="✅",
-                message=f"거래량 급증 (평소 대비 {volume_ratio}배)"
-            ))
-
-        # 가격 변동
-        change_pct = candidate.get("change_percent", 0)
-        if abs(change_pct) >= 2:
-            direction = "상승" if change_pct > 0 else "하락"
-            items.append(WhyHotItem(
-                icon="✅",
-                message=f"당일 {abs(change_pct):.1f}% {direction}"
-            ))
 
-        # 모멘텀
-        if score.momentum_score == 10:
-            items.append(WhyHotItem(
-                icon="✅",
-                message="5일·10일 수익률 모두 양수 (상승 추세)"
-            ))
-        elif score.momentum_score == 5:
-            items.append(WhyHotItem(
-                icon="✅",
-                message="5일 수익률 양수 (단기 상승)"
-            ))
-
-        # 시가총액
-        if score.market_cap_score == 10:
-            items.append(WhyHotItem(
-                icon="✅",
-                message="적정 시가총액 구간 ($2B~$100B)"
-            ))
+        # 점수 규칙에서 맞은 구간의 문구 (거래량 / 가격 변동 / 모멘텀 / 시가총액)
+        for reason in candidate.get("reasons", []):
+            items.append(WhyHotItem(icon="✅", message=reason))
 
         # PER 경고
         if detail.pe_ratio and detail.pe_ratio > 100:
@@ -0,0 +1,445 @@
+"""
+공유 메모리 L1 캐시 (워커 간 공유)
+
+기능:
+- mmap 파일 기반 고정 크기 슬롯 해시 테이블 (open addressing, linear probing)
+- 같은 호스트의 모든 uvicorn 워커가 같은 엔트리를 공유 (N워커 = 1벌 메모리)
+- 읽기: 락 없이 memoryview로 직접 역직렬화 (slot 버전 seqlock으로 찢어진 읽기 감지)
+- 쓰기: fcntl.flock 파일 락으로 워커 간 직렬화
+- MemoryCache와 같은 인터페이스 (CacheManager L1으로 교체 가능)
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from services.cache_codec import CacheCodec, PickleCodec
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMemoryCacheError(Exception):
+    """공유 메모리 캐시 에러"""
+    pass
+
+
+# ============================================================
+# 파일 레이아웃
+# ============================================================
+
+# 헤더: magic, slot_count, slot_size, codec 이름 해시
+_MAGIC = b"NNSHM001"
+_FILE_HEADER = struct.Struct("<8sIIQ")
+_FILE_HEADER_SIZE = 64
+
+# 슬롯 헤더: version(seqlock), state, key_hash, expires_at, key_len, tags_len, value_len
+_SLOT_HEADER = struct.Struct("<IBxxxQdHHI")
+_VERSION = struct.Struct("<I")
+
+_EMPTY = 0
+_USED = 1
+_DELETED = 2  # tombstone (탐색은 계속, 삽입은 재사용)
+
+
+def _default_path() -> str:
+    """/dev/shm이 있으면 RAM 기반 파일 사용"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "noname-l1-cache")
+
+
+def _stable_hash(key: bytes) -> int:
+    """프로세스 간 동일한 64비트 해시 (hash()는 프로세스마다 다름)"""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+# ============================================================
+# 공유 메모리 캐시
+# ============================================================
+
+class SharedMemoryCache:
+    """
+    L1: 공유 메모리 캐시
+    - 슬롯 크기보다 큰 값은 저장하지 않음 (set이 False 반환, oversize 집계)
+    - 탐색 구간(MAX_PROBE)이 가득 차면 만료가 가장 빠른 슬롯을 교체 (전역 LRU 없음)
+    - 패턴 삭제/키 목록/태그 무효화는 슬롯 전체 스캔 (O(슬롯 수))
+    - 통계는 워커별 집계
+    """
+
+    MAX_PROBE = 32
+    READ_RETRIES = 3
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_memory_mb: int = 100,
+        codec: Optional[CacheCodec] = None,
+        path: Optional[str] = None,
+        slot_size: int = 64 * 1024
+    ):
+        # CacheStats는 cache_service에 정의 (순환 import 방지)
+        from services.cache_service import CacheStats
+
+        self._codec = codec or PickleCodec()
+        self._path = path or _default_path()
+        self._slot_size = slot_size
+        self._slot_count = max(16, min(max_entries, (max_memory_mb * 1024 * 1024) // slot_size))
+        self._max_payload = slot_size - _SLOT_HEADER.size
+        self._stats = CacheStats()
+        self.oversize = 0
+        self._sweep_cursor = 0
+        self.on_evict: Optional[Callable[[str], None]] = None  # 유효한 엔트리를 덮어쓸 때 호출 (메트릭)
+
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._mm = self._open_table()
+        except Exception:
+            os.close(self._fd)
+            raise
+        self._view = memoryview(self._mm)
+
+    # ---- 테이블 초기화 ----
+
+    def _open_table(self) -> mmap.mmap:
+        """파일 헤더가 현재 설정과 다르면 (첫 실행, 슬롯/코덱 변경) 테이블 재생성"""
+        import fcntl
+
+        size = _FILE_HEADER_SIZE + self._slot_count * self._slot_size
+        codec_hash = _stable_hash(self._codec.name.encode())
+        expected = _FILE_HEADER.pack(_MAGIC, self._slot_count, self._slot_size, codec_hash)
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size != size or os.pread(
+                self._fd, _FILE_HEADER.size, 0
+            ) != expected:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, expected, 0)
+                logger.info(
+                    f"Shared memory cache initialized ({self._path}, "
+                    f"{self._slot_count} slots x {self._slot_size} bytes)"
+                )
+            return mmap.mmap(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """mmap / 파일 닫기 (공유 파일은 유지)"""
+        self._view.release()
+        self._mm.close()
+        os.close(self._fd)
+
+    # ---- 공개 인터페이스 (MemoryCache 호환) ----
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회 (락 없음, seqlock 재시도)"""
+        key_bytes = key.encode()
+        key_hash = _stable_hash(key_bytes)
+
+        for _ in range(self.READ_RETRIES):
+            try:
+                found = self._read(key_bytes, key_hash)
+            except _TornRead:
+                continue
+            if found is None:
+                break
+            self._stats.hits += 1
+            return found
+
+        self._stats.misses += 1
+        return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        size_bytes: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        encoded: Optional[bytes] = None
+    ) -> bool:
+        """
+        캐시에 값 저장 - size_bytes는 호환용 (항상 직렬화 크기 사용)
+        encoded: 같은 코덱으로 이미 직렬화한 바이트 (재직렬화 생략)
+        """
+        try:
+            key_bytes = key.encode()
+            tag_bytes = json.dumps(list(tags)).encode() if tags else b""
+            data = encoded if encoded is not None else self._codec.encode(value)
+            if len(key_bytes) + len(tag_bytes) + len(data) > self._max_payload:
+                self.oversize += 1
+                return False
+
+            key_hash = _stable_hash(key_bytes)
+            now = time.time()
+            with self._write_lock():
+                index = self._find_slot_for_write(key_bytes, key_hash)
+                _, state, _, expires_at, key_len, _, _ = self._slot_header(index)
+                previous = self._slot_key(index, key_len) if state == _USED else None
+                self._write_slot(
+                    index, key_hash, now + ttl_seconds, key_bytes, tag_bytes, data
+                )
+            self._stats.sets += 1
+            if previous and previous != key_bytes and expires_at >= now and self.on_evict:
+                self.on_evict(previous.decode())
+            return True
+        except Exception as e:
+            logger.warning(f"Shared memory cache set error: {e}")
+            self._stats.errors += 1
+            return False
+
+    def delete(self, key: str) -> bool:
+        """캐시에서 값 삭제"""
+        key_bytes = key.encode()
+        key_hash = _stable_hash(key_bytes)
+        with self._write_lock():
+            index = self._locate(key_bytes, key_hash)
+            if index is None:
+                return False
+            self._mark_deleted(index)
+        self._stats.deletes += 1
+        return True
+
+    def clear(self) -> int:
+        """전체 캐시 삭제"""
+        count = 0
+        with self._write_lock():
+            for index in range(self._slot_count):
+                if self._slot_header(index)[1] == _USED:
+                    count += 1
+                self._mark_deleted(index, state=_EMPTY)
+        return count
+
+    def clear_pattern(self, pattern: str) -> int:
+        """패턴에 매칭되는 키 삭제 (슬롯 전체 스캔)"""
+        removed = 0
+        with self._write_lock():
+            for index, key, _ in self._iter_used():
+                if fnmatchcase(key, pattern):
+                    self._mark_deleted(index)
+                    removed += 1
+        return removed
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        """패턴에 매칭되는 키 목록"""
+        now = time.time()
+        return [
+            key for index, key, expires_at in self._iter_used()
+            if expires_at > now and (pattern == "*" or fnmatchcase(key, pattern))
+        ]
+
+    def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그가 붙은 모든 키 삭제 (삭제된 키 목록 반환)"""
+        targets = set(tags)
+        removed = []
+        with self._write_lock():
+            for index, key, _ in self._iter_used():
+                if targets & set(self._slot_tags(index)):
+                    self._mark_deleted(index)
+                    removed.append(key)
+        return removed
+
+    def cleanup_expired(self, max_items: Optional[int] = None) -> int:
+        """
+        만료된 슬롯 정리 (커서 기준 순차 스캔)
+        max_items: 한 번에 확인할 최대 슬롯 수 (None이면 전체)
+        """
+        now = time.time()
+        removed = 0
+        budget = self._slot_count if max_items is None else max_items
+
+        with self._write_lock():
+            while budget > 0:
+                index = self._sweep_cursor
+                _, state, _, expires_at, _, _, _ = self._slot_header(index)
+                if state == _USED and expires_at < now:
+                    self._mark_deleted(index)
+                    removed += 1
+                self._sweep_cursor = (index + 1) % self._slot_count
+                budget -= 1
+                if self._sweep_cursor == 0:
+                    break
+
+        return removed
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @property
+    def key_count(self) -> int:
+        now = time.time()
+        return sum(1 for _, _, expires_at in self._iter_used() if expires_at > now)
+
+    @property
+    def has_expired_entries(self) -> bool:
+        """스캔이 진행 중이면 True (janitor가 한 바퀴를 마저 돌도록)"""
+        return self._sweep_cursor != 0
+
+    @property
+    def memory_usage_mb(self) -> float:
+        return self.key_count * self._slot_size / (1024 * 1024)
+
+    def admission_stats(self) -> Optional[dict]:
+        """공유 메모리 캐시는 입장 정책 없음"""
+        return None
+
+    def compression_stats(self) -> Optional[dict]:
+        """공유 메모리 캐시는 코덱 바이트를 그대로 저장 (압축은 cache_compression 설정)"""
+        return None
+
+    # ---- 슬롯 접근 ----
+
+    def _offset(self, index: int) -> int:
+        return _FILE_HEADER_SIZE + index * self._slot_size
+
+    def _slot_header(self, index: int) -> Tuple[int, int, int, float, int, int, int]:
+        return _SLOT_HEADER.unpack_from(self._mm, self._offset(index))
+
+    def _slot_key(self, index: int, key_len: int) -> bytes:
+        start = self._offset(index) + _SLOT_HEADER.size
+        return self._mm[start:start + key_len]
+
+    def _slot_tags(self, index: int) -> List[str]:
+        _, _, _, _, key_len, tags_len, _ = self._slot_header(index)
+        if not tags_len:
+            return []
+        start = self._offset(index) + _SLOT_HEADER.size + key_len
+        return json.loads(self._mm[start:start + tags_len])
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        start = key_hash % self._slot_count
+        for i in range(min(self.MAX_PROBE, self._slot_count)):
+            yield (start + i) % self._slot_count
+
+    def _read(self, key_bytes: bytes, key_hash: int) -> Optional[Any]:
+        """키 조회 - 쓰기 중이거나 읽는 동안 버전이 바뀌면 _TornRead"""
+        for index in self._probe(key_hash):
+            offset = self._offset(index)
+            version, state, slot_hash, expires_at, key_len, tags_len, value_len = (
+                _SLOT_HEADER.unpack_from(self._mm, offset)
+            )
+            if state == _EMPTY:
+                return None
+            if state != _USED or slot_hash != key_hash:
+                continue
+            if version & 1:
+                raise _TornRead()
+
+            start = offset + _SLOT_HEADER.size
+            if self._view[start:start + key_len] != key_bytes:
+                continue
+            if expires_at < time.time():
+                return None
+
+            # 복사 없이 공유 메모리에서 바로 역직렬화
+            value_start = start + key_len + tags_len
+            try:
+                value = self._codec.decode(self._view[value_start:value_start + value_len])
+            except Exception:
+                raise _TornRead()
+            if _VERSION.unpack_from(self._mm, offset)[0] != version:
+                raise _TornRead()
+            return value
+        return None
+
+    def _locate(self, key_bytes: bytes, key_hash: int) -> Optional[int]:
+        """키가 저장된 슬롯 (쓰기 락 안에서 호출)"""
+        for index in self._probe(key_hash):
+            _, state, slot_hash, _, key_len, _, _ = self._slot_header(index)
+            if state == _EMPTY:
+                return None
+            if (state == _USED and slot_hash == key_hash
+                    and self._slot_key(index, key_len) == key_bytes):
+                return index
+        return None
+
+    def _find_slot_for_write(self, key_bytes: bytes, key_hash: int) -> int:
+        """같은 키 슬롯 > 빈/삭제/만료 슬롯 > 만료가 가장 빠른 슬롯 순으로 선택"""
+        now = time.time()
+        free_index = None
+        victim_index, victim_expires = None, float("inf")
+
+        for index in self._probe(key_hash):
+            _, state, slot_hash, expires_at, key_len, _, _ = self._slot_header(index)
+            if state == _USED and slot_hash == key_hash and self._slot_key(index, key_len) == key_bytes:
+                return index
+            if free_index is None and (state != _USED or expires_at < now):
+                free_index = index
+            if state == _EMPTY:
+                break
+            if state == _USED and expires_at < victim_expires:
+                victim_index, victim_expires = index, expires_at
+
+        return free_index if free_index is not None else victim_index
+
+    def _write_slot(
+        self,
+        index: int,
+        key_hash: int,
+        expires_at: float,
+        key_bytes: bytes,
+        tag_bytes: bytes,
+        data: bytes
+    ) -> None:
+        """seqlock 쓰기: 버전 홀수 → 내용 기록 → 버전 짝수"""
+        offset = self._offset(index)
+        version = _VERSION.unpack_from(self._mm, offset)[0]
+        _VERSION.pack_into(self._mm, offset, version + 1)
+
+        start = offset + _SLOT_HEADER.size
+        payload = key_bytes + tag_bytes + data
+        self._mm[start:start + len(payload)] = payload
+        _SLOT_HEADER.pack_into(
+            self._mm, offset, version + 1, _USED, key_hash, expires_at,
+            len(key_bytes), len(tag_bytes), len(data)
+        )
+        _VERSION.pack_into(self._mm, offset, version + 2)
+
+    def _mark_deleted(self, index: int, state: int = _DELETED) -> None:
+        offset = self._offset(index)
+        version, current, *_ = self._slot_header(index)
+        if current == state:
+            return
+        _VERSION.pack_into(self._mm, offset, version + 1)
+        _SLOT_HEADER.pack_into(self._mm, offset, version + 1, state, 0, 0.0, 0, 0, 0)
+        _VERSION.pack_into(self._mm, offset, version + 2)
+
+    def _iter_used(self) -> Iterator[Tuple[int, str, float]]:
+        """사용 중인 슬롯 (index, key, expires_at)"""
+        for index in range(self._slot_count):
+            _, state, _, expires_at, key_len, _, _ = self._slot_header(index)
+            if state == _USED:
+                yield index, self._slot_key(index, key_len).decode(), expires_at
+
+    def _write_lock(self) -> "_FileLock":
+        return _FileLock(self._fd)
+
+
+class _TornRead(Exception):
+    """읽는 도중 다른 워커가 슬롯을 변경함"""
+    pass
+
+
+class _FileLock:
+    """fcntl.flock 기반 워커 간 쓰기 락"""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    def __enter__(self):
+        import fcntl
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        import fcntl
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return False
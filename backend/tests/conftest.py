@@ -26,6 +26,15 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_stock_cache():
+    """Give each test an empty cache so API results never leak between tests."""
+    from services.cache_service import CacheManager
+    with patch('api.stock.cache', new_callable=CacheManager) as cache, \
+         patch('api.briefing.cache', new=cache):
+        yield cache
+
+
 @pytest.fixture
 def mock_cache():
     """Mock cache for testing without actual cache dependency."""
@@ -180,6 +189,7 @@ def app_without_lifespan():
     from fastapi.middleware.cors import CORSMiddleware
     from api.stock import router as stock_router
     from api.briefing import router as briefing_router
+    from api.screener import router as screener_router
 
     test_app = FastAPI(title="Test API")
 
@@ -193,6 +203,7 @@ def app_without_lifespan():
 
     test_app.include_router(stock_router)
     test_app.include_router(briefing_router)
+    test_app.include_router(screener_router)
 
     @test_app.get("/")
     async def root():
@@ -238,3 +238,42 @@ class TestBriefingByDateAPI:
             assert "momentum_score" in score
             assert "market_cap_score" in score
             assert "total" in score
+
+
+class TestBriefingCache:
+    """Test cases for briefing response caching across writer processes."""
+
+    def test_saves_from_another_process_are_visible(self, test_client, tmp_path, sample_briefing_data):
+        """A briefing saved by the daily script shows up despite cached list / 404 responses."""
+        from services.briefing_service import BriefingStorage
+
+        path = tmp_path / "briefings.json"
+        api_storage = BriefingStorage(str(path))
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        with patch('api.briefing.briefing_storage', api_storage):
+            assert test_client.get(f"/api/briefings/{today}").status_code == 404
+            assert test_client.get("/api/briefings").json()["briefings"] == []
+
+            # scripts/daily_briefing.py writes through its own storage instance
+            BriefingStorage(str(path)).save_briefing(
+                stock=StockDetail(**sample_briefing_data["stock"]),
+                score=ScoreBreakdown(**sample_briefing_data["score"]),
+                why_hot=[WhyHotItem(**item) for item in sample_briefing_data["why_hot"]]
+            )
+
+            detail = test_client.get(f"/api/briefings/{today}")
+            assert detail.status_code == 200
+            assert detail.json()["briefing"]["stock"]["symbol"] == "TSLA"
+            assert [b["date"] for b in test_client.get("/api/briefings").json()["briefings"]] == [today]
+
+    def test_missing_date_is_not_negatively_cached(self, test_client, isolated_stock_cache):
+        with patch('api.briefing.briefing_storage') as mock_storage:
+            mock_storage.version.return_value = "1"
+            mock_storage.get_briefing_by_date.return_value = None
+
+            assert test_client.get("/api/briefings/2024-12-31").status_code == 404
+            assert test_client.get("/api/briefings/2024-12-31").status_code == 404
+
+            assert mock_storage.get_briefing_by_date.call_count == 2
+            assert isolated_stock_cache.get_stats()["negative"]["sets"] == 0
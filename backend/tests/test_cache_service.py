@@ -0,0 +1,1611 @@
+"""
+Cache Service Tests
+
+Tests for the layered cache service:
+- CacheManager.get_or_set single-flight behaviour
+- L1 + L2 read path
+- Cross-worker distributed lock
+- Stale-while-revalidate mode
+- Probabilistic early refresh
+- Serialization codecs
+- L1 expiry index and key index
+- Tag-based invalidation
+- Cross-worker L1 invalidation bus
+- Batched multi-key API
+- W-TinyLFU admission policy
+- Shared-memory L1 backend
+- Persistent disk tier
+- L2 circuit breaker
+- Latency histograms and per-family metrics
+- In-process cache warmer
+- NYSE session calendar and session-aware TTLs
+- Negative caching
+- Compressed L1 entries
+"""
+
+import pytest
+import asyncio
+import os
+import random
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from models.news import NewsItem
+from models.stock import ChartDataResponse, PriceDataPoint
+from services.cache_codec import CacheCodecError, PickleCodec, get_codec
+from services.cache_warmer import CacheWarmer, WarmTask
+from services.market_calendar import (
+    NY_TZ, MarketSession, market_session, nyse_half_days, nyse_holidays
+)
+from services.cache_service import (
+    CacheInvalidationBus, CacheManager, CacheTTL, CircuitBreaker, CountMinSketch, KeyPrefixIndex,
+    CompressedValue, MemoryCache, NegativeResult, RedisCache, SWRValue
+)
+
+
+class FakePubSub:
+    """Queue-backed stand-in for a redis.asyncio PubSub connection."""
+
+    def __init__(self, broker: "FakeRedisCache"):
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._broker.subscribers.append(self._queue)
+
+    async def get_message(self, ignore_subscribe_messages: bool = True, timeout: float = 1.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self._broker.subscribers.remove(self._queue)
+
+
+class FakeRedisCache:
+    """In-process stand-in for RedisCache, shared between CacheManagers."""
+
+    def __init__(self):
+        self.store: Dict[str, Any] = {}
+        self.locks: Dict[str, str] = {}
+        self.tags: Dict[str, set] = {}
+        self.key_tags: Dict[str, List[str]] = {}
+        self.subscribers: List[asyncio.Queue] = []
+        self.mget_calls = 0
+        self.pipeline_calls = 0
+        self.is_connected = True
+        self.codec = PickleCodec()
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
+        self.store[key] = value
+        return True
+
+    async def get_encoded(self, key: str) -> Optional[bytes]:
+        value = self.store.get(key)
+        return None if value is None else self.codec.encode(value)
+
+    async def set_encoded(self, key: str, data: bytes, ttl_seconds: int = 300) -> bool:
+        self.store[key] = self.codec.decode(data)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self.store.pop(key, None) is not None
+
+    async def get_encoded_with_tags(self, key: str):
+        return await self.get_encoded(key), tuple(self.key_tags.get(key, ()))
+
+    async def get_many_encoded_with_tags(self, keys: List[str]):
+        self.mget_calls += 1
+        return {
+            key: (self.codec.encode(self.store[key]), tuple(self.key_tags.get(key, ())))
+            for key in keys if key in self.store
+        }
+
+    async def set_many_encoded(self, items: Dict[str, bytes], ttl_seconds: int = 300, tags=None) -> bool:
+        self.pipeline_calls += 1
+        for key, data in items.items():
+            self.store[key] = self.codec.decode(data)
+            if tags and tags.get(key):
+                await self.tag_key(key, tags[key], ttl_seconds)
+        return True
+
+    async def tag_key(self, key: str, tags, ttl_seconds: int) -> bool:
+        self.key_tags[key] = list(tags)
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+        return True
+
+    async def invalidate_tags(self, tags) -> List[str]:
+        deleted = set()
+        for tag in tags:
+            for key in self.tags.pop(tag, set()):
+                self.key_tags.pop(key, None)
+                if self.store.pop(key, None) is not None:
+                    deleted.add(key)
+        return list(deleted)
+
+    async def publish(self, channel: str, message: bytes) -> bool:
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "data": message})
+        return True
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+    async def acquire_lock(self, key: str, ttl_seconds: float = 60.0) -> Optional[str]:
+        if key in self.locks:
+            return None
+        self.locks[key] = "token"
+        return "token"
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        return self.locks.pop(key, None) == token
+
+
+class TestGetOrSet:
+    """Test cases for CacheManager.get_or_set."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_call_factory_once(self):
+        """Concurrent misses on the same key should share one factory call."""
+        manager = CacheManager()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"value": 1}
+
+        results = await asyncio.gather(*[
+            manager.get_or_set("key", factory, ttl_seconds=60) for _ in range(10)
+        ])
+
+        assert calls == 1
+        assert all(r == {"value": 1} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_factory_exception_not_cached(self):
+        """Factory errors should propagate and leave the key empty."""
+        manager = CacheManager()
+
+        async def factory():
+            raise ValueError("upstream failed")
+
+        with pytest.raises(ValueError):
+            await manager.get_or_set("key", factory, ttl_seconds=60)
+
+        assert manager.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_factory_exception_reaches_all_waiters(self):
+        """Waiters should receive the leader's exception instead of retrying the factory."""
+        manager = CacheManager()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            *[manager.get_or_set("key", factory, ttl_seconds=60) for _ in range(5)],
+            return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, ValueError) for r in results)
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_inflight_table_is_emptied_after_completion(self):
+        """Completed keys should leave no single-flight state behind."""
+        manager = CacheManager()
+
+        async def factory():
+            return 1
+
+        for i in range(50):
+            await manager.get_or_set(f"key_{i}", factory, ttl_seconds=60)
+
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_waiter(self):
+        """A waiter should take over when the leader is cancelled."""
+        manager = CacheManager()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(manager.get_or_set("key", factory, ttl_seconds=60))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(manager.get_or_set("key", factory, ttl_seconds=60))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await waiter == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_skips_factory(self):
+        """A value present only in L2 should be returned and copied into L1."""
+        l2 = FakeRedisCache()
+        l2.store["key"] = "from_l2"
+        manager = CacheManager(l1_cache=MemoryCache(), l2_cache=l2)
+
+        async def factory():
+            raise AssertionError("factory should not be called")
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=60) == "from_l2"
+        assert manager.get("key") == "from_l2"
+
+    @pytest.mark.asyncio
+    async def test_workers_share_one_factory_call(self):
+        """Managers sharing an L2 should only run the factory in the lock holder."""
+        l2 = FakeRedisCache()
+        workers = [CacheManager(l1_cache=MemoryCache(), l2_cache=l2) for _ in range(3)]
+        for worker in workers:
+            worker.DISTRIBUTED_LOCK_POLL_INTERVAL = 0.01
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "fresh"
+
+        results = await asyncio.gather(*[
+            worker.get_or_set("key", factory, ttl_seconds=60) for worker in workers
+        ])
+
+        assert calls == 1
+        assert results == ["fresh"] * 3
+        assert l2.locks == {}
+
+
+class FakeClock:
+    """Controllable replacement for time.time()."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(time, "time", fake)
+    return fake
+
+
+class TestStaleWhileRevalidate:
+    """Test cases for CacheManager SWR mode."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_value_is_unwrapped(self):
+        """SWR entries should be transparent to get/aget callers."""
+        manager = CacheManager(enable_swr=True)
+
+        async def factory():
+            return "fresh"
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=60) == "fresh"
+        assert manager.get("key") == "fresh"
+        assert await manager.aget("key") == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_and_refreshed_once(self):
+        """Stale reads should return immediately and trigger a single refresh."""
+        manager = CacheManager(enable_swr=True)
+        await manager.aset("key", SWRValue(value="stale", soft_expires_at=time.time() - 1), 60)
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "fresh"
+
+        results = await asyncio.gather(*[
+            manager.get_or_set("key", factory, ttl_seconds=60) for _ in range(5)
+        ])
+        assert results == ["stale"] * 5
+
+        await asyncio.sleep(0.1)
+        assert calls == 1
+        assert await manager.get_or_set("key", factory, ttl_seconds=60) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        """A failing background refresh should keep serving the stale value."""
+        manager = CacheManager(enable_swr=True)
+        await manager.aset("key", SWRValue(value="stale", soft_expires_at=time.time() - 1), 60)
+
+        async def factory():
+            raise RuntimeError("upstream down")
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=60) == "stale"
+        await asyncio.sleep(0.01)
+        assert manager.get("key") == "stale"
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_serves_stale_after_soft_expiry(self, clock):
+        """L1 should keep SWR entries through the stale window, not just ttl // 5."""
+        manager = CacheManager(enable_swr=True, swr_stale_ratio=1.0)
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            return f"v{calls}"
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+
+        clock.advance(150)
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+        assert calls == 1
+
+        clock.advance(300)  # past soft expiry, inside the stale window
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+        await asyncio.sleep(0.01)
+        assert calls == 2
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v2"
+
+
+class TestEarlyRefresh:
+    """Test cases for probabilistic early expiration (XFetch)."""
+
+    def test_far_from_expiry_does_not_refresh(self):
+        """Entries with plenty of TTL left should not refresh early."""
+        entry = SWRValue(value=1, soft_expires_at=time.time() + 3600, compute_seconds=0.01)
+        assert not any(entry.should_refresh_early() for _ in range(100))
+
+    def test_past_expiry_always_refreshes(self):
+        """Expired entries should always be picked for refresh."""
+        entry = SWRValue(value=1, soft_expires_at=time.time() - 1, compute_seconds=0.01)
+        assert all(entry.should_refresh_early() for _ in range(100))
+
+    def test_unknown_compute_time_never_refreshes_early(self):
+        """Entries without a recorded factory latency should not refresh early."""
+        entry = SWRValue(value=1, soft_expires_at=time.time() + 0.001)
+        assert entry.should_refresh_early() is False
+
+    @pytest.mark.asyncio
+    async def test_slow_factory_near_expiry_refreshes_in_background(self):
+        """A slow-to-compute key close to expiry should be refreshed while still served."""
+        manager = CacheManager(enable_early_refresh=True, early_refresh_beta=1000.0)
+        await manager.aset(
+            "key",
+            SWRValue(value="current", soft_expires_at=time.time() + 1, compute_seconds=5.0),
+            60
+        )
+
+        async def factory():
+            return "refreshed"
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=60) == "current"
+        await asyncio.sleep(0.01)
+        assert manager.get("key") == "refreshed"
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_keeps_entry_until_soft_expiry(self, clock, monkeypatch):
+        """Without SWR, L1 should still hold the entry long enough for XFetch to fire."""
+        monkeypatch.setattr(random, "random", lambda: 0.5)
+        manager = CacheManager(enable_early_refresh=True)
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return f"v{calls}"
+
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+
+        clock.advance(150)
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+        assert calls == 1
+
+        clock.advance(149.99)  # just before soft expiry: early refresh wins
+        assert await manager.get_or_set("key", factory, ttl_seconds=300) == "v1"
+        await asyncio.sleep(0.1)
+        assert calls == 2
+        assert manager.get("key") == "v2"
+
+
+def _sample_chart(points: int = 5) -> ChartDataResponse:
+    return ChartDataResponse(
+        symbol="AAPL",
+        name="Apple Inc.",
+        period="1y",
+        data=[
+            PriceDataPoint(
+                date=f"2024-01-{(i % 28) + 1:02d}",
+                open=170.0, high=175.0, low=168.0, close=173.0, volume=50000000
+            )
+            for i in range(points)
+        ]
+    )
+
+
+class CountingCodec(PickleCodec):
+    """Pickle codec that counts encode calls."""
+
+    def __init__(self):
+        self.encode_calls = 0
+
+    def encode(self, value):
+        self.encode_calls += 1
+        return super().encode(value)
+
+
+class TestCacheCodec:
+    """Test cases for pluggable cache codecs."""
+
+    @pytest.mark.parametrize("name", ["pickle", "orjson", "msgpack"])
+    @pytest.mark.parametrize("compression", [None, "zstd"])
+    def test_roundtrip_preserves_types(self, name, compression):
+        """Pydantic models and SWR envelopes should decode to their original types."""
+        codec = get_codec(name, compression=compression, compression_min_bytes=64)
+        value = SWRValue(
+            value={
+                "chart": _sample_chart(50),
+                "news": [NewsItem(title="t", url="https://example.com")],
+            },
+            soft_expires_at=123.5,
+            compute_seconds=0.25
+        )
+
+        decoded = codec.decode(codec.encode(value))
+
+        assert isinstance(decoded, SWRValue)
+        assert decoded.soft_expires_at == 123.5
+        assert isinstance(decoded.value["chart"], ChartDataResponse)
+        assert decoded.value["chart"] == value.value["chart"]
+        assert isinstance(decoded.value["news"][0], NewsItem)
+
+    def test_zstd_compresses_large_payloads_only(self):
+        """Only payloads above the threshold should be compressed."""
+        plain = get_codec("orjson")
+        compressed = get_codec("orjson", compression="zstd", compression_min_bytes=1024)
+
+        small, large = _sample_chart(1), _sample_chart(365)
+
+        assert compressed.encode(small) == plain.encode(small)
+        assert len(compressed.encode(large)) < len(plain.encode(large))
+
+    @pytest.mark.asyncio
+    async def test_aset_serializes_once_for_both_layers(self):
+        """aset should reuse one encoded payload for L1 sizing and the L2 write."""
+        codec = CountingCodec()
+        l2 = FakeRedisCache()
+        written = {}
+
+        async def set_encoded(key, data, ttl_seconds=300):
+            written[key] = data
+            return True
+
+        l2.set_encoded = set_encoded
+        manager = CacheManager(l2_cache=l2, codec=codec)
+
+        await manager.aset("chart", _sample_chart(), 60)
+
+        assert codec.encode_calls == 1
+        assert manager._l1._cache["chart"].size_bytes == len(written["chart"])
+
+    @pytest.mark.parametrize("name", ["orjson", "msgpack"])
+    @pytest.mark.parametrize("payload", [
+        {"__dataclass__": "os:system", "data": {"command": "echo CALLED"}},
+        {"__model__": "subprocess:Popen", "data": {"args": "echo CALLED"}},
+        {"__dataclass__": "services.cache_service:os.system", "data": {"command": "echo CALLED"}},
+        {"__dataclass__": "services.cache_service:uuid.UUID", "data": {"hex": "0" * 32}},
+    ])
+    def test_untrusted_type_tags_are_rejected(self, name, payload, monkeypatch):
+        """Type tags must not import or call anything outside app models/dataclasses."""
+        import os
+        import subprocess
+        called = []
+        monkeypatch.setattr(os, "system", lambda *a, **k: called.append(a))
+        monkeypatch.setattr(subprocess, "Popen", lambda *a, **k: called.append(a))
+        codec = get_codec(name)
+        raw = codec.encode(payload)
+
+        with pytest.raises(CacheCodecError):
+            codec.decode(raw)
+        assert called == []
+
+    @pytest.mark.asyncio
+    async def test_zstd_l1_size_is_uncompressed(self):
+        """L1 memory accounting should use the decoded size, not the compressed one."""
+        codec = get_codec("pickle", compression="zstd", compression_min_bytes=64)
+        l2 = FakeRedisCache()
+        l2.codec = codec
+        writer = CacheManager(l2_cache=l2, codec=codec)
+        reader = CacheManager(l2_cache=l2, codec=codec)
+        chart = _sample_chart(365)
+        raw_size = len(PickleCodec().encode(chart))
+
+        await writer.aset("chart", chart, 60)
+        assert await reader.aget("chart") == chart
+
+        assert len(codec.encode(chart)) < raw_size
+        assert writer._l1._cache["chart"].size_bytes == raw_size
+        assert reader._l1._cache["chart"].size_bytes == raw_size
+
+
+class TestMemoryCacheExpiry:
+    """Test cases for the MemoryCache expiry index and janitor."""
+
+    def test_cleanup_expired_reclaims_memory(self):
+        """Expired entries should be removed and their memory released."""
+        l1 = MemoryCache()
+        l1.set("dead", "x" * 100, ttl_seconds=-1)
+        l1.set("live", "y" * 100, ttl_seconds=60)
+        live_size = l1._cache["live"].size_bytes
+
+        assert l1.cleanup_expired() == 1
+        assert l1.keys() == ["live"]
+        assert l1._current_memory == live_size
+
+    def test_cleanup_expired_respects_batch_size(self):
+        """Cleanup should stop after max_items index entries."""
+        l1 = MemoryCache()
+        for i in range(10):
+            l1.set(f"dead_{i}", i, ttl_seconds=-1)
+
+        assert l1.cleanup_expired(max_items=4) == 4
+        assert l1.key_count == 6
+        assert l1.has_expired_entries
+
+    def test_overwritten_key_is_not_removed_by_old_index_entry(self):
+        """A refreshed key should survive cleanup of its stale index entry."""
+        l1 = MemoryCache()
+        l1.set("key", "old", ttl_seconds=-1)
+        l1.set("key", "new", ttl_seconds=60)
+
+        assert l1.cleanup_expired() == 0
+        assert l1.get("key") == "new"
+
+    def test_eviction_prefers_expired_entries(self):
+        """Expired entries should be reclaimed before evicting live LRU entries."""
+        l1 = MemoryCache(max_entries=2)
+        l1.set("dead", 1, ttl_seconds=-1)
+        l1.set("live", 2, ttl_seconds=60)
+        l1.set("new", 3, ttl_seconds=60)
+
+        assert sorted(l1.keys()) == ["live", "new"]
+
+    @pytest.mark.asyncio
+    async def test_janitor_reclaims_in_background(self):
+        """The janitor task should clean expired entries without reads."""
+        manager = CacheManager()
+        for i in range(5):
+            manager._l1.set(f"dead_{i}", i, ttl_seconds=-1)
+
+        manager.start_janitor(interval_seconds=0.01, batch_size=2)
+        await asyncio.sleep(0.05)
+        await manager.stop_janitor()
+
+        assert manager._l1.key_count == 0
+
+
+class TestKeyPrefixIndex:
+    """Test cases for the L1 key trie used by pattern lookups."""
+
+    KEYS = [
+        "chart_AAPL_5d", "chart_AAPL_1y", "chart_AMZN_5d", "chart_TSLA_5d",
+        "news_AAPL", "stock_detail_AAPL", "top_n_stocks_most_actives_5",
+        "trending_stock",
+    ]
+
+    @pytest.fixture
+    def index(self):
+        index = KeyPrefixIndex()
+        for key in self.KEYS:
+            index.add(key)
+        return index
+
+    @pytest.mark.parametrize("pattern", [
+        "chart_AAPL_*", "chart_A*", "chart_*_5d", "*_AAPL", "top_n_*",
+        "news_AAPL", "news_MSFT", "trend*", "chart_AAPL_?d", "*",
+    ])
+    def test_match_agrees_with_fnmatch(self, index, pattern):
+        """Indexed matches should equal a full fnmatch scan."""
+        import fnmatch
+        expected = sorted(k for k in self.KEYS if fnmatch.fnmatchcase(k, pattern))
+        assert sorted(index.match(pattern)) == expected
+
+    def test_discard_prunes_nodes(self, index):
+        """Removed keys should disappear from matches and the size count."""
+        index.discard("chart_AAPL_5d")
+        index.discard("chart_AAPL_1y")
+        index.discard("missing_key")
+
+        assert index.match("chart_AAPL_*") == []
+        assert "AAPL" not in index._root.children["chart"].children
+        assert len(index) == len(self.KEYS) - 2
+
+    def test_memory_cache_pattern_ops_use_index(self):
+        """MemoryCache.keys / clear_pattern should keep the index in sync."""
+        l1 = MemoryCache()
+        for key in self.KEYS:
+            l1.set(key, 1)
+
+        assert sorted(l1.keys("chart_AAPL_*")) == ["chart_AAPL_1y", "chart_AAPL_5d"]
+        assert l1.clear_pattern("chart_*") == 4
+        assert l1.keys("chart_*") == []
+        assert l1.key_count == len(self.KEYS) - 4
+
+
+class TestTagInvalidation:
+    """Test cases for tag-based invalidation."""
+
+    def test_memory_cache_invalidate_tags(self):
+        """Only keys carrying the tag should be removed."""
+        l1 = MemoryCache()
+        l1.set("stock_detail_AAPL", 1, tags=["ticker:AAPL"])
+        l1.set("chart_AAPL_5d", 2, tags=["ticker:AAPL"])
+        l1.set("stock_detail_TSLA", 3, tags=["ticker:TSLA"])
+
+        assert sorted(l1.invalidate_tags(["ticker:AAPL"])) == ["chart_AAPL_5d", "stock_detail_AAPL"]
+        assert l1.keys() == ["stock_detail_TSLA"]
+        assert l1.invalidate_tags(["ticker:AAPL"]) == []
+
+    def test_overwrite_replaces_tags(self):
+        """Re-setting a key should drop its old tag memberships."""
+        l1 = MemoryCache()
+        l1.set("key", 1, tags=["old"])
+        l1.set("key", 2, tags=["new"])
+
+        assert l1.invalidate_tags(["old"]) == []
+        assert l1.get("key") == 2
+        assert l1.invalidate_tags(["new"]) == ["key"]
+
+    def test_removed_entry_leaves_no_tag_index(self):
+        """Deleting or clearing entries should prune the tag index."""
+        l1 = MemoryCache()
+        l1.set("a", 1, tags=["t"])
+        l1.delete("a")
+        assert l1._tag_index == {}
+
+        l1.set("b", 1, tags=["t"])
+        l1.clear()
+        assert l1._tag_index == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_across_layers(self):
+        """Tagged entries from get_or_set should be dropped from L1 and L2."""
+        l2 = FakeRedisCache()
+        manager = CacheManager(l2_cache=l2)
+
+        async def factory():
+            return {"price": 1}
+
+        await manager.get_or_set("stock_detail_AAPL", factory, 300, tags=["ticker:AAPL"])
+        await manager.aset("news_AAPL", ["n"], 900, tags=["ticker:AAPL"])
+        await manager.aset("news_TSLA", ["n"], 900, tags=["ticker:TSLA"])
+
+        # 2 logical keys, each removed from both layers
+        assert await manager.invalidate_tags(["ticker:AAPL"]) == 2
+        assert await manager.aget("stock_detail_AAPL") is None
+        assert await manager.aget("news_AAPL") is None
+        assert await manager.aget("news_TSLA") == ["n"]
+
+
+class TestInvalidationBus:
+    """Test cases for the cross-worker L1 invalidation bus."""
+
+    async def _workers(self, l2: FakeRedisCache, count: int = 2) -> List[CacheManager]:
+        managers = [CacheManager(l2_cache=l2) for _ in range(count)]
+        for manager in managers:
+            manager.start_invalidation_bus()
+        for _ in range(50):
+            if all(m._bus.is_listening for m in managers):
+                break
+            await asyncio.sleep(0.01)
+        return managers
+
+    async def _shutdown(self, *managers: CacheManager) -> None:
+        """Stop every worker even if an earlier shutdown raises."""
+        if not managers:
+            return
+        try:
+            await managers[0].shutdown()
+        finally:
+            await self._shutdown(*managers[1:])
+
+    async def _drain(self, l2: FakeRedisCache) -> None:
+        """Wait until every subscriber has consumed its pending messages."""
+        for _ in range(100):
+            if all(queue.empty() for queue in l2.subscribers):
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_set_on_one_worker_drops_other_l1(self):
+        """A write on worker A should evict the stale L1 copy on worker B."""
+        l2 = FakeRedisCache()
+        a, b = await self._workers(l2)
+        try:
+            await a.aset("key", "v1", 300)
+            assert await b.aget("key") == "v1"  # B now holds v1 in L1
+
+            await a.aset("key", "v2", 300)
+            await self._drain(l2)
+
+            assert b._l1.get("key") is None
+            assert await b.aget("key") == "v2"
+            assert a._l1.get("key") == "v2"  # own message ignored
+        finally:
+            await self._shutdown(a, b)
+
+    @pytest.mark.asyncio
+    async def test_delete_and_pattern_clear_propagate(self):
+        """Deletes and pattern clears should be applied on every worker."""
+        l2 = FakeRedisCache()
+        a, b = await self._workers(l2)
+        try:
+            b._l1.set("news_AAPL", 1)
+            b._l1.set("chart_AAPL_5d", 2)
+            b._l1.set("chart_TSLA_5d", 3)
+
+            await a.adelete("news_AAPL")
+            await a.aclear(pattern="chart_AAPL_*", layers=["l1"])
+            await self._drain(l2)
+
+            assert b._l1.keys() == ["chart_TSLA_5d"]
+        finally:
+            await self._shutdown(a, b)
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_extended_while_listening(self):
+        """L1 TTL should follow the L2 TTL only while the bus is subscribed."""
+        l2 = FakeRedisCache()
+        plain = CacheManager(l2_cache=l2)
+        (bussed,) = await self._workers(l2, count=1)
+        try:
+            assert plain._l1_ttl(3600) == 720
+            assert bussed._l1_ttl(3600) == 3600
+        finally:
+            await self._shutdown(bussed)
+
+    def test_malformed_message_ignored(self):
+        """Garbage payloads should not raise or touch the L1 cache."""
+        applied = []
+        bus = CacheInvalidationBus(FakeRedisCache(), applied.append, lambda: None)
+
+        assert bus.handle(b"not json") is False
+        assert bus.handle(b'{"origin": "%s", "op": "clear"}' % bus.worker_id.encode()) is False
+        assert applied == []
+
+    @pytest.mark.asyncio
+    async def test_l2_promotion_keeps_tags(self):
+        """Entries re-read from L2 into L1 should still be tag-invalidatable."""
+        l2 = FakeRedisCache()
+        writer = CacheManager(l2_cache=l2)
+        reader = CacheManager(l2_cache=l2)
+        await writer.aset("news_AAPL", ["n"], 900, tags=["ticker:AAPL"])
+
+        assert await reader.aget("news_AAPL") == ["n"]  # promoted into reader's L1
+        assert reader._l1.invalidate_tags(["ticker:AAPL"]) == ["news_AAPL"]
+
+
+class TestBatchOperations:
+    """Test cases for aget_many / aset_many."""
+
+    @pytest.mark.asyncio
+    async def test_aget_many_sends_l1_misses_in_one_mget(self):
+        """L1 hits are served locally and all misses share a single L2 round trip."""
+        l2 = FakeRedisCache()
+        manager = CacheManager(l2_cache=l2)
+        manager._l1.set("a", 1)
+        l2.store.update({"b": 2, "c": 3})
+
+        result = await manager.aget_many(["a", "b", "c", "missing", "a"])
+
+        assert result == {"a": 1, "b": 2, "c": 3}
+        assert l2.mget_calls == 1
+        assert manager._l1.get("b") == 2  # promoted into L1
+
+    @pytest.mark.asyncio
+    async def test_aget_many_skips_l2_when_all_hit(self):
+        """No L2 call should be made when every key is in L1."""
+        l2 = FakeRedisCache()
+        manager = CacheManager(l2_cache=l2)
+        manager._l1.set("a", 1)
+
+        assert await manager.aget_many(["a"]) == {"a": 1}
+        assert l2.mget_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_aset_many_uses_one_pipeline_and_keeps_tags(self):
+        """aset_many should write both layers with one pipeline and register tags."""
+        l2 = FakeRedisCache()
+        manager = CacheManager(l2_cache=l2)
+
+        await manager.aset_many(
+            {"compare_item_AAPL": 1, "compare_item_MSFT": 2},
+            300,
+            tags={"compare_item_AAPL": ["ticker:AAPL"]}
+        )
+
+        assert l2.pipeline_calls == 1
+        assert l2.store == {"compare_item_AAPL": 1, "compare_item_MSFT": 2}
+        assert await manager.invalidate_tags(["ticker:AAPL"]) == 1
+        assert await manager.aget_many(["compare_item_AAPL", "compare_item_MSFT"]) == {
+            "compare_item_MSFT": 2
+        }
+
+
+def _read_through(cache: MemoryCache, key: str) -> None:
+    """Simulate a get_or_set access: read, and fill on miss."""
+    if cache.get(key) is None:
+        cache.set(key, key, ttl_seconds=300, size_bytes=1)
+
+
+class TestTinyLFU:
+    """Test cases for the W-TinyLFU admission policy."""
+
+    def test_sketch_estimates_and_ages(self):
+        """Counts should saturate at 15 and halve after the sample period."""
+        sketch = CountMinSketch(capacity=16)
+        for _ in range(20):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.estimate("hot") == 15
+        assert sketch.estimate("cold") >= 1
+        assert sketch.estimate("never") <= sketch.estimate("cold")
+
+        # sample_size = 10 * width = 160 additions, 21 already recorded
+        for i in range(160 - 21):
+            sketch.increment(f"noise_{i}")
+        assert sketch.estimate("hot") == 7
+
+    @pytest.mark.parametrize("admission, survives", [("lru", False), ("tinylfu", True)])
+    def test_scan_does_not_flush_hot_keys(self, admission, survives):
+        """A one-off crawl over many keys should not evict frequently used entries."""
+        cache = MemoryCache(max_entries=20, admission=admission, window_ratio=0.1)
+        hot = ["trending_stock", "top_n_stocks_most_actives_5"]
+        for _ in range(10):
+            for key in hot:
+                _read_through(cache, key)
+
+        for i in range(200):
+            _read_through(cache, f"chart_T{i}_1y")
+
+        assert all(key in cache.keys() for key in hot) is survives
+
+    def test_admission_stats_report_delta_over_lru(self):
+        """Stats should compare the real hit rate against a same-size LRU baseline."""
+        cache = MemoryCache(max_entries=20, admission="tinylfu", window_ratio=0.1)
+        for round_ in range(5):
+            for _ in range(5):
+                _read_through(cache, "trending_stock")
+            for i in range(40):
+                _read_through(cache, f"chart_T{round_}_{i}")
+
+        stats = cache.admission_stats()
+        assert stats["policy"] == "tinylfu"
+        assert stats["rejected"] > 0
+        assert stats["hit_rate_delta"] > 0
+        assert len(cache.keys()) <= 20
+
+    def test_lru_policy_has_no_admission_stats(self):
+        assert MemoryCache().admission_stats() is None
+        with pytest.raises(ValueError):
+            MemoryCache(admission="arc")
+
+
+
+class TestSharedMemoryCache:
+    """mmap-backed L1 shared by every worker on the host."""
+
+    @pytest.fixture
+    def shared_path(self, tmp_path) -> str:
+        return str(tmp_path / "l1-cache")
+
+    def test_value_visible_across_instances(self, shared_path):
+        """Two workers opening the same file should see each other's writes."""
+        from services.shared_memory_cache import SharedMemoryCache
+
+        writer = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=4096)
+        reader = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=4096)
+        try:
+            writer.set("chart_AAPL_1y", _sample_chart(), ttl_seconds=60, tags=["ticker:AAPL"])
+            assert reader.get("chart_AAPL_1y") == _sample_chart()
+
+            assert reader.invalidate_tags(["ticker:AAPL"]) == ["chart_AAPL_1y"]
+            assert writer.get("chart_AAPL_1y") is None
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_value_visible_in_forked_worker(self, shared_path):
+        """A value written by a child process should be readable by the parent."""
+        from services.shared_memory_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=4096)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                child = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=4096)
+                child.set("trending_stock", {"symbol": "NVDA"}, ttl_seconds=60)
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+            assert cache.get("trending_stock") == {"symbol": "NVDA"}
+        finally:
+            cache.close()
+
+    def test_expiry_overwrite_and_patterns(self, shared_path, clock):
+        from services.shared_memory_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=4096)
+        try:
+            cache.set("chart_AAPL_1y", 1, ttl_seconds=10)
+            cache.set("chart_AAPL_1y", 2, ttl_seconds=100)
+            cache.set("chart_MSFT_1y", 3, ttl_seconds=100)
+            cache.set("stock_detail_AAPL", 4, ttl_seconds=10)
+            assert cache.get("chart_AAPL_1y") == 2
+
+            clock.advance(50)
+            assert cache.get("stock_detail_AAPL") is None
+            assert sorted(cache.keys("chart_*")) == ["chart_AAPL_1y", "chart_MSFT_1y"]
+            assert cache.cleanup_expired() == 1
+
+            assert cache.clear_pattern("chart_A*") == 1
+            assert cache.keys() == ["chart_MSFT_1y"]
+        finally:
+            cache.close()
+
+    def test_oversized_value_is_rejected(self, shared_path):
+        from services.shared_memory_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(max_entries=64, path=shared_path, slot_size=1024)
+        try:
+            assert cache.set("big", "x" * 4096) is False
+            assert cache.oversize == 1
+            assert cache.get("big") is None
+        finally:
+            cache.close()
+
+    def test_full_probe_window_evicts_earliest_expiry(self, shared_path):
+        """With every slot taken, a new key replaces the entry closest to expiring."""
+        from services.shared_memory_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(max_entries=16, path=shared_path, slot_size=1024)
+        try:
+            for i in range(16):
+                cache.set(f"key_{i}", i, ttl_seconds=100 + i)
+            cache.set("new_key", "new", ttl_seconds=1000)
+
+            assert cache.get("new_key") == "new"
+            assert cache.get("key_0") is None
+            assert cache.key_count == 16
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_manager_uses_shared_backend(self, shared_path):
+        manager = CacheManager()
+        await manager.initialize(backend="shared", max_entries=64, shared_path=shared_path)
+        try:
+            await manager.aset("trending_stock", {"symbol": "NVDA"}, ttl_seconds=60)
+
+            other = CacheManager()
+            await other.initialize(backend="shared", max_entries=64, shared_path=shared_path)
+            assert await other.aget("trending_stock") == {"symbol": "NVDA"}
+            assert other.get_stats()["l1_stats"]["backend"] == "shared"
+        finally:
+            await manager.shutdown()
+
+
+class TestDiskTier:
+    """SQLite tier between L1 and L2 for warm restarts."""
+
+    @pytest.fixture
+    def disk_path(self, tmp_path) -> str:
+        return str(tmp_path / "cache.sqlite3")
+
+    @pytest.mark.asyncio
+    async def test_restart_preloads_hottest_keys(self, disk_path):
+        """A new manager should start with the most-read keys already in L1."""
+        first = CacheManager()
+        await first.initialize(enable_disk_tier=True, disk_path=disk_path)
+        await first.aset("trending_stock", {"symbol": "NVDA"}, ttl_seconds=300)
+        await first.aset("chart_AAPL_1y", [1, 2, 3], ttl_seconds=300, tags=["ticker:AAPL"])
+        for _ in range(3):
+            first._l1.clear()
+            assert await first.aget("trending_stock") == {"symbol": "NVDA"}
+        await first.shutdown()
+
+        second = CacheManager()
+        await second.initialize(enable_disk_tier=True, disk_path=disk_path, disk_preload_keys=1)
+        try:
+            assert second._l1.get("trending_stock") == {"symbol": "NVDA"}
+            assert second._l1.get("chart_AAPL_1y") is None
+
+            # 나머지는 미스 시 디스크에서 지연 로딩 (태그 유지)
+            assert await second.aget("chart_AAPL_1y") == [1, 2, 3]
+            assert await second.invalidate_tags(["ticker:AAPL"]) == 1
+            assert await second.aget("chart_AAPL_1y") is None
+        finally:
+            await second.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_disk_ttl_is_kept(self, disk_path, clock):
+        manager = CacheManager()
+        await manager.initialize(enable_disk_tier=True, disk_path=disk_path)
+        try:
+            await manager.aset("stock_detail_AAPL", {"price": 1}, ttl_seconds=120)
+            manager._l1.clear()
+
+            clock.advance(100)
+            assert await manager.aget("stock_detail_AAPL") == {"price": 1}
+            # L1에 채울 때 디스크의 남은 TTL(20초)을 넘지 않음
+            clock.advance(30)
+            assert manager._l1.get("stock_detail_AAPL") is None
+            assert await manager.aget("stock_detail_AAPL") is None
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_disk_serves_when_redis_is_down(self, disk_path):
+        l2 = FakeRedisCache()
+        manager = CacheManager(l2_cache=l2)
+        await manager.initialize(enable_disk_tier=True, disk_path=disk_path)
+        try:
+            await manager.aset("top_n_stocks_most_actives_5", ["NVDA"], ttl_seconds=300)
+            l2.is_connected = False
+            l2.store.clear()
+            manager._l1.clear()
+
+            assert await manager.aget("top_n_stocks_most_actives_5") == ["NVDA"]
+            assert manager._disk.stats.hits == 1
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_clear_and_batch_cover_disk(self, disk_path):
+        manager = CacheManager()
+        await manager.initialize(enable_disk_tier=True, disk_path=disk_path)
+        try:
+            await manager.aset_many({"compare_item_AAPL": 1, "compare_item_MSFT": 2}, 300)
+            manager._l1.clear()
+            assert await manager.aget_many(["compare_item_AAPL", "compare_item_MSFT"]) == {
+                "compare_item_AAPL": 1, "compare_item_MSFT": 2
+            }
+
+            assert await manager.aclear(pattern="compare_item_A*") == 2  # L1 + disk
+            manager._l1.clear()
+            assert await manager.aget_many(["compare_item_AAPL", "compare_item_MSFT"]) == {
+                "compare_item_MSFT": 2
+            }
+        finally:
+            await manager.shutdown()
+
+
+    def test_reads_do_not_wait_for_other_writers(self, disk_path):
+        """Hits are counted in memory, so a read never needs the write lock."""
+        import sqlite3
+        from services.disk_cache import DiskCache
+
+        disk = DiskCache(disk_path)
+        disk.set_encoded("cold", b"c", 300)
+        disk.set_encoded("hot", b"h", 300)
+
+        other_worker = sqlite3.connect(disk_path, isolation_level=None)
+        other_worker.execute("BEGIN IMMEDIATE")
+        try:
+            started = time.monotonic()
+            for _ in range(3):
+                assert disk.get_encoded_with_tags("hot")[0] == b"h"
+            assert time.monotonic() - started < 1.0
+        finally:
+            other_worker.execute("ROLLBACK")
+            other_worker.close()
+
+        assert disk.cleanup_expired() == 0
+        assert [row[0] for row in disk.hottest(2)] == ["hot", "cold"]
+        disk.close()
+
+    def test_sqlite_errors_are_contained(self, disk_path):
+        from services.disk_cache import DiskCache
+
+        disk = DiskCache(disk_path)
+        disk.set_encoded("chart_AAPL_1y", b"x", 300, tags=["ticker:AAPL"])
+        disk.close()
+
+        assert disk.keys("chart_*") == []
+        assert disk.invalidate_tags(["ticker:AAPL"]) == []
+        assert disk.key_count == 0
+        assert disk.stats.errors == 3
+
+
+class FlakyRedisClient:
+    """redis.asyncio client stub whose GET fails until told otherwise."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = True
+
+    async def get(self, key: str):
+        self.calls += 1
+        if self.failing:
+            raise RuntimeError("READONLY You can't write against a read only replica")
+        return b"value"
+
+
+class TestCircuitBreaker:
+    """Test cases for the L2 circuit breaker."""
+
+    def test_opens_on_failure_rate_and_recovers_through_half_open(self, clock):
+        breaker = CircuitBreaker(min_calls=4, open_seconds=10, half_open_max_calls=2)
+        for _ in range(2):
+            breaker.record_success(0.001)
+        for _ in range(2):
+            breaker.record_failure(0.001)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow() is False
+
+        clock.advance(10)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() and breaker.allow()
+        assert breaker.allow() is False  # only two probes
+
+        breaker.record_success(0.001)
+        breaker.record_success(0.001)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(min_calls=1, open_seconds=5)
+        breaker.record_failure(0.001)
+        clock.advance(5)
+        assert breaker.allow()
+        breaker.record_failure(0.001)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats()["open_count"] == 2
+
+    def test_slow_calls_open_the_circuit(self):
+        breaker = CircuitBreaker(min_calls=4, slow_call_seconds=0.1, slow_call_rate_threshold=0.75)
+        breaker.record_success(0.01)
+        for _ in range(3):
+            breaker.record_success(0.5)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_calling_redis(self):
+        """Non-connection errors should still trip the breaker and stop L2 round trips."""
+        l2 = RedisCache(breaker=CircuitBreaker(min_calls=3, open_seconds=60))
+        l2._client = FlakyRedisClient()
+        l2._connected = True
+
+        for _ in range(3):
+            assert await l2.get_encoded("trending_stock") is None
+        assert l2._client.calls == 3
+        assert l2.is_connected is False
+
+        assert await l2.get_encoded("trending_stock") is None
+        assert l2._client.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_reconnect_keeps_retrying(self, monkeypatch):
+        """Reconnection should not give up after a fixed number of attempts."""
+        l2 = RedisCache()
+        l2._base_backoff = 0.0
+        attempts = []
+
+        async def fake_connect() -> bool:
+            attempts.append(1)
+            l2._connected = len(attempts) >= 8
+            return l2._connected
+
+        monkeypatch.setattr(l2, "connect", fake_connect)
+        l2.start_reconnect()
+        await asyncio.wait_for(l2._reconnect_task, timeout=2.0)
+
+        assert len(attempts) == 8
+        assert l2.is_socket_connected
+
+
+class TestCacheMetrics:
+    """Test cases for latency histograms and key-family counters."""
+
+    def test_histogram_percentiles_within_bucket_precision(self):
+        from services.cache_metrics import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        for micros in range(1, 10001):
+            histogram.record(micros / 1_000_000)
+
+        assert histogram.count == 10000
+        assert histogram.percentile(50) == pytest.approx(0.005, rel=0.07)
+        assert histogram.percentile(99) == pytest.approx(0.0099, rel=0.07)
+        assert histogram.percentile(100) == pytest.approx(0.01)
+
+        cumulative = dict(histogram.cumulative([0.001, 0.01, 1.0]))
+        assert cumulative[0.001] <= 1000
+        assert cumulative[1.0] == 10000
+
+    def test_every_cache_key_template_has_a_family(self):
+        from services import cache_service
+        from services.cache_metrics import OTHER_FAMILY, key_family
+
+        templates = [
+            value for name, value in vars(cache_service).items() if name.startswith("CACHE_KEY_")
+        ]
+        sample = {"type": "day_gainers", "count": 5, "ticker": "AAPL", "period": "1y",
+                  "page": 1, "limit": 10, "date": "2026-10-17", "version": "1"}
+        for template in templates:
+            assert key_family(template.format(**sample)) != OTHER_FAMILY, template
+        assert key_family("stock_detail_AAPL") == "stock_detail"
+        assert key_family("unknown_key") == OTHER_FAMILY
+
+    @pytest.mark.asyncio
+    async def test_manager_records_family_hits_misses_and_evictions(self):
+        manager = CacheManager(l1_cache=MemoryCache(max_entries=2))
+
+        async def factory():
+            return {"price": 1}
+
+        await manager.get_or_set("chart_AAPL_1y", factory, 300)
+        await manager.get_or_set("chart_AAPL_1y", factory, 300)
+        await manager.aset("news_AAPL", [], 900)
+        await manager.aset("news_MSFT", [], 900)  # evicts chart_AAPL_1y
+
+        stats = manager.get_stats()
+        chart = stats["families"]["chart"]
+        assert chart["hits"] == 1
+        assert chart["misses"] == 1  # the single-flight double-check is not counted again
+        assert chart["sets"] == 1
+        assert chart["evictions"] == 1
+        assert chart["avg_size_bytes"] > 0
+        assert stats["latency"]["factory"]["count"] == 1
+        assert stats["latency"]["l1_get"]["count"] >= 3
+
+    @pytest.mark.asyncio
+    async def test_prometheus_output(self):
+        manager = CacheManager()
+        await manager.aset("top_n_stocks_most_actives_5", ["NVDA"], 300)
+        await manager.aget("top_n_stocks_most_actives_5")
+
+        text = manager.prometheus_metrics()
+        assert "# TYPE noname_cache_latency_seconds histogram" in text
+        assert 'noname_cache_latency_seconds_count{op="l1_get"} 1' in text
+        assert 'noname_cache_family_hits_total{family="top_n_stocks"} 1' in text
+        assert 'noname_cache_layer_hits_total{layer="l1"} 1' in text
+        assert text.endswith("\n")
+
+
+class TestCacheWarmer:
+    """Test cases for declarative warm sets, bounded concurrency and re-warm scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_warm_sets_run_in_order_with_bounded_concurrency(self):
+        manager = CacheManager()
+        warmer = CacheWarmer(manager, concurrency=2)
+        running, peak = 0, 0
+
+        def make_factory(value):
+            async def factory():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return value
+            return factory
+
+        @warmer.warm_set("lists")
+        async def lists():
+            return [WarmTask(f"top_n_stocks_{i}", make_factory([f"S{i}"]), 300) for i in range(5)]
+
+        @warmer.warm_set("details")
+        async def details():
+            # later sets can read what earlier sets cached
+            symbols = [(await manager.aget(f"top_n_stocks_{i}"))[0] for i in range(5)]
+            return [WarmTask(f"stock_detail_{s}", make_factory(s), 300) for s in symbols]
+
+        await warmer.run_once()
+
+        assert peak == 2
+        assert await manager.aget("stock_detail_S4") == "S4"
+        status = warmer.status()
+        assert [s["name"] for s in status["warm_sets"]] == ["lists", "details"]
+        assert all(s["warmed"] == 5 for s in status["warm_sets"])
+        assert status["cycles"] == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_are_rewarmed_only_near_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        manager = CacheManager()
+        warmer = CacheWarmer(manager, rewarm_lead_seconds=30)
+        calls = {"short": 0, "long": 0}
+
+        def counting(name):
+            async def factory():
+                calls[name] += 1
+                return name
+            return factory
+
+        @warmer.warm_set("charts")
+        async def charts():
+            return [
+                WarmTask("chart_AAPL_5d", counting("short"), 300),
+                WarmTask("chart_AAPL_1y", counting("long"), 3600),
+            ]
+
+        await warmer.run_once()
+        now[0] += 271  # past 300 - 30 for the 5d chart only
+        await warmer.run_once()
+
+        assert calls == {"short": 2, "long": 1}
+        assert warmer.status()["warm_sets"][0]["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_leaving_a_set_are_unscheduled(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        manager = CacheManager()
+        warmer = CacheWarmer(manager, rewarm_lead_seconds=30)
+        top = ["AAPL", "MSFT"]
+
+        async def factory():
+            return 1
+
+        @warmer.warm_set("details")
+        async def details():
+            return [WarmTask(f"stock_detail_{s}", factory, 300) for s in top]
+
+        @warmer.warm_set("shared")
+        async def shared():
+            return [WarmTask("stock_detail_MSFT", factory, 300)]
+
+        await warmer.run_once()
+        top[:] = ["AAPL"]  # both symbols rotate out of the first set
+        now[0] += 10
+        await warmer.run_once()
+        now[0] += 300
+        top[:] = []
+        await warmer.run_once()
+
+        # MSFT is still produced by the other set, AAPL is gone for good
+        assert set(warmer._due) == {"stock_detail_MSFT"}
+        assert warmer._seconds_until_due() > 1.0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_and_do_not_stop_the_set(self):
+        manager = CacheManager()
+        warmer = CacheWarmer(manager)
+
+        async def ok():
+            return 1
+
+        async def broken():
+            raise RuntimeError("yahoo down")
+
+        @warmer.warm_set("mixed")
+        async def mixed():
+            return [WarmTask("chart_A_5d", ok, 300), WarmTask("chart_B_5d", broken, 300)]
+
+        @warmer.warm_set("bad_builder")
+        async def bad_builder():
+            raise RuntimeError("storage unavailable")
+
+        await warmer.run_once()
+
+        mixed_status, builder_status = warmer.status()["warm_sets"]
+        assert (mixed_status["warmed"], mixed_status["failed"]) == (1, 1)
+        assert "yahoo down" in mixed_status["last_error"]
+        assert "storage unavailable" in builder_status["last_error"]
+        assert await manager.aget("chart_A_5d") == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_overwrites_existing_value(self):
+        manager = CacheManager()
+        await manager.aset("trending_stock", "old", 300)
+
+        async def factory():
+            return "new"
+
+        assert await manager.refresh("trending_stock", factory, 300) is True
+        assert await manager.aget("trending_stock") == "new"
+
+
+def ny(*args) -> datetime:
+    return datetime(*args, tzinfo=NY_TZ)
+
+
+class TestMarketSessionTTL:
+    """Test cases for the NYSE calendar and session-aware TTL policy."""
+
+    def test_holidays_follow_nyse_rules(self):
+        assert sorted(nyse_holidays(2025)) == [
+            date(2025, 1, 1), date(2025, 1, 20), date(2025, 2, 17), date(2025, 4, 18),
+            date(2025, 5, 26), date(2025, 6, 19), date(2025, 7, 4), date(2025, 9, 1),
+            date(2025, 11, 27), date(2025, 12, 25),
+        ]
+        # July 4th on Saturday is observed Friday; New Year's on Saturday is not moved
+        assert date(2026, 7, 3) in nyse_holidays(2026)
+        assert date(2021, 12, 31) not in nyse_holidays(2021)
+        assert date(2022, 12, 26) in nyse_holidays(2022)
+
+    def test_half_days(self):
+        assert nyse_half_days(2025) == {date(2025, 7, 3), date(2025, 11, 28), date(2025, 12, 24)}
+        assert nyse_half_days(2026) == {date(2026, 11, 27), date(2026, 12, 24)}
+
+    @pytest.mark.parametrize("moment, session, ends_at", [
+        (ny(2025, 7, 8, 3, 0), MarketSession.OVERNIGHT, ny(2025, 7, 8, 4, 0)),
+        (ny(2025, 7, 8, 8, 0), MarketSession.PRE_MARKET, ny(2025, 7, 8, 9, 30)),
+        (ny(2025, 7, 8, 10, 0), MarketSession.REGULAR, ny(2025, 7, 8, 16, 0)),
+        (ny(2025, 7, 8, 17, 0), MarketSession.AFTER_HOURS, ny(2025, 7, 8, 20, 0)),
+        (ny(2025, 7, 8, 21, 0), MarketSession.OVERNIGHT, ny(2025, 7, 9, 4, 0)),
+        (ny(2025, 11, 28, 14, 0), MarketSession.AFTER_HOURS, ny(2025, 11, 28, 17, 0)),
+        (ny(2025, 7, 11, 21, 0), MarketSession.CLOSED, ny(2025, 7, 14, 4, 0)),
+        (ny(2025, 7, 4, 12, 0), MarketSession.CLOSED, ny(2025, 7, 7, 4, 0)),
+    ])
+    def test_session_boundaries(self, moment, session, ends_at):
+        info = market_session(moment)
+        assert info.session == session
+        assert info.ends_at == ends_at
+
+    def test_ttl_depends_on_session_and_stops_at_next_session(self, monkeypatch):
+        monkeypatch.setattr(CacheTTL, "session_aware", True)
+
+        assert CacheTTL.for_data("stock_detail", now=ny(2025, 7, 8, 10, 0)) == 60
+        assert CacheTTL.for_data("stock_detail", now=ny(2025, 7, 8, 21, 0)) == 21600
+        # overnight TTL is cut at the 04:00 pre-market open
+        assert CacheTTL.for_data("stock_detail", now=ny(2025, 7, 8, 3, 0)) == 3600
+        assert CacheTTL.for_data("chart_1y", now=ny(2025, 7, 12, 12, 0)) == 43200
+        # never below the floor, even right before a boundary
+        assert CacheTTL.for_data("top_n", now=ny(2025, 7, 8, 9, 29, 55)) == CacheTTL.MIN_SESSION_TTL
+
+    def test_fixed_ttls_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(CacheTTL, "session_aware", False)
+
+        assert CacheTTL.for_data("stock_detail", now=ny(2025, 7, 8, 21, 0)) == CacheTTL.STOCK_DETAIL
+        assert CacheTTL.get_chart_ttl("1mo") == CacheTTL.CHART_1MO
+        assert CacheTTL.get_chart_ttl("unknown") == CacheTTL.CHART_5D
+
+
+
+class TestNegativeCache:
+    """Test cases for negative results stored with their own short TTL."""
+
+    @pytest.mark.asyncio
+    async def test_negative_result_uses_negative_ttl(self):
+        manager = CacheManager()
+        await manager.initialize(negative_ttl=120, negative_error_ttl=10)
+        stored = {}
+        original_aset = manager.aset
+
+        async def spy_aset(key, value, ttl_seconds=300, tags=None):
+            stored[key] = ttl_seconds
+            await original_aset(key, value, ttl_seconds, tags=tags)
+
+        manager.aset = spy_aset
+        calls = 0
+
+        async def missing():
+            nonlocal calls
+            calls += 1
+            return NegativeResult(reason="not found")
+
+        async def failing():
+            return NegativeResult(reason="upstream down", upstream_error=True)
+
+        first = await manager.get_or_set("stock_detail_NOPE", missing, 3600)
+        second = await manager.get_or_set("stock_detail_NOPE", missing, 3600)
+        await manager.get_or_set("news_NOPE", failing, 900)
+
+        assert isinstance(first, NegativeResult) and second == first
+        assert calls == 1
+        assert stored == {"stock_detail_NOPE": 120, "news_NOPE": 10}
+
+    @pytest.mark.asyncio
+    async def test_negative_entries_have_their_own_stats(self):
+        manager = CacheManager()
+        await manager.aset("stock_detail_NOPE", NegativeResult(), 300)
+        await manager.aset("stock_detail_AAPL", {"price": 1}, 300)
+        await manager.aget("stock_detail_NOPE")
+        await manager.aget("stock_detail_AAPL")
+
+        stats = manager.get_stats()
+        assert stats["negative"]["hits"] == 1
+        assert stats["negative"]["sets"] == 1
+        assert stats["families"]["stock_detail"]["negative_hits"] == 1
+        assert stats["families"]["stock_detail"]["hits"] == 2
+
+
+class TestCompressedL1:
+    """Test cases for zstd-compressed L1 entries above the size threshold."""
+
+    @staticmethod
+    def chart(points: int) -> ChartDataResponse:
+        return ChartDataResponse(
+            symbol="AAPL",
+            name="Apple Inc.",
+            period="1y",
+            data=[
+                PriceDataPoint(
+                    date=f"2025-01-{i % 28 + 1:02d}", open=100.0, high=101.0, low=99.0,
+                    close=100.5, volume=1000000
+                )
+                for i in range(points)
+            ]
+        )
+
+    def test_large_entries_are_stored_compressed(self):
+        pytest.importorskip("zstandard")
+        l1 = MemoryCache(compress_min_bytes=1024)
+        value = self.chart(250)
+        l1.set("chart_AAPL_1y", value, ttl_seconds=60)
+        l1.set("news_AAPL", ["small"], ttl_seconds=60)
+
+        stored = l1._cache["chart_AAPL_1y"]
+        assert isinstance(stored.value, CompressedValue)
+        assert stored.size_bytes < stored.value.raw_size
+        assert not isinstance(l1._cache["news_AAPL"].value, CompressedValue)
+        assert l1.get("chart_AAPL_1y") == value
+
+        stats = l1.compression_stats()
+        assert stats["entries"] == 1
+        assert stats["ratio"] > 3
+        assert stats["decompressions"] == 1
+
+    def test_memory_budget_counts_compressed_size(self):
+        pytest.importorskip("zstandard")
+        raw_size = PickleCodec().encode_sized(self.chart(250))[1]
+        budget_mb = raw_size * 3 / (1024 * 1024)
+        plain = MemoryCache(max_memory_mb=budget_mb)
+        compressed = MemoryCache(max_memory_mb=budget_mb, compress_min_bytes=1024)
+
+        for i in range(10):
+            plain.set(f"chart_T{i}_1y", self.chart(250), ttl_seconds=60)
+            compressed.set(f"chart_T{i}_1y", self.chart(250), ttl_seconds=60)
+
+        assert plain.key_count < 10
+        assert compressed.key_count == 10
+
+        compressed.delete("chart_T0_1y")
+        compressed.clear_pattern("chart_T1_*")
+        assert compressed.compression_stats()["entries"] == 8
+
+    @pytest.mark.asyncio
+    async def test_manager_reuses_zstd_encoded_bytes(self):
+        pytest.importorskip("zstandard")
+        codec = get_codec("pickle", compression="zstd", compression_min_bytes=1024)
+        manager = CacheManager(
+            l1_cache=MemoryCache(codec=codec, compress_min_bytes=1024), codec=codec
+        )
+        value = self.chart(250)
+        await manager.aset("chart_AAPL_1y", value, 300)
+
+        stored = manager._l1._cache["chart_AAPL_1y"].value
+        assert stored.data == codec.encode(value)
+        assert await manager.aget("chart_AAPL_1y") == value
+        assert manager.get_stats()["l1_compression"]["entries"] == 1
@@ -15,6 +15,7 @@ import pandas as pd
 
 from services.screener_service import ScreenerServiceError
 from services.news_service import NewsServiceError
+from services.cache_service import CacheManager
 
 
 class TestHTTPErrorResponses:
@@ -26,11 +27,9 @@ class TestHTTPErrorResponses:
         mock_ticker.price = {"INVALID": "No data found"}
         mock_ticker.summary_detail = {"INVALID": {}}
 
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/INVALIDTICKER123")
 
             assert response.status_code == 404
@@ -54,11 +53,9 @@ class TestHTTPErrorResponses:
         mock_ticker.price = {"INVALID": "No data found"}
         mock_ticker.history = MagicMock(return_value=pd.DataFrame())
 
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/INVALID/chart")
 
             assert response.status_code == 404
@@ -115,11 +112,10 @@ class TestExternalServiceFailures:
 
     def test_screener_service_failure(self, test_client):
         """Should return 500 when screener service fails."""
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.side_effect = ScreenerServiceError(
+            mock_screener.aget_daily_hot_stock.side_effect = ScreenerServiceError(
                 "Yahoo Finance API unavailable"
             )
 
@@ -130,11 +126,10 @@ class TestExternalServiceFailures:
 
     def test_screener_unexpected_error(self, test_client):
         """Should return 500 for unexpected screener errors."""
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.side_effect = RuntimeError("Unexpected error")
+            mock_screener.aget_daily_hot_stock.side_effect = RuntimeError("Unexpected error")
 
             response = test_client.get("/api/stocks/trending")
 
@@ -155,12 +150,11 @@ class TestNewsServiceFailure:
 
     def test_news_service_failure_graceful(self, test_client, mock_screener_result):
         """Should return stock data even when news service fails."""
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener, \
              patch('api.stock.get_news_service') as mock_news_factory:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.return_value = mock_screener_result
+            mock_screener.aget_daily_hot_stock.return_value = mock_screener_result
             mock_news_factory.side_effect = NewsServiceError("News API unavailable")
 
             response = test_client.get("/api/stocks/trending")
@@ -173,11 +167,10 @@ class TestNewsServiceFailure:
 
     def test_stock_detail_news_failure_graceful(self, test_client, mock_yahoo_ticker):
         """Should return stock detail even when news fails."""
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_yahoo_ticker), \
              patch('api.stock.get_news_service') as mock_news_factory:
 
-            mock_cache.get.return_value = None
             mock_news_factory.side_effect = Exception("News error")
 
             response = test_client.get("/api/stocks/AAPL")
@@ -272,11 +265,9 @@ class TestGracefulDegradation:
             "AAPL": {}  # Empty summary
         }
 
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/AAPL")
 
             assert response.status_code == 200
@@ -0,0 +1,480 @@
+"""
+Screener Service Tests
+
+Tests for HotStockScreener:
+- Async API runs blocking yahooquery calls off the event loop
+- Sync wrappers for scripts
+- Momentum scores cached per (symbol, trading date)
+- Shared screener snapshot for trending and TOP N
+- Vectorized scoring engine (threshold ladders, batched momentum)
+- Declarative scoring rules (compile, weights, hot reload, /api/screener/rules)
+"""
+
+import asyncio
+import copy
+import json
+import os
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.stock import ScreenerType
+from services.cache_service import CacheManager
+from services.market_calendar import NY_TZ, trading_date
+from services.scoring import (
+    DEFAULT_RULES_PATH, RuleSpecError, RuleStore, ScoringRules, load_rule_spec,
+    momentum_scores, score_candidates, scoring_rules
+)
+from services.screener_service import HotStockScreener, ScreenerServiceError
+
+
+def ny(*args) -> datetime:
+    return datetime(*args, tzinfo=NY_TZ)
+
+
+def make_quote(symbol: str, change_percent: float = 3.0) -> dict:
+    return {
+        "symbol": symbol,
+        "shortName": f"{symbol} Inc.",
+        "regularMarketPrice": 100.0,
+        "regularMarketChange": 3.0,
+        "regularMarketChangePercent": change_percent,
+        "regularMarketVolume": 3_000_000,
+        "averageDailyVolume3Month": 1_000_000,
+        "marketCap": 10_000_000_000,
+    }
+
+
+@pytest.fixture
+def screener(monkeypatch):
+    """Screener whose yahooquery calls are slow, blocking stand-ins."""
+    instance = HotStockScreener(cache=CacheManager())
+    instance.screener_calls = []
+
+    def get_screeners(screener_ids, count=25):
+        instance.screener_calls.append((list(screener_ids), count))
+        time.sleep(0.1)
+        return {
+            screener_id: {"quotes": [make_quote(f"{screener_id[:3].upper()}{i}") for i in range(count)]}
+            for screener_id in screener_ids
+        }
+
+    monkeypatch.setattr(instance.screener, "get_screeners", get_screeners)
+    monkeypatch.setattr(
+        instance, "_calculate_momentum_scores_batch", lambda symbols: {s: 5 for s in symbols}
+    )
+    monkeypatch.setattr(instance, "_get_news", lambda symbol: None)
+    yield instance
+    instance.shutdown()
+
+
+class TestAsyncScreener:
+    """Test cases for the non-blocking screener API."""
+
+    @pytest.mark.asyncio
+    async def test_top_n_does_not_block_event_loop(self, screener):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await screener.aget_top_n_stocks(ScreenerType.DAY_GAINERS, count=3)
+        task.cancel()
+
+        assert result.count == 3
+        assert result.stocks[0].score.momentum_score == 5
+        assert ticks >= 5  # the loop kept running during the 100ms blocking call
+
+    @pytest.mark.asyncio
+    async def test_daily_hot_stock_async(self, screener):
+        result = await screener.aget_daily_hot_stock()
+
+        assert result.stock.symbol
+        assert result.score.total == 10 + 7 + 5 + 10
+
+    @pytest.mark.asyncio
+    async def test_upstream_errors_are_wrapped(self, screener, monkeypatch):
+        def broken(screener_ids, count=25):
+            raise RuntimeError("yahoo down")
+
+        monkeypatch.setattr(screener.screener, "get_screeners", broken)
+
+        with pytest.raises(ScreenerServiceError, match="yahoo down"):
+            await screener.aget_top_n_stocks(ScreenerType.MOST_ACTIVES)
+
+    def test_sync_wrappers_outside_event_loop(self, screener):
+        assert screener.get_top_n_stocks(ScreenerType.DAY_LOSERS, count=2).count == 2
+        assert screener.get_daily_hot_stock().stock.symbol
+
+    @pytest.mark.asyncio
+    async def test_sync_wrapper_inside_running_loop(self, screener):
+        """Sync callers nested in a running loop (daily_briefing.py) should still work."""
+        assert screener.get_top_n_stocks(ScreenerType.MOST_ACTIVES, count=1).count == 1
+
+
+class TestMomentumCache:
+    """Test cases for the (symbol, trading date) momentum cache."""
+
+    @pytest.mark.parametrize("moment,expected", [
+        (ny(2025, 7, 8, 15, 59), date(2025, 7, 8)),
+        (ny(2025, 7, 8, 16, 0), date(2025, 7, 9)),
+        (ny(2025, 7, 11, 18, 0), date(2025, 7, 14)),   # Friday after close -> Monday
+        (ny(2025, 7, 4, 10, 0), date(2025, 7, 7)),     # Independence Day
+        (ny(2025, 11, 28, 13, 0), date(2025, 12, 1)),  # half day closes at 13:00
+    ])
+    def test_trading_date_rolls_over_at_close(self, moment, expected):
+        assert trading_date(moment) == expected
+
+    @pytest.fixture
+    def screener(self, monkeypatch):
+        instance = HotStockScreener(cache=CacheManager())
+        instance.fetched = []
+
+        def batch(symbols):
+            instance.fetched.append(list(symbols))
+            return {s: 10 for s in symbols}
+
+        monkeypatch.setattr(instance, "_calculate_momentum_scores_batch", batch)
+        yield instance
+        instance.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_scores_are_reused_until_the_close(self, screener):
+        monday = ny(2025, 7, 7, 10, 0)
+
+        first = await screener._aget_momentum_scores(["AAPL", "MSFT"], now=monday)
+        second = await screener._aget_momentum_scores(["AAPL", "NVDA"], now=ny(2025, 7, 7, 15, 0))
+        after_close = await screener._aget_momentum_scores(["AAPL"], now=ny(2025, 7, 7, 16, 30))
+
+        assert first == {"AAPL": 10, "MSFT": 10}
+        assert second == {"AAPL": 10, "NVDA": 10}
+        assert after_close == {"AAPL": 10}
+        assert screener.fetched == [["AAPL", "MSFT"], ["NVDA"], ["AAPL"]]
+
+    def test_ttl_ends_at_the_close(self, screener):
+        assert screener._momentum_ttl(date(2025, 7, 7), ny(2025, 7, 7, 10, 0)) == 6 * 3600
+        assert screener._momentum_ttl(date(2025, 7, 7), ny(2025, 7, 7, 15, 59, 30)) == (
+            HotStockScreener.MOMENTUM_MIN_TTL
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_scores_zero_and_is_not_cached(self, screener, monkeypatch):
+        def broken(symbols):
+            raise RuntimeError("yahoo down")
+
+        monkeypatch.setattr(screener, "_calculate_momentum_scores_batch", broken)
+        assert await screener._aget_momentum_scores(["AAPL"]) == {"AAPL": 0}
+        assert screener._cache.get_stats()["families"].get("momentum", {}).get("sets", 0) == 0
+
+    @pytest.mark.asyncio
+    async def test_symbols_missing_from_partial_batch_are_not_cached(self, screener, monkeypatch):
+        def partial_history(symbols):
+            screener.fetched.append(list(symbols))
+            return {"AAPL": 10} if "AAPL" in symbols else {}  # Yahoo returned no rows for MSFT
+
+        monkeypatch.setattr(screener, "_calculate_momentum_scores_batch", partial_history)
+        saturday = ny(2025, 7, 12, 10, 0)
+
+        assert await screener._aget_momentum_scores(["AAPL", "MSFT"], now=saturday) == {"AAPL": 10, "MSFT": 0}
+        assert await screener._aget_momentum_scores(["AAPL", "MSFT"], now=saturday) == {"AAPL": 10, "MSFT": 0}
+        assert screener.fetched == [["AAPL", "MSFT"], ["MSFT"]]
+
+    def test_batch_returns_only_symbols_with_history(self, monkeypatch):
+        import services.screener_service as screener_module
+
+        class FakeTicker:
+            def __init__(self, symbols, asynchronous=False):
+                pass
+
+            def history(self, period, interval):
+                return make_history({"AAPL": list(np.linspace(100, 120, 12))})
+
+        monkeypatch.setattr(screener_module, "Ticker", FakeTicker)
+        instance = HotStockScreener(cache=CacheManager())
+
+        assert instance._calculate_momentum_scores_batch(["AAPL", "MSFT"]) == {"AAPL": 10}
+
+
+class TestScreenerSnapshot:
+    """Test cases for the single screener snapshot behind trending and TOP N."""
+
+    @pytest.mark.asyncio
+    async def test_all_variants_share_one_screener_call(self, screener):
+        for screener_type in ScreenerType:
+            for count in range(1, 11):
+                result = await screener.aget_top_n_stocks(screener_type, count=count)
+                assert result.count == count
+        await screener.aget_daily_hot_stock()
+
+        assert screener.screener_calls == [
+            ([t.value for t in HotStockScreener.SCREENER_TYPES], HotStockScreener.MAX_TOP_N)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_top_n_is_ranked_slice_of_snapshot(self, screener, monkeypatch):
+        def get_screeners(screener_ids, count=25):
+            quotes = [make_quote("FLAT", 0.5), make_quote("JUMP", 6.0), make_quote("LATE", 9.0)]
+            return {screener_id: {"quotes": quotes} for screener_id in screener_ids}
+
+        monkeypatch.setattr(screener.screener, "get_screeners", get_screeners)
+
+        top_two = await screener.aget_top_n_stocks(ScreenerType.DAY_GAINERS, count=2)
+        snapshot = await screener.aget_snapshot()
+
+        # only the first two Yahoo rows are ranked, by score
+        assert [r.stock.symbol for r in top_two.stocks] == ["JUMP", "FLAT"]
+        # symbols listed by several screeners are scored once and shared
+        assert snapshot.candidates["most_actives"][0] is snapshot.candidates["day_losers"][0]
+        assert [c["symbol"] for c in snapshot.hot_candidates(2)] == ["FLAT", "JUMP"]
+
+    @pytest.mark.asyncio
+    async def test_screener_tag_invalidation_rebuilds_snapshot(self, screener):
+        first = await screener.aget_snapshot()
+        await screener._cache.invalidate_tags(["screener:day_gainers"])
+        second = await screener.aget_snapshot()
+
+        assert len(screener.screener_calls) == 2
+        assert second.version >= first.version
+
+    @pytest.mark.asyncio
+    async def test_empty_snapshot_is_an_error(self, screener, monkeypatch):
+        monkeypatch.setattr(screener.screener, "get_screeners", lambda ids, count=25: {})
+
+        with pytest.raises(ScreenerServiceError, match="후보 종목"):
+            await screener.aget_daily_hot_stock()
+
+
+def make_history(closes_by_symbol: dict) -> pd.DataFrame:
+    """yahooquery-style batched daily history (MultiIndex: symbol, date)."""
+    frames = []
+    for symbol, closes in closes_by_symbol.items():
+        dates = pd.date_range("2025-07-01", periods=len(closes), freq="B")
+        index = pd.MultiIndex.from_product([[symbol], dates], names=["symbol", "date"])
+        frames.append(pd.DataFrame({"close": closes}, index=index))
+    return pd.concat(frames)
+
+
+class TestScoringEngine:
+    """Test cases for the columnar scoring engine."""
+
+    @pytest.mark.parametrize("volume,avg_volume,expected_score,expected_ratio", [
+        (3_000_000, 1_000_000, 10, 3.0),
+        (2_999_999, 1_000_000, 7, 3.0),
+        (2_000_000, 1_000_000, 7, 2.0),
+        (1_500_000, 1_000_000, 5, 1.5),
+        (1_499_999, 1_000_000, 0, 1.5),
+        (5_000_000, 0, 0, None),
+        (5_000_000, None, 0, None),
+    ])
+    def test_volume_ladder(self, volume, avg_volume, expected_score, expected_ratio):
+        candidate = {"symbol": "AAA", "volume": volume, "avg_volume": avg_volume}
+        score_candidates([candidate], {})
+
+        assert candidate["score"].volume_score == expected_score
+        assert candidate.get("volume_ratio") == expected_ratio
+
+    @pytest.mark.parametrize("change_percent,expected", [
+        (5.0, 10), (-5.0, 10), (4.99, 7), (-3.0, 7), (2.0, 5), (1.99, 0), (None, 0),
+    ])
+    def test_price_change_ladder(self, change_percent, expected):
+        candidate = {"symbol": "AAA", "change_percent": change_percent}
+        score_candidates([candidate], {})
+        assert candidate["score"].price_change_score == expected
+
+    @pytest.mark.parametrize("market_cap,expected", [
+        (2e9, 10), (100e9, 10), (1.5e9, 5), (150e9, 5), (200e9, 5),
+        (0.5e9, 0), (250e9, 0), (None, 0),
+    ])
+    def test_market_cap_ladder(self, market_cap, expected):
+        candidate = {"symbol": "AAA", "market_cap": market_cap}
+        score_candidates([candidate], {})
+        assert candidate["score"].market_cap_score == expected
+
+    def test_total_and_momentum_columns(self):
+        candidates = [dict(symbol=s, change_percent=3.0, volume=3, avg_volume=1, market_cap=10e9)
+                      for s in ("AAA", "BBB")]
+        score_candidates(candidates, {"AAA": 10})
+
+        assert [c["score"].total for c in candidates] == [37, 27]
+        assert [c["momentum_data"] for c in candidates] == [True, False]
+        assert all(type(c["score"].total) is int for c in candidates)
+
+    def test_many_candidates(self):
+        candidates = [make_quote(f"S{i}", change_percent=i % 7) for i in range(500)]
+        candidates = [HotStockScreener._to_candidate(q, "day_gainers") for q in candidates]
+        score_candidates(candidates, {})
+
+        assert [c["score"].price_change_score for c in candidates[:7]] == [0, 0, 5, 7, 7, 10, 10]
+
+    def test_momentum_from_batched_history(self):
+        rising = list(np.linspace(100, 120, 20))
+        dip_then_rebound = [100.0] * 10 + [130.0] + [90.0] * 5 + [95, 96, 97, 98]
+        hist = make_history({
+            "UP": rising,
+            "REB": dip_then_rebound,
+            "DOWN": rising[::-1],
+            "SHORT": rising[:9],
+            "ZERO": [0.0] * 20,
+        })
+
+        scores, with_data = momentum_scores(hist, ["UP", "REB", "DOWN", "SHORT", "ZERO", "MISSING"])
+
+        assert scores == {"UP": 10, "REB": 5, "DOWN": 0, "SHORT": 0, "ZERO": 0, "MISSING": 0}
+        assert with_data == {"UP", "REB", "DOWN", "SHORT", "ZERO"}
+
+    def test_momentum_single_symbol_plain_index(self):
+        hist = make_history({"UP": list(np.linspace(100, 120, 12))}).droplevel(0)
+        assert momentum_scores(hist, ["UP"]) == ({"UP": 10}, {"UP"})
+
+    @pytest.mark.parametrize("hist", [None, pd.DataFrame(), pd.DataFrame({"open": [1.0]})])
+    def test_momentum_without_history(self, hist):
+        assert momentum_scores(hist, ["AAA"]) == ({"AAA": 0}, set())
+
+
+@pytest.fixture
+def default_spec():
+    return load_rule_spec(DEFAULT_RULES_PATH)
+
+
+@pytest.fixture
+def rule_file(tmp_path, default_spec):
+    """Point the shared rule store at a writable copy of the default rules."""
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(default_spec), encoding="utf-8")
+    scoring_rules.configure(path=str(path), reload_interval=0.001)
+    yield path
+    scoring_rules.configure()
+
+
+def write_rules(path, spec, bump: int = 10):
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + bump))
+    time.sleep(0.002)
+
+
+class TestScoringRules:
+    """Test cases for the declarative, compiled scoring rules."""
+
+    def test_default_rules(self):
+        rules = scoring_rules.current()
+
+        assert rules.max_total == 40
+        assert [c.name for c in rules.components] == ["volume", "price_change", "momentum", "market_cap"]
+
+    def test_reasons_follow_matched_tiers(self):
+        candidate = dict(symbol="AAA", volume=3_000_000, avg_volume=1_000_000,
+                         change_percent=-6.0, market_cap=10e9)
+        score_candidates([candidate], {"AAA": 5})
+
+        assert candidate["reasons"] == [
+            "거래량 급증 (평소 대비 3.0배)",
+            "당일 6.0% 하락",
+            "5일 수익률 양수 (단기 상승)",
+            "적정 시가총액 구간 ($2B~$100B)",
+        ]
+
+    def test_missing_momentum_uses_missing_points(self):
+        candidate = dict(symbol="AAA", change_percent=0.5, market_cap=150e9)
+        score_candidates([candidate])
+
+        assert candidate["score"].momentum_score == 5
+        assert candidate["score"].market_cap_score == 5
+        assert candidate["reasons"] == []
+
+    def test_weights_scale_points(self, default_spec):
+        spec = copy.deepcopy(default_spec)
+        spec["components"]["volume"]["weight"] = 2.0
+        spec["components"]["market_cap"]["weight"] = 0.5
+        rules = ScoringRules(spec)
+
+        candidate = dict(symbol="AAA", volume=3, avg_volume=1, market_cap=10e9)
+        rules.score([candidate], {})
+
+        assert candidate["score"].volume_score == 20
+        assert candidate["score"].market_cap_score == 5
+        assert rules.max_total == 20 + 10 + 10 + 5
+        assert rules.digest != ScoringRules(default_spec).digest
+
+    @pytest.mark.parametrize("mutate,message", [
+        (lambda s: s["components"].pop("momentum"), "누락"),
+        (lambda s: s["components"]["volume"].update(input="price"), "input"),
+        (lambda s: s["components"]["volume"].update(tiers=[]), "구간이 없음"),
+        (lambda s: s["components"]["volume"]["tiers"][0].update(min=5, max=1), "min > max"),
+        (lambda s: s["components"]["volume"].update(reason="{unknown}"), "템플릿"),
+        (lambda s: s["components"]["volume"].update(weight="high"), "숫자"),
+    ])
+    def test_invalid_spec_rejected(self, default_spec, mutate, message):
+        spec = copy.deepcopy(default_spec)
+        mutate(spec)
+        with pytest.raises(RuleSpecError, match=message):
+            ScoringRules(spec)
+
+    def test_yaml_spec(self, tmp_path, default_spec):
+        yaml = pytest.importorskip("yaml")
+        path = tmp_path / "rules.yaml"
+        path.write_text(yaml.safe_dump(default_spec, allow_unicode=True), encoding="utf-8")
+
+        assert RuleStore(path).current().digest == ScoringRules(default_spec).digest
+
+    def test_hot_reload_keeps_last_good_rules(self, rule_file, default_spec):
+        original = scoring_rules.current()
+
+        spec = copy.deepcopy(default_spec)
+        spec["components"]["price_change"]["weight"] = 2.0
+        write_rules(rule_file, spec)
+        reloaded = scoring_rules.current()
+        assert reloaded.digest != original.digest
+        assert reloaded.max_total == 50
+
+        rule_file.write_text("{not json", encoding="utf-8")
+        write_rules(rule_file, {"components": {}}, bump=20)
+        assert scoring_rules.current() is reloaded
+        assert "누락" in scoring_rules.status()["last_error"]
+
+    def test_bad_custom_path_falls_back_to_defaults(self, tmp_path):
+        store = RuleStore(tmp_path / "missing.json")
+        assert store.current().source == str(DEFAULT_RULES_PATH)
+        assert "missing.json" in store.status()["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_rebuilt_when_rules_change(self, screener, rule_file, default_spec):
+        first = await screener.aget_snapshot()
+        assert first.rules_version == scoring_rules.current().digest
+        assert (await screener.aget_snapshot()) is first
+
+        spec = copy.deepcopy(default_spec)
+        spec["components"]["volume"]["weight"] = 0
+        write_rules(rule_file, spec)
+        second = await screener.aget_snapshot()
+
+        assert len(screener.screener_calls) == 2
+        assert second.rules_version == scoring_rules.current().digest
+        assert second.candidates["day_gainers"][0]["score"].volume_score == 0
+
+    def test_rules_endpoint(self, test_client, rule_file):
+        response = test_client.get("/api/screener/rules")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["digest"] == scoring_rules.current().digest
+        assert data["source"] == str(rule_file)
+        assert data["max_total"] == 40
+        assert data["components"][3]["tiers"][0] == {
+            "min": 2.0, "max": 100.0, "points": 10, "reason": "적정 시가총액 구간 ($2B~$100B)"
+        }
+        assert data["components"][0]["tiers"][0]["max"] is None
+
+    def test_rules_endpoint_forced_reload(self, test_client, rule_file, default_spec):
+        spec = copy.deepcopy(default_spec)
+        spec["version"] = "next"
+        rule_file.write_text(json.dumps(spec), encoding="utf-8")  # same mtime granularity is fine
+
+        assert test_client.get("/api/screener/rules", params={"reload": True}).json()["version"] == "next"
@@ -10,6 +10,7 @@ Tests for all stock-related API endpoints:
 - POST /api/stocks/cache/clear
 """
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
@@ -20,6 +21,10 @@ from models.stock import (
     ScreenerType, StockDetail, ScoreBreakdown, WhyHotItem,
     HotStockResponse, TopNStocksResponse, RankedStock
 )
+from services.cache_service import (
+    CacheManager, CACHE_KEY_TRENDING, CACHE_KEY_TOP_N,
+    CACHE_KEY_STOCK_DETAIL, CACHE_KEY_CHART
+)
 
 
 class TestTrendingStockAPI:
@@ -27,11 +32,10 @@ class TestTrendingStockAPI:
 
     def test_get_trending_stock_success(self, test_client, mock_screener_result):
         """Should return trending stock with valid response structure."""
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.return_value = mock_screener_result
+            mock_screener.aget_daily_hot_stock.return_value = mock_screener_result
 
             response = test_client.get("/api/stocks/trending")
 
@@ -65,8 +69,8 @@ class TestTrendingStockAPI:
             "news": []
         }
 
-        with patch('api.stock.cache') as mock_cache:
-            mock_cache.get.return_value = cached_response
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache:
+            mock_cache.set(CACHE_KEY_TRENDING, cached_response)
 
             response = test_client.get("/api/stocks/trending")
 
@@ -76,11 +80,10 @@ class TestTrendingStockAPI:
 
     def test_get_trending_stock_with_screener_type(self, test_client, mock_screener_result):
         """Should accept different screener types."""
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.return_value = mock_screener_result
+            mock_screener.aget_daily_hot_stock.return_value = mock_screener_result
 
             # Test with day_gainers
             response = test_client.get("/api/stocks/trending?type=day_gainers")
@@ -99,11 +102,10 @@ class TestTrendingStockAPI:
         """Should return 500 when screener service fails."""
         from services.screener_service import ScreenerServiceError
 
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_daily_hot_stock.side_effect = ScreenerServiceError("Service unavailable")
+            mock_screener.aget_daily_hot_stock.side_effect = ScreenerServiceError("Service unavailable")
 
             response = test_client.get("/api/stocks/trending")
 
@@ -137,11 +139,10 @@ class TestTopNStocksAPI:
             ]
         )
 
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_top_n_stocks.return_value = mock_response
+            mock_screener.aget_top_n_stocks.return_value = mock_response
 
             response = test_client.get("/api/stocks/trending/top")
 
@@ -173,11 +174,10 @@ class TestTopNStocksAPI:
             ]
         )
 
-        with patch('api.stock.cache') as mock_cache, \
-             patch('api.stock.hot_stock_screener') as mock_screener:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
+             patch('api.stock.hot_stock_screener', spec=True) as mock_screener:
 
-            mock_cache.get.return_value = None
-            mock_screener.get_top_n_stocks.return_value = mock_response
+            mock_screener.aget_top_n_stocks.return_value = mock_response
 
             response = test_client.get("/api/stocks/trending/top?count=3")
 
@@ -217,8 +217,8 @@ class TestTopNStocksAPI:
             ]
         }
 
-        with patch('api.stock.cache') as mock_cache:
-            mock_cache.get.return_value = cached_data
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache:
+            mock_cache.set(CACHE_KEY_TOP_N.format(type="most_actives", count=3), cached_data)
 
             response = test_client.get("/api/stocks/trending/top?count=3")
 
@@ -232,11 +232,9 @@ class TestStockDetailAPI:
 
     def test_get_stock_detail_success(self, test_client, mock_yahoo_ticker):
         """Should return stock detail for valid ticker."""
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/AAPL")
 
             assert response.status_code == 200
@@ -247,11 +245,9 @@ class TestStockDetailAPI:
 
     def test_get_stock_detail_lowercase_ticker(self, test_client, mock_yahoo_ticker):
         """Should normalize ticker to uppercase."""
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/aapl")
 
             assert response.status_code == 200
@@ -264,16 +260,28 @@ class TestStockDetailAPI:
         mock_ticker.price = {"INVALID": "No data found"}
         mock_ticker.summary_detail = {"INVALID": {}}
 
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/INVALID")
 
             assert response.status_code == 404
             assert "INVALID" in response.json()["detail"]
 
+    def test_get_stock_detail_not_found_is_negatively_cached(self, test_client):
+        """A second request for an unknown ticker should 404 without calling yahooquery."""
+        mock_ticker = MagicMock()
+        mock_ticker.price = {"NOPE": "No data found"}
+        mock_ticker.summary_detail = {"NOPE": {}}
+
+        with patch('yahooquery.Ticker', return_value=mock_ticker) as mock_ticker_cls:
+            first = test_client.get("/api/stocks/NOPE")
+            second = test_client.get("/api/stocks/NOPE")
+
+            assert first.status_code == second.status_code == 404
+            assert second.json()["detail"] == first.json()["detail"]
+            assert mock_ticker_cls.call_count == 1
+
     def test_get_stock_detail_cached(self, test_client):
         """Should return cached data when available."""
         cached_data = {
@@ -289,8 +297,8 @@ class TestStockDetailAPI:
             "news": []
         }
 
-        with patch('api.stock.cache') as mock_cache:
-            mock_cache.get.return_value = cached_data
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache:
+            mock_cache.set(CACHE_KEY_STOCK_DETAIL.format(ticker="CACHED"), cached_data)
 
             response = test_client.get("/api/stocks/CACHED")
 
@@ -304,11 +312,9 @@ class TestStockChartAPI:
 
     def test_get_chart_default_period(self, test_client, mock_yahoo_ticker):
         """Should return 5d chart data by default."""
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/AAPL/chart")
 
             assert response.status_code == 200
@@ -321,11 +327,9 @@ class TestStockChartAPI:
 
     def test_get_chart_custom_period(self, test_client, mock_yahoo_ticker):
         """Should accept custom period parameter."""
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
 
-            mock_cache.get.return_value = None
-
             # Test various periods
             for period in ["5d", "1mo", "3mo", "6mo", "1y"]:
                 response = test_client.get(f"/api/stocks/AAPL/chart?period={period}")
@@ -337,11 +341,9 @@ class TestStockChartAPI:
         mock_ticker = MagicMock()
         mock_ticker.price = {"INVALID": "No data found"}
 
-        with patch('api.stock.cache') as mock_cache, \
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache, \
              patch('yahooquery.Ticker', return_value=mock_ticker):
 
-            mock_cache.get.return_value = None
-
             response = test_client.get("/api/stocks/INVALID/chart")
 
             assert response.status_code == 404
@@ -357,8 +359,8 @@ class TestStockChartAPI:
             ]
         }
 
-        with patch('api.stock.cache') as mock_cache:
-            mock_cache.get.return_value = cached_data
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache:
+            mock_cache.set(CACHE_KEY_CHART.format(ticker="AAPL", period="5d"), cached_data)
 
             response = test_client.get("/api/stocks/AAPL/chart")
 
@@ -367,6 +369,128 @@ class TestStockChartAPI:
             assert len(data["data"]) == 1
 
 
+    @pytest.mark.asyncio
+    async def test_cold_chart_does_not_block_event_loop(self, async_client):
+        """Blocking yahooquery calls run off the loop so single-flight waiters can queue up."""
+        import time
+        from models.stock import ChartDataResponse
+
+        calls = []
+
+        def slow_chart(ticker, period):
+            calls.append(ticker)
+            time.sleep(0.2)
+            return ChartDataResponse(symbol=ticker, name=ticker, period=period, data=[])
+
+        ticks = 0
+
+        async def ticker_task():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch('api.stock._load_chart', side_effect=slow_chart):
+            task = asyncio.create_task(ticker_task())
+            responses = await asyncio.gather(
+                *(async_client.get("/api/stocks/AAPL/chart") for _ in range(5))
+            )
+            task.cancel()
+
+        assert [r.status_code for r in responses] == [200] * 5
+        assert calls == ["AAPL"]
+        assert ticks >= 5
+
+class TestResponseCacheHeaders:
+    """Test cases for pre-serialized responses with ETag / 304 support."""
+
+    def test_chart_response_has_etag_and_cache_control(self, test_client, mock_yahoo_ticker):
+        """Should send ETag and Cache-Control headers, identical on cache hit."""
+        with patch('yahooquery.Ticker', return_value=mock_yahoo_ticker) as ticker_cls:
+            first = test_client.get("/api/stocks/AAPL/chart")
+            second = test_client.get("/api/stocks/AAPL/chart")
+
+            assert first.status_code == 200
+            assert first.headers["etag"].startswith('"')
+            assert first.headers["cache-control"].startswith("public, max-age=")
+            assert second.headers["etag"] == first.headers["etag"]
+            assert second.content == first.content
+            assert ticker_cls.call_count == 1
+
+    def test_if_none_match_returns_304(self, test_client, mock_yahoo_ticker):
+        """Should answer a matching If-None-Match with an empty 304."""
+        with patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
+            etag = test_client.get("/api/stocks/AAPL").headers["etag"]
+
+            response = test_client.get("/api/stocks/AAPL", headers={"If-None-Match": f'"other", W/{etag}'})
+
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_body(self, test_client, mock_yahoo_ticker):
+        """Should return the full body when the client's ETag is outdated."""
+        with patch('yahooquery.Ticker', return_value=mock_yahoo_ticker):
+            response = test_client.get("/api/stocks/AAPL", headers={"If-None-Match": '"outdated"'})
+
+            assert response.status_code == 200
+            assert response.json()["stock"]["symbol"] == "AAPL"
+
+    def test_cached_response_survives_json_codec(self):
+        """Should round-trip the serialized body through the orjson codec."""
+        pytest.importorskip("orjson")
+        from services.cache_codec import get_codec
+        from services.response_cache import CachedResponse
+
+        codec = get_codec("orjson")
+        original = CachedResponse(body=b'{"a":1}', etag='"abc"', expires_at=1.0)
+
+        assert codec.decode(codec.encode(original)) == original
+
+
+class TestCacheWarmSets:
+    """Test cases for the stock warm sets run by the in-process cache warmer."""
+
+    def test_warm_sets_fill_endpoint_caches(self, test_client, isolated_stock_cache, mock_yahoo_ticker):
+        """Should pre-populate top N, detail and every chart period without HTTP self-calls."""
+        from api.stock import _warm_top_n, _warm_stocks, CHART_PERIODS
+        from services.cache_warmer import CacheWarmer
+
+        top_n = TopNStocksResponse(
+            screener_type=ScreenerType.MOST_ACTIVES,
+            count=1,
+            stocks=[RankedStock(
+                rank=1,
+                stock=StockDetail(
+                    symbol="AAPL", name="Apple Inc.", price=175.5, change=2.5,
+                    change_percent=1.45, volume=50000000, currency="USD"
+                ),
+                score=ScoreBreakdown(total=30)
+            )]
+        )
+        warmer = CacheWarmer(isolated_stock_cache)
+        warmer.register("top_n", _warm_top_n)
+        warmer.register("stocks", _warm_stocks)
+
+        with patch('api.stock.hot_stock_screener', spec=True) as mock_screener, \
+             patch('yahooquery.Ticker', return_value=mock_yahoo_ticker) as ticker_cls:
+            mock_screener.aget_top_n_stocks.return_value = top_n
+
+            asyncio.run(warmer.run_once())
+            status = warmer.status()["warm_sets"]
+            assert [s["warmed"] for s in status] == [len(ScreenerType), 1 + len(CHART_PERIODS)]
+
+            ticker_cls.reset_mock()
+            for period in CHART_PERIODS:
+                response = test_client.get(f"/api/stocks/AAPL/chart?period={period}")
+                assert response.status_code == 200
+            assert test_client.get("/api/stocks/AAPL").json()["stock"]["symbol"] == "AAPL"
+            assert test_client.get("/api/stocks/trending/top").status_code == 200
+
+            ticker_cls.assert_not_called()
+            assert mock_screener.aget_top_n_stocks.call_count == len(ScreenerType)
+
+
 class TestCompareStocksAPI:
     """Test cases for POST /api/stocks/compare endpoint."""
 
@@ -464,13 +588,69 @@ class TestCompareStocksAPI:
             data = response.json()
             assert data["count"] == 2
 
+    def test_compare_stocks_fetches_only_uncached(self, test_client):
+        """Tickers cached by an earlier compare should not be fetched again."""
+        def quote(name, price):
+            return {
+                "shortName": name,
+                "regularMarketPrice": price,
+                "regularMarketChange": 1.0,
+                "regularMarketChangePercent": 0.01,
+                "regularMarketVolume": 1000000,
+                "marketCap": 1000000000
+            }
+
+        first = MagicMock()
+        first.price = {"AAPL": quote("Apple", 175.0), "GOOGL": quote("Alphabet", 140.0)}
+        first.summary_detail = {"AAPL": {}, "GOOGL": {}}
+        second = MagicMock()
+        second.price = {"MSFT": quote("Microsoft", 400.0)}
+        second.summary_detail = {"MSFT": {}}
+
+        with patch('yahooquery.Ticker', side_effect=[first, second]) as mock_ticker_cls:
+            test_client.post("/api/stocks/compare", json={"tickers": ["AAPL", "GOOGL"]})
+            response = test_client.post(
+                "/api/stocks/compare",
+                json={"tickers": ["AAPL", "GOOGL", "MSFT"]}
+            )
+
+            assert response.status_code == 200
+            assert response.json()["count"] == 3
+            assert mock_ticker_cls.call_args_list[1].args == (["MSFT"],)
+
+
+    def test_compare_stocks_caches_unknown_tickers(self, test_client):
+        """Unknown tickers should be remembered and not fetched again."""
+        quote = {
+            "shortName": "Apple",
+            "regularMarketPrice": 175.0,
+            "regularMarketChange": 1.0,
+            "regularMarketChangePercent": 0.01,
+            "regularMarketVolume": 1000000,
+            "marketCap": 1000000000
+        }
+        first = MagicMock()
+        first.price = {"AAPL": quote, "MSFT": dict(quote, shortName="Microsoft"), "NOPE": "No data found"}
+        first.summary_detail = {"AAPL": {}, "MSFT": {}, "NOPE": {}}
+
+        with patch('yahooquery.Ticker', side_effect=[first]) as mock_ticker_cls:
+            test_client.post("/api/stocks/compare", json={"tickers": ["AAPL", "MSFT", "NOPE"]})
+            response = test_client.post(
+                "/api/stocks/compare",
+                json={"tickers": ["AAPL", "MSFT", "NOPE"]}
+            )
+
+            assert response.status_code == 200
+            assert response.json()["count"] == 2
+            assert mock_ticker_cls.call_count == 1
+
 
 class TestCacheClearAPI:
     """Test cases for POST /api/stocks/cache/clear endpoint."""
 
     def test_clear_cache_success(self, test_client):
         """Should clear cache successfully."""
-        with patch('api.stock.cache') as mock_cache:
+        with patch('api.stock.cache', new_callable=CacheManager) as mock_cache:
             mock_cache.clear = MagicMock()
 
             response = test_client.post("/api/stocks/cache/clear")